@@ -1,13 +1,33 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-import joblib
+import io
+import os
+import tempfile
 import warnings
 
+from appredictor.batch import summarize_frame
+from appredictor.cache import PredictionCache
+from appredictor.charts import grade_pie, score_histogram
+from appredictor.core import Predictor, profile_stamp
+from appredictor.dispatch import BatchingDispatcher
+from appredictor.export import FORMATS
+from appredictor.ingest import UPLOAD_TYPES, read_columns
+from appredictor.profiling import label_rerun, profiling_requested, run_profiled
+from appredictor.theme import apply_theme
+from appredictor.viewer import render_result_viewer
+
+# pandas, plotly and the batch module are imported inside the pages that
+# use them, so a session that only opens a light page does not load them.
+
 warnings.filterwarnings('ignore')
 
+# Opt-in profiling (APPREDICTOR_PROFILE=1, or APPREDICTOR_PROFILE=query and
+# ?profile=1): run this script again under cProfile, then stop the
+# unprofiled outer run here.
+if profiling_requested():
+    run_profiled(__file__)
+    st.stop()
+
 # =========================================
 # PAGE CONFIG
 # =========================================
@@ -21,122 +41,128 @@ st.set_page_config(
 # =========================================
 # CUSTOM CSS
 # =========================================
-st.markdown("""
-<style>
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    .stApp {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    .prediction-box {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        padding: 35px;
-        border-radius: 20px;
-        text-align: center;
-        color: white;
-        font-size: 32px;
-        font-weight: bold;
-        box-shadow: 0 8px 16px rgba(0,0,0,0.3);
-        animation: pulse 2s infinite;
-    }
-    @keyframes pulse {
-        0%, 100% { transform: scale(1); }
-        50% { transform: scale(1.02); }
-    }
-    h1 {
-        color: white;
-        text-align: center;
-        font-size: 3.5em;
-        text-shadow: 3px 3px 6px rgba(0,0,0,0.3);
-    }
-    .subtitle {
-        text-align: center;
-        color: white;
-        font-size: 1.4em;
-        margin-top: 10px;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-    }
-    .stButton>button {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        border: none;
-        padding: 18px 40px;
-        border-radius: 12px;
-        font-size: 20px;
-        font-weight: bold;
-        box-shadow: 0 4px 12px rgba(245, 87, 108, 0.4);
-        width: 100%;
-        transition: all 0.3s ease;
-    }
-    .stButton>button:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 8px 20px rgba(245, 87, 108, 0.6);
-    }
-    .input-section {
-        background: rgba(255, 255, 255, 0.95);
-        padding: 30px;
-        border-radius: 20px;
-        box-shadow: 0 6px 15px rgba(0,0,0,0.15);
-        margin: 20px 0;
-    }
-    .success-box {
-        background: rgba(0, 200, 81, 0.2);
-        border-left: 5px solid #00C851;
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-        margin: 15px 0;
-    }
-    .info-box {
-        background: rgba(33, 150, 243, 0.2);
-        border-left: 5px solid #2196F3;
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-        margin: 15px 0;
-    }
-    .metric-card {
-        background: white;
-        padding: 20px;
-        border-radius: 15px;
-        box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-        margin: 10px 0;
-        text-align: center;
-    }
-    .viz-card {
-        background: rgba(255, 255, 255, 0.95);
-        padding: 25px;
-        border-radius: 15px;
-        box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-        margin: 15px 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+# static/app.css, linked or inlined by appredictor.theme
+apply_theme("app.css")
 
 # =========================================
 # LOAD MODEL
 # =========================================
-@st.cache_resource
-def load_model():
+PROFILE = "app"
+
+# Display of each category of predictor.grading (appredictor.grading.APP_CATEGORIES),
+# the same bands the batch page uses: icon, color, emoji, message
+CATEGORY_STYLES = {
+    "Excellent (A)": ("🌟", "#00C851", "🎉", "Luar biasa! Performa sangat memuaskan!"),
+    "Very Good (B+)": ("👍", "#33b5e5", "😊", "Sangat bagus! Pertahankan prestasi ini!"),
+    "Good (B)": ("✅", "#ffbb33", "👏", "Bagus! Terus tingkatkan!"),
+    "Average (C)": ("⚠️", "#ff8800", "💪", "Cukup baik, masih bisa lebih baik lagi!"),
+    "Needs Improvement (D)": ("❌", "#ff4444", "📚", "Perlu usaha lebih keras!"),
+}
+
+@st.cache_resource(max_entries=1)
+def load_model(stamp=None):
     """Load the trained model"""
     try:
-        data = joblib.load("academic_predictor_model_pt5.pkl")
-        
-        if isinstance(data, dict):
-            return (
-                data.get('model'),
-                data.get('scaler'),
-                data.get('feature_names'),
-                data.get('metrics', {}),
-                data.get('feature_labels', {})
-            )
-        return None, None, None, {}, {}
+        # academic_predictor_model_pt5.pkl (or its .apx export), clipped to
+        # 0-100 and graded into the five performance categories
+        return Predictor.from_profile(PROFILE)
     except Exception as e:
         st.error(f"Error loading model: {str(e)}")
-        return None, None, None, {}, {}
+        return None
+
+@st.cache_resource
+def prediction_cache():
+    """Prediction cache shared by all sessions of this server process"""
+    return PredictionCache()
+
+@st.cache_resource
+def prediction_dispatcher():
+    """Scores the single predictions of concurrent sessions in one batch"""
+    return BatchingDispatcher()
+
+@st.cache_resource(max_entries=1)
+def model_report(stamp, _predictor):
+    """Figure, tables and formula of the model page, built once per model file"""
+    import pandas as pd
+    import plotly.graph_objects as go
+    
+    model = _predictor.model
+    feature_names = _predictor.feature_names
+    feature_labels = _predictor.feature_labels
+    report = {}
+    
+    if hasattr(model, 'coef_'):
+        coef_df = pd.DataFrame({
+            'Feature': [feature_labels.get(f, f) for f in feature_names],
+            'Coefficient': model.coef_,
+            'Abs_Coefficient': np.abs(model.coef_)
+        }).sort_values('Abs_Coefficient', ascending=False)
+        
+        fig_importance = go.Figure()
+        
+        colors = ['#00C851' if c > 0 else '#ff4444' for c in coef_df['Coefficient']]
+        
+        fig_importance.add_trace(go.Bar(
+            x=coef_df['Coefficient'],
+            y=coef_df['Feature'],
+            orientation='h',
+            marker=dict(color=colors),
+            text=coef_df['Coefficient'].round(2),
+            textposition='outside'
+        ))
+        
+        fig_importance.update_layout(
+            title="Model Coefficients (Feature Importance)",
+            xaxis_title="Coefficient Value",
+            yaxis_title="Features",
+            height=400,
+            template='plotly_white',
+            showlegend=False
+        )
+        
+        formula = f"**Final Score = {model.intercept_:.2f}**"
+        for feat, coef in zip(feature_names, model.coef_):
+            label = feature_labels.get(feat, feat)
+            sign = '+' if coef >= 0 else ''
+            formula += f" {sign} {coef:.2f} × {label}"
+        
+        report.update(
+            top_feature=coef_df.iloc[0]['Feature'],
+            top_coefficient=coef_df.iloc[0]['Coefficient'],
+            importance=fig_importance,
+            formula=formula,
+        )
+    
+    ranges_data = []
+    for feat in feature_names:
+        label = feature_labels.get(feat, feat)
+        if 'Kehadiran' in feat:
+            ranges_data.append({'Feature': label, 'Min': 0, 'Max': 100, 'Unit': '%'})
+        elif 'Internal' in feat:
+            ranges_data.append({'Feature': label, 'Min': 0, 'Max': 40, 'Unit': 'poin'})
+        elif 'Tugas' in feat:
+            ranges_data.append({'Feature': label, 'Min': 0, 'Max': 100, 'Unit': 'poin'})
+        elif 'Jam' in feat:
+            ranges_data.append({'Feature': label, 'Min': 0, 'Max': 12, 'Unit': 'jam'})
+    report['ranges'] = pd.DataFrame(ranges_data)
+    return report
 
-model, scaler, feature_names, metrics, feature_labels = load_model()
+# The file stamp is part of the cache key, so a replaced model file is picked up
+model_stamp = profile_stamp(PROFILE)
+predictor = load_model(model_stamp)
+if predictor is not None:
+    model = predictor.model
+    feature_names = predictor.feature_names
+    metrics = predictor.metrics
+    feature_labels = predictor.feature_labels
+else:
+    model, feature_names, metrics, feature_labels = None, None, {}, {}
+cache = prediction_cache()
+dispatcher = prediction_dispatcher()
+
+# Batas ukuran file (MB) sebelum mode streaming aktif otomatis
+STREAMING_THRESHOLD_MB = 20
+STREAMING_CHUNKSIZE = 50_000
 
 # =========================================
 # SESSION STATE
@@ -163,6 +189,7 @@ with st.sidebar:
         ["📈 Visualisasi Model", "🔮 Prediksi Satuan", "📂 Prediksi Batch (CSV)"],
         label_visibility="collapsed"
     )
+    label_rerun(page)
     
     st.markdown("---")
     st.title("ℹ️ Model Info")
@@ -260,41 +287,16 @@ if page == "📈 Visualisasi Model":
     st.markdown("### 🔍 Feature Importance")
     st.markdown("<div class='viz-card'>", unsafe_allow_html=True)
     
-    if model and hasattr(model, 'coef_'):
-        coef_df = pd.DataFrame({
-            'Feature': [feature_labels.get(f, f) for f in feature_names],
-            'Coefficient': model.coef_,
-            'Abs_Coefficient': np.abs(model.coef_)
-        }).sort_values('Abs_Coefficient', ascending=False)
-        
-        fig_importance = go.Figure()
-        
-        colors = ['#00C851' if c > 0 else '#ff4444' for c in coef_df['Coefficient']]
-        
-        fig_importance.add_trace(go.Bar(
-            x=coef_df['Coefficient'],
-            y=coef_df['Feature'],
-            orientation='h',
-            marker=dict(color=colors),
-            text=coef_df['Coefficient'].round(2),
-            textposition='outside'
-        ))
-        
-        fig_importance.update_layout(
-            title="Model Coefficients (Feature Importance)",
-            xaxis_title="Coefficient Value",
-            yaxis_title="Features",
-            height=400,
-            template='plotly_white',
-            showlegend=False
-        )
-        
-        st.plotly_chart(fig_importance, use_container_width=True)
+    # Built once per model file, not on every visit of this page
+    report = model_report(model_stamp, predictor) if predictor is not None else {}
+    
+    if 'importance' in report:
+        st.plotly_chart(report['importance'], use_container_width=True)
         
         # Interpretation
         st.markdown("#### 📊 Interpretasi:")
         st.markdown(f"""
-        - **Fitur Paling Berpengaruh**: {coef_df.iloc[0]['Feature']} (Koefisien: {coef_df.iloc[0]['Coefficient']:.2f})
+        - **Fitur Paling Berpengaruh**: {report['top_feature']} (Koefisien: {report['top_coefficient']:.2f})
         - **Pengaruh Positif**: Hijau menunjukkan fitur yang meningkatkan final score
         - **Pengaruh Negatif**: Merah menunjukkan fitur yang menurunkan final score
         """)
@@ -305,14 +307,8 @@ if page == "📈 Visualisasi Model":
     st.markdown("### 📐 Model Formula")
     st.markdown("<div class='viz-card'>", unsafe_allow_html=True)
     
-    if model and hasattr(model, 'coef_'):
-        formula = f"**Final Score = {model.intercept_:.2f}**"
-        for feat, coef in zip(feature_names, model.coef_):
-            label = feature_labels.get(feat, feat)
-            sign = '+' if coef >= 0 else ''
-            formula += f" {sign} {coef:.2f} × {label}"
-        
-        st.markdown(formula)
+    if 'formula' in report:
+        st.markdown(report['formula'])
     
     st.markdown("</div>", unsafe_allow_html=True)
     
@@ -325,20 +321,7 @@ if page == "📈 Visualisasi Model":
         st.markdown("<div class='viz-card'>", unsafe_allow_html=True)
         st.markdown("#### Expected Input Ranges")
         
-        ranges_data = []
-        for feat in feature_names:
-            label = feature_labels.get(feat, feat)
-            if 'Kehadiran' in feat:
-                ranges_data.append({'Feature': label, 'Min': 0, 'Max': 100, 'Unit': '%'})
-            elif 'Internal' in feat:
-                ranges_data.append({'Feature': label, 'Min': 0, 'Max': 40, 'Unit': 'poin'})
-            elif 'Tugas' in feat:
-                ranges_data.append({'Feature': label, 'Min': 0, 'Max': 100, 'Unit': 'poin'})
-            elif 'Jam' in feat:
-                ranges_data.append({'Feature': label, 'Min': 0, 'Max': 12, 'Unit': 'jam'})
-        
-        ranges_df = pd.DataFrame(ranges_data)
-        st.dataframe(ranges_df, use_container_width=True, hide_index=True)
+        st.dataframe(report['ranges'], use_container_width=True, hide_index=True)
         
         st.markdown("</div>", unsafe_allow_html=True)
     
@@ -460,17 +443,15 @@ elif page == "🔮 Prediksi Satuan":
     
     # Prediction
     if predict_button:
+        import pandas as pd
+        import plotly.graph_objects as go
+        
         try:
-            input_values = [inputs[feat] for feat in feature_names]
-            input_df = pd.DataFrame([input_values], columns=feature_names)
-            
-            if scaler is not None:
-                input_scaled = scaler.transform(input_df)
-            else:
-                input_scaled = input_df.values
-            
-            prediction = model.predict(input_scaled)[0]
-            prediction = np.clip(prediction, 0, 100)
+            input_values = predictor.feature_vector(inputs)
+            prediction = cache.get_or_compute(
+                predictor.version, predictor.cache_key(inputs),
+                lambda: float(dispatcher.submit(predictor.predict_records, inputs))
+            )
             
             st.markdown("<br>", unsafe_allow_html=True)
             st.markdown("### 🎊 Hasil Prediksi")
@@ -480,33 +461,18 @@ elif page == "🔮 Prediksi Satuan":
                 Final Score: {prediction:.2f}
             </div>
             """, unsafe_allow_html=True)
-            
+
+            stats = cache.stats()
+            batching = dispatcher.metrics()
+            st.caption(f"⚡ Cache prediksi: {stats['hits']} hit • {stats['misses']} miss • "
+                       f"{stats['size']}/{stats['maxsize']} entri • "
+                       f"{batching['batches']} batch model, rata-rata "
+                       f"{batching['mean_batch_size']:.1f} baris")
+
             # Performance category
-            if prediction >= 90:
-                category = "🌟 Excellent (A)"
-                color = "#00C851"
-                emoji = "🎉"
-                message = "Luar biasa! Performa sangat memuaskan!"
-            elif prediction >= 80:
-                category = "👍 Very Good (B+)"
-                color = "#33b5e5"
-                emoji = "😊"
-                message = "Sangat bagus! Pertahankan prestasi ini!"
-            elif prediction >= 70:
-                category = "✅ Good (B)"
-                color = "#ffbb33"
-                emoji = "👏"
-                message = "Bagus! Terus tingkatkan!"
-            elif prediction >= 60:
-                category = "⚠️ Average (C)"
-                color = "#ff8800"
-                emoji = "💪"
-                message = "Cukup baik, masih bisa lebih baik lagi!"
-            else:
-                category = "❌ Needs Improvement (D)"
-                color = "#ff4444"
-                emoji = "📚"
-                message = "Perlu usaha lebih keras!"
+            label = predictor.grading.label(prediction)
+            icon, color, emoji, message = CATEGORY_STYLES[label]
+            category = f"{icon} {label}"
             
             st.markdown(f"""
             <div style="background: {color}; padding: 30px; border-radius: 20px; 
@@ -620,6 +586,9 @@ elif page == "🔮 Prediksi Satuan":
 # PAGE 3: PREDIKSI BATCH (CSV)
 # =========================================
 elif page == "📂 Prediksi Batch (CSV)":
+    import pandas as pd
+    import plotly.express as px
+    
     st.markdown("## 📂 Prediksi Batch dari File CSV")
     
     st.markdown("""
@@ -667,13 +636,128 @@ elif page == "📂 Prediksi Batch (CSV)":
     st.markdown("</div>", unsafe_allow_html=True)
     
     # File upload
-    st.markdown("### 📤 Upload File CSV")
-    uploaded_file = st.file_uploader("Choose a CSV file", type=['csv'])
+    st.markdown("### 📤 Upload File Data")
+    uploaded_file = st.file_uploader("Choose a CSV, Parquet or Feather file", type=UPLOAD_TYPES)
     
+    # File besar diproses per potongan supaya pemakaian memori tetap konstan
+    streaming_mode = False
     if uploaded_file is not None:
         try:
-            # Read CSV
-            input_data = pd.read_csv(uploaded_file)
+            file_columns = read_columns(uploaded_file)
+        except Exception as e:
+            st.error(f"❌ Error membaca file: {str(e)}")
+            st.info("💡 Pastikan file Anda valid dan sesuai format")
+            uploaded_file = None
+    
+    if uploaded_file is not None:
+        streaming_mode = st.toggle(
+            "⚡ Mode Streaming (untuk file besar)",
+            value=uploaded_file.size > STREAMING_THRESHOLD_MB * 1024 * 1024,
+            help="Baca, prediksi, dan tulis hasil per potongan data tanpa memuat seluruh file ke memori"
+        )
+        # Parquet/Arrow: skor float32 dan kategori sebagai kolom kategorikal
+        output_format = st.selectbox(
+            "📦 Format file hasil",
+            list(FORMATS),
+            format_func=lambda f: FORMATS[f]["label"],
+            help="Parquet dan Arrow IPC (Feather) lebih kecil dan lebih cepat dibaca oleh tools analitik"
+        )
+        output_info = FORMATS[output_format]
+        # Hanya kolom model dan kolom tambahan yang dipilih yang dibaca dari file
+        passthrough = st.multiselect(
+            "🪪 Kolom tambahan yang ikut disertakan (mis. ID atau nama siswa)",
+            [c for c in file_columns if c not in predictor.required_columns],
+            help="Kolom lain tidak dibaca sama sekali, sehingga file yang lebar lebih cepat diproses"
+        )
+    
+    if uploaded_file is not None and streaming_mode:
+        try:
+            preview_data = predictor.read_input(uploaded_file, passthrough=passthrough, nrows=5)
+            
+            st.success(f"✅ File berhasil diupload! Ukuran: {uploaded_file.size / (1024 * 1024):.1f} MB")
+            st.markdown("#### 👀 Preview Data (5 baris pertama)")
+            st.dataframe(preview_data, use_container_width=True)
+            
+            missing_cols = predictor.missing_features(file_columns)
+            
+            if missing_cols:
+                st.error(f"❌ Kolom berikut tidak ditemukan dalam CSV: {', '.join(missing_cols)}")
+                st.info("💡 Pastikan nama kolom sama persis dengan yang tertera di atas")
+            else:
+                st.success("✅ Semua kolom yang dibutuhkan tersedia!")
+                
+                if st.button("🎯 PREDIKSI SEMUA DATA", use_container_width=True):
+                    try:
+                        # Hapus hasil streaming sebelumnya dari sesi ini
+                        old_output = st.session_state.pop('stream_output_path', None)
+                        if old_output and os.path.exists(old_output):
+                            os.remove(old_output)
+                        
+                        with tempfile.NamedTemporaryFile(suffix=output_info["suffix"], delete=False) as tmp:
+                            output_path = tmp.name
+                        st.session_state.stream_output_path = output_path
+                        
+                        with st.spinner("⏳ Sedang memproses prediksi per potongan data..."):
+                            summary = predictor.stream_score_file(
+                                uploaded_file,
+                                output_path,
+                                chunksize=STREAMING_CHUNKSIZE,
+                                output_format=output_format,
+                                columns=predictor.projection(file_columns, passthrough)
+                            )
+                        
+                        st.success(
+                            f"✅ Prediksi berhasil! Total {summary.rows:,} data telah diprediksi "
+                            f"({summary.elapsed:.1f} detik)"
+                        )
+                        
+                        st.markdown("### 📈 Statistik Hasil Prediksi")
+                        col1, col2, col3, col4 = st.columns(4)
+                        with col1:
+                            st.metric("Rata-rata Score", f"{summary.mean:.2f}")
+                        with col2:
+                            st.metric("Score Tertinggi", f"{summary.score_max:.2f}")
+                        with col3:
+                            st.metric("Score Terendah", f"{summary.score_min:.2f}")
+                        with col4:
+                            st.metric("Excellent (≥90)", f"{summary.grade_counts.get('Excellent (A)', 0)}")
+                        
+                        st.markdown("### 📊 Distribusi Kategori")
+                        fig_pie = grade_pie(
+                            summary,
+                            predictor.grading.labels[::-1],
+                            'Distribusi Kategori Performa',
+                            color_discrete_sequence=px.colors.qualitative.Set3
+                        )
+                        fig_pie.update_layout(height=400)
+                        st.plotly_chart(fig_pie, use_container_width=True)
+                        
+                        st.markdown("### 📊 Preview Hasil Prediksi")
+                        st.dataframe(summary.preview, use_container_width=True)
+                        
+                        st.markdown("### 💾 Download Hasil")
+                        with open(output_path, "rb") as result_file:
+                            st.download_button(
+                                label=f"📥 Download Hasil Prediksi ({output_info['label']})",
+                                data=result_file,
+                                file_name=f"hasil_prediksi{output_info['suffix']}",
+                                mime=output_info["mime"],
+                                use_container_width=True
+                            )
+                    
+                    except Exception as e:
+                        st.error(f"❌ Error saat melakukan prediksi: {str(e)}")
+                        import traceback
+                        st.code(traceback.format_exc())
+        
+        except Exception as e:
+            st.error(f"❌ Error membaca file: {str(e)}")
+            st.info("💡 Pastikan file CSV Anda valid dan sesuai format")
+    
+    elif uploaded_file is not None:
+        try:
+            # Read the features (float64) and the chosen extra columns
+            input_data = predictor.read_input(uploaded_file, passthrough=passthrough)
             
             st.success(f"✅ File berhasil diupload! Total data: {len(input_data)} rows")
             
@@ -682,7 +766,7 @@ elif page == "📂 Prediksi Batch (CSV)":
             st.dataframe(input_data.head(), use_container_width=True)
             
             # Check for required columns
-            missing_cols = [col for col in feature_names if col not in input_data.columns]
+            missing_cols = predictor.missing_features(file_columns)
             
             if missing_cols:
                 st.error(f"❌ Kolom berikut tidak ditemukan dalam CSV: {', '.join(missing_cols)}")
@@ -694,63 +778,39 @@ elif page == "📂 Prediksi Batch (CSV)":
                 if st.button("🎯 PREDIKSI SEMUA DATA", use_container_width=True):
                     with st.spinner("⏳ Sedang memproses prediksi..."):
                         try:
-                            # Extract features
-                            X_input = input_data[feature_names]
-                            
-                            # Scale
-                            if scaler is not None:
-                                X_scaled = scaler.transform(X_input)
-                            else:
-                                X_scaled = X_input.values
-                            
-                            # Predict
-                            predictions = model.predict(X_scaled)
-                            predictions = np.clip(predictions, 0, 100)
-                            
-                            # Add predictions to dataframe
+                            # Scale + predict + clip, adds Predicted_Final_Score
+                            # and Category (missing values: column medians)
                             result_df = input_data.copy()
-                            result_df['Predicted_Final_Score'] = predictions
-                            
-                            # Add category
-                            def get_category(score):
-                                if score >= 90:
-                                    return "Excellent (A)"
-                                elif score >= 80:
-                                    return "Very Good (B+)"
-                                elif score >= 70:
-                                    return "Good (B)"
-                                elif score >= 60:
-                                    return "Average (C)"
-                                else:
-                                    return "Needs Improvement (D)"
-                            
-                            result_df['Category'] = result_df['Predicted_Final_Score'].apply(get_category)
+                            predictor.score_frame(result_df)
                             
                             st.success(f"✅ Prediksi berhasil! Total {len(result_df)} data telah diprediksi")
                             
                             # Display results
                             st.markdown("### 📊 Hasil Prediksi")
-                            st.dataframe(result_df, use_container_width=True, height=400)
+                            render_result_viewer(result_df, "app_result", predictor.score_column,
+                                                 predictor.grade_column,
+                                                 labels={"grade": "🏷️ Filter kategori"})
                             
                             # Statistics
                             st.markdown("### 📈 Statistik Hasil Prediksi")
                             
+                            # Statistics and charts from fixed-size aggregates,
+                            # not from every row of the result
+                            summary = summarize_frame(result_df, predictor.score_column,
+                                                      predictor.grade_column)
                             col1, col2, col3, col4 = st.columns(4)
                             
                             with col1:
-                                avg_score = result_df['Predicted_Final_Score'].mean()
-                                st.metric("Rata-rata Score", f"{avg_score:.2f}")
+                                st.metric("Rata-rata Score", f"{summary.mean:.2f}")
                             
                             with col2:
-                                max_score = result_df['Predicted_Final_Score'].max()
-                                st.metric("Score Tertinggi", f"{max_score:.2f}")
+                                st.metric("Score Tertinggi", f"{summary.score_max:.2f}")
                             
                             with col3:
-                                min_score = result_df['Predicted_Final_Score'].min()
-                                st.metric("Score Terendah", f"{min_score:.2f}")
+                                st.metric("Score Terendah", f"{summary.score_min:.2f}")
                             
                             with col4:
-                                excellent_count = len(result_df[result_df['Predicted_Final_Score'] >= 90])
+                                excellent_count = summary.grade_counts.get('Excellent (A)', 0)
                                 st.metric("Excellent (≥90)", f"{excellent_count}")
                             
                             # Distribution chart
@@ -760,13 +820,11 @@ elif page == "📂 Prediksi Batch (CSV)":
                             
                             with col_chart1:
                                 # Histogram
-                                fig_hist = px.histogram(
-                                    result_df,
-                                    x='Predicted_Final_Score',
-                                    nbins=20,
-                                    title='Distribusi Nilai Final Score',
-                                    labels={'Predicted_Final_Score': 'Final Score'},
-                                    color_discrete_sequence=['#667eea']
+                                fig_hist = score_histogram(
+                                    summary,
+                                    'Distribusi Nilai Final Score',
+                                    x_title='Final Score',
+                                    y_title='count'
                                 )
                                 fig_hist.update_layout(
                                     showlegend=False,
@@ -777,12 +835,10 @@ elif page == "📂 Prediksi Batch (CSV)":
                             
                             with col_chart2:
                                 # Category pie chart
-                                category_counts = result_df['Category'].value_counts()
-                                
-                                fig_pie = px.pie(
-                                    values=category_counts.values,
-                                    names=category_counts.index,
-                                    title='Distribusi Kategori Performa',
+                                fig_pie = grade_pie(
+                                    summary,
+                                    predictor.grading.labels[::-1],
+                                    'Distribusi Kategori Performa',
                                     color_discrete_sequence=px.colors.qualitative.Set3
                                 )
                                 fig_pie.update_layout(height=400)
@@ -791,16 +847,17 @@ elif page == "📂 Prediksi Batch (CSV)":
                             # Download results
                             st.markdown("### 💾 Download Hasil")
                             
-                            csv = result_df.to_csv(index=False)
+                            result_buffer = io.BytesIO()
+                            predictor.write_result(result_df, result_buffer, output_format)
                             
                             col_dl1, col_dl2, col_dl3 = st.columns([1, 1, 1])
                             
                             with col_dl2:
                                 st.download_button(
-                                    label="📥 Download Hasil Prediksi (CSV)",
-                                    data=csv,
-                                    file_name="hasil_prediksi.csv",
-                                    mime="text/csv",
+                                    label=f"📥 Download Hasil Prediksi ({output_info['label']})",
+                                    data=result_buffer.getvalue(),
+                                    file_name=f"hasil_prediksi{output_info['suffix']}",
+                                    mime=output_info["mime"],
                                     use_container_width=True
                                 )
                             
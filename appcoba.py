@@ -1,11 +1,16 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-import joblib
+import os
 import warnings
 
+from appredictor.cache import PredictionCache
+from appredictor.charts import grade_pie, score_histogram
+from appredictor.core import Predictor, profile_stamp
+from appredictor.export import FORMATS
+from appredictor.grading import DEFAULT_PASS_THRESHOLD, pass_fail_status
+from appredictor.ingest import UPLOAD_TYPES, read_columns
+from appredictor.results import ResultStore, content_hash
+from appredictor.theme import apply_theme
+
 warnings.filterwarnings('ignore')
 
 # =========================================
@@ -21,128 +26,33 @@ st.set_page_config(
 # =========================================
 # CUSTOM CSS
 # =========================================
-st.markdown("""
-<style>
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    .stApp {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    .prediction-box {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        padding: 35px;
-        border-radius: 20px;
-        text-align: center;
-        color: white;
-        font-size: 32px;
-        font-weight: bold;
-        box-shadow: 0 8px 16px rgba(0,0,0,0.3);
-        animation: pulse 2s infinite;
-    }
-    @keyframes pulse {
-        0%, 100% { transform: scale(1); }
-        50% { transform: scale(1.02); }
-    }
-    h1 {
-        color: white;
-        text-align: center;
-        font-size: 3.5em;
-        text-shadow: 3px 3px 6px rgba(0,0,0,0.3);
-    }
-    .subtitle {
-        text-align: center;
-        color: white;
-        font-size: 1.4em;
-        margin-top: 10px;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.2);
-    }
-    .stButton>button {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        border: none;
-        padding: 18px 40px;
-        border-radius: 12px;
-        font-size: 20px;
-        font-weight: bold;
-        box-shadow: 0 4px 12px rgba(245, 87, 108, 0.4);
-        width: 100%;
-        transition: all 0.3s ease;
-    }
-    .stButton>button:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 8px 20px rgba(245, 87, 108, 0.6);
-    }
-    .input-section {
-        background: rgba(255, 255, 255, 0.95);
-        padding: 30px;
-        border-radius: 20px;
-        box-shadow: 0 6px 15px rgba(0,0,0,0.15);
-        margin: 20px 0;
-    }
-    .success-box {
-        background: rgba(0, 200, 81, 0.2);
-        border-left: 5px solid #00C851;
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-        margin: 15px 0;
-    }
-    .info-box {
-        background: rgba(33, 150, 243, 0.2);
-        border-left: 5px solid #2196F3;
-        padding: 20px;
-        border-radius: 10px;
-        color: white;
-        margin: 15px 0;
-    }
-    .metric-card {
-        background: white;
-        padding: 20px;
-        border-radius: 15px;
-        box-shadow: 0 4px 10px rgba(0,0,0,0.1);
-        margin: 10px 0;
-        text-align: center;
-    }
-    .probability-bar {
-        background: linear-gradient(90deg, #ff4444 0%, #ffbb33 50%, #00C851 100%);
-        height: 30px;
-        border-radius: 15px;
-        position: relative;
-        margin: 20px 0;
-    }
-    .probability-indicator {
-        position: absolute;
-        top: -5px;
-        width: 4px;
-        height: 40px;
-        background: white;
-        box-shadow: 0 0 10px rgba(255,255,255,0.8);
-    }
-</style>
-""", unsafe_allow_html=True)
+# static/appcoba.css, linked or inlined by appredictor.theme
+apply_theme("appcoba.css")
 
 # =========================================
 # LOAD MODEL AND SCALER
 # =========================================
-@st.cache_resource
-def load_model_and_scaler():
+# model_kelulusan.pkl + scaler_kelulusan.pkl, see the "kelulusan" profile
+PROFILE = "kelulusan"
+
+MODE_SINGLE = "👤 Prediksi Individu"
+MODE_BATCH = "📂 Prediksi Batch (CSV)"
+
+# Warna pita risiko tidak lulus, dari risiko terendah
+RISK_COLORS = {
+    "Rendah": "#00C851",
+    "Sedang": "#ffbb33",
+    "Tinggi": "#ff8800",
+    "Sangat Tinggi": "#dd0404",
+}
+
+@st.cache_resource(max_entries=1)
+def load_model_and_scaler(stamp=None):
     """Load the trained model and scaler from separate files"""
     try:
-        # Load model
-        model = joblib.load("model_kelulusan.pkl")
-        
-        # Load scaler
-        scaler = joblib.load("scaler_kelulusan.pkl")
-        
-        # Define feature names (MUST match the training data exactly)
-        feature_names = [
-            'Attendance (%)',
-            'Internal Test 1 (out of 40)',
-            'Internal Test 2 (out of 40)',
-            'Assignment Score (out of 10)',
-            'Final Exam Marks (out of 100)'
-        ]
+        # Feature names come from the profile (in the order of the training data)
+        predictor = Predictor.from_profile(PROFILE)
+        feature_names = predictor.feature_names
         
         # Define feature labels for better display
         feature_labels = {
@@ -159,17 +69,119 @@ def load_model_and_scaler():
             'model_type': 'Classification'
         }
         
-        return model, scaler, feature_names, metrics, feature_labels
+        # The model and scaler are loaded from model_kelulusan.apx when it is
+        # up to date and come compiled into one NumPy kernel behind the predictor
+        return predictor.model, predictor.scaler, feature_names, metrics, feature_labels, predictor
         
     except FileNotFoundError as e:
         st.error(f"File not found: {str(e)}")
         st.info("Make sure 'model.pkl' and 'scaler.pkl' are in the same folder as app.py")
-        return None, None, None, {}, {}
+        return None, None, None, {}, {}, None
     except Exception as e:
         st.error(f"Error loading files: {str(e)}")
-        return None, None, None, {}, {}
+        return None, None, None, {}, {}, None
+
+@st.cache_resource
+def prediction_cache():
+    """Prediction cache shared by all sessions of this server process"""
+    return PredictionCache()
+
+@st.cache_resource
+def result_store():
+    """Scored batch files, keyed by upload content hash; owns the result files"""
+    return ResultStore()
+
+# The file stamps are part of the cache key, so replaced model files are picked up
+model, scaler, feature_names, metrics, feature_labels, predictor = load_model_and_scaler(
+    profile_stamp(PROFILE)
+)
+cache = prediction_cache()
+store = result_store()
+
+def predict_status(input_values, threshold):
+    """Predicted class and PASS/FAIL probabilities (in %) for one student"""
+    # One model call: the class is the probability compared with the threshold.
+    # Scaling happens inside the fast kernel; predict_proba, else a sigmoid of
+    # the decision function, else 100/0
+    pass_probability, prediction_class = predictor.classify([input_values], threshold)
+    pass_probability = float(pass_probability[0])  # Probability of class 1 (PASS)
+    
+    return prediction_class[0], pass_probability, 100 - pass_probability
+
+def upload_key(file, threshold, output_format, passthrough):
+    """Store key of a batch result: upload content, model version and options"""
+    # Each upload is hashed once per session; file_id changes with every upload
+    hashes = st.session_state.setdefault('upload_hashes', {})
+    if file.file_id not in hashes:
+        hashes[file.file_id] = content_hash(file)
+    return hashes[file.file_id], predictor.version, threshold, output_format, tuple(passthrough)
+
+def render_batch_result(result, threshold, scored_now):
+    """Statistics, charts, preview and download of a stored batch result"""
+    summary = result.meta['summary']
+    output_info = FORMATS[result.meta['output_format']]
+    
+    if scored_now:
+        st.success(
+            f"✅ Prediksi berhasil! Total {summary.rows:,} siswa telah diprediksi "
+            f"({summary.elapsed:.1f} detik)"
+        )
+    else:
+        st.info("♻️ Hasil diambil dari penyimpanan server, file tidak diprediksi ulang.")
+    
+    st.markdown("### 📈 Statistik Hasil Prediksi")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Jumlah Siswa", f"{summary.rows:,}")
+    with col2:
+        st.metric("✅ PASS", f"{summary.status_counts.get('PASS', 0):,}")
+    with col3:
+        st.metric("❌ FAIL", f"{summary.status_counts.get('FAIL', 0):,}")
+    with col4:
+        st.metric("Rata-rata Probabilitas Lulus", f"{summary.mean:.1f}%")
+    
+    col_chart1, col_chart2 = st.columns(2)
+    with col_chart1:
+        fig_pie = grade_pie(
+            summary,
+            list(RISK_COLORS),
+            'Distribusi Risiko Tidak Lulus',
+            colors=RISK_COLORS
+        )
+        fig_pie.update_layout(height=400)
+        st.plotly_chart(fig_pie, use_container_width=True)
+    with col_chart2:
+        fig_hist = score_histogram(
+            summary,
+            'Distribusi Probabilitas Lulus',
+            x_title="Probabilitas Lulus (%)",
+            y_title="Jumlah Siswa"
+        )
+        fig_hist.add_vline(x=threshold, line_dash="dash", line_color="#dd0404")
+        fig_hist.update_layout(height=400)
+        st.plotly_chart(fig_hist, use_container_width=True)
+    
+    st.markdown("### 📊 Preview Hasil Prediksi")
+    st.dataframe(summary.preview, use_container_width=True)
+    
+    st.markdown("### 💾 Download Hasil")
+    with open(result.files[0], "rb") as result_file:
+        st.download_button(
+            label=f"📥 Download Hasil Prediksi ({output_info['label']})",
+            data=result_file,
+            file_name=f"hasil_kelulusan{output_info['suffix']}",
+            mime=output_info["mime"],
+            use_container_width=True
+        )
 
-model, scaler, feature_names, metrics, feature_labels = load_model_and_scaler()
+def render_footer():
+    st.markdown("---")
+    st.markdown("""
+    <div style='text-align: center; color: white; padding: 25px;'>
+        <p style='font-size: 18px; margin: 0; font-weight: 500;'>Made with ❤️ using Streamlit & Machine Learning</p>
+        <p style='font-size: 14px; margin: 10px 0 0 0; opacity: 0.8;'>🎓 Academic Performance Predictor © 2024</p>
+    </div>
+    """, unsafe_allow_html=True)
 
 # =========================================
 # SESSION STATE
@@ -188,6 +200,18 @@ st.markdown("<p class='subtitle'>✨ Prediksi Status Kelulusan Siswa dengan Mach
 # =========================================
 with st.sidebar:
     st.image("https://img.icons8.com/clouds/200/student-male.png", width=180)
+    st.markdown("### 🧭 Mode")
+    mode = st.radio("Mode", [MODE_SINGLE, MODE_BATCH], label_visibility="collapsed")
+    
+    threshold = st.slider(
+        "🎚️ Ambang kelulusan (%)",
+        min_value=0.0,
+        max_value=100.0,
+        value=DEFAULT_PASS_THRESHOLD,
+        step=1.0,
+        help="Siswa diprediksi PASS jika probabilitas lulusnya minimal sebesar ambang ini"
+    )
+    
     st.title("📊 Model Info")
     
     if st.session_state.model_loaded:
@@ -233,7 +257,7 @@ with st.sidebar:
 
 if not st.session_state.model_loaded:
     st.error("❌ Model atau Scaler tidak dapat dimuat!")
-    st.info("💡 Pastikan file 'model.pkl' dan 'scaler.pkl' ada di folder yang sama dengan app.py")
+    st.info("💡 Pastikan file 'model_kelulusan.pkl' dan 'scaler_kelulusan.pkl' ada di folder yang sama dengan appcoba.py")
     st.stop()
 
 # Success message
@@ -274,6 +298,91 @@ if metrics:
 
 st.markdown("<br>", unsafe_allow_html=True)
 
+# =========================================
+# BATCH PREDICTION
+# =========================================
+if mode == MODE_BATCH:
+    st.markdown("### 📂 Prediksi Batch dari File")
+    st.markdown("""
+    <div class='info-box'>
+        📋 <strong>Upload File</strong> - Probabilitas lulus dihitung sekali per siswa; status PASS/FAIL
+        mengikuti ambang kelulusan di sidebar dan pita risiko mengikuti probabilitasnya.
+        File diproses per potongan, jadi data satu sekolah pun tidak perlu dimuat seluruhnya ke memori.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("**Kolom yang harus ada dalam file:**")
+    st.markdown("\n".join(f"- `{feat}` ({feature_labels.get(feat, feat)})" for feat in feature_names))
+    
+    uploaded_file = st.file_uploader("Choose a CSV, Parquet or Feather file", type=UPLOAD_TYPES)
+    if uploaded_file is not None:
+        try:
+            file_columns = read_columns(uploaded_file)
+        except Exception as e:
+            st.error(f"❌ Error membaca file: {str(e)}")
+            st.info("💡 Pastikan file Anda valid dan sesuai format")
+            uploaded_file = None
+    
+    if uploaded_file is not None:
+        batch_predictor = predictor.with_options(status=pass_fail_status(threshold))
+        missing_cols = batch_predictor.missing_features(file_columns)
+        
+        if missing_cols:
+            st.error(f"❌ Kolom berikut tidak ditemukan dalam file: {', '.join(missing_cols)}")
+            st.info("💡 Pastikan nama kolom sama persis dengan yang tertera di atas")
+        else:
+            st.success(f"✅ Semua kolom yang dibutuhkan tersedia! Ukuran: {uploaded_file.size / (1024 * 1024):.1f} MB")
+            
+            # Hanya kolom model dan kolom tambahan yang dipilih yang dibaca dari file
+            passthrough = st.multiselect(
+                "🪪 Kolom tambahan yang ikut disertakan (mis. ID atau nama siswa)",
+                [c for c in file_columns if c not in batch_predictor.required_columns],
+                help="Kolom lain tidak dibaca sama sekali, sehingga file yang lebar lebih cepat diproses"
+            )
+            output_format = st.selectbox(
+                "📦 Format file hasil",
+                list(FORMATS),
+                format_func=lambda f: FORMATS[f]["label"],
+                help="Parquet dan Arrow IPC (Feather) lebih kecil dan lebih cepat dibaca oleh tools analitik"
+            )
+            output_info = FORMATS[output_format]
+            
+            key = upload_key(uploaded_file, threshold, output_format, passthrough)
+            scored_now = False
+            try:
+                if st.button("🎯 PREDIKSI SEMUA DATA", use_container_width=True):
+                    if key not in store:
+                        # The store owns the file and deletes it when the entry is evicted
+                        output_path = store.new_file_path(output_info["suffix"])
+                        try:
+                            with st.spinner("⏳ Sedang memproses prediksi per potongan data..."):
+                                summary = batch_predictor.stream_score_file(
+                                    uploaded_file,
+                                    output_path,
+                                    output_format=output_format,
+                                    columns=batch_predictor.projection(file_columns, passthrough)
+                                )
+                        except Exception:
+                            if os.path.exists(output_path):
+                                os.remove(output_path)
+                            raise
+                        store.put(key, files=[output_path], summary=summary,
+                                  output_format=output_format)
+                        scored_now = True
+                
+                # Hasil tetap tampil (dan bisa diunduh) pada interaksi berikutnya
+                result = store.get(key)
+                if result is not None:
+                    render_batch_result(result, threshold, scored_now)
+            
+            except Exception as e:
+                st.error(f"❌ Error saat melakukan prediksi: {str(e)}")
+                import traceback
+                st.code(traceback.format_exc())
+    
+    render_footer()
+    st.stop()
+
 # =========================================
 # INPUT SECTION
 # =========================================
@@ -358,32 +467,20 @@ with col_btn2:
 # PREDICTION
 # =========================================
 if predict_button:
+    # Only needed for the result view, so the input form loads without them
+    import pandas as pd
+    import plotly.graph_objects as go
+    
     try:
         # Prepare input as DataFrame
         input_values = [inputs[feat] for feat in feature_names]
-        input_df = pd.DataFrame([input_values], columns=feature_names)
         
-        # Scale input
-        input_scaled = scaler.transform(input_df)
-        
-        # Predict class and probability
-        prediction_class = model.predict(input_scaled)[0]
-        
-        # Get prediction probability if available
-        if hasattr(model, 'predict_proba'):
-            prediction_proba = model.predict_proba(input_scaled)[0]
-            pass_probability = prediction_proba[1] * 100  # Probability of class 1 (PASS)
-            fail_probability = prediction_proba[0] * 100  # Probability of class 0 (FAIL)
-        else:
-            # If no predict_proba, use decision function
-            if hasattr(model, 'decision_function'):
-                decision = model.decision_function(input_scaled)[0]
-                # Convert to probability-like score (0-100)
-                pass_probability = 1 / (1 + np.exp(-decision)) * 100
-                fail_probability = 100 - pass_probability
-            else:
-                pass_probability = 100 if prediction_class == 1 else 0
-                fail_probability = 100 if prediction_class == 0 else 0
+        # Predict class and probability; repeated inputs come from the cache.
+        # The threshold is part of the key, the class depends on it
+        prediction_class, pass_probability, fail_probability = cache.get_or_compute(
+            predictor.version, input_values + [threshold],
+            lambda: predict_status(input_values, threshold)
+        )
         
         # Display prediction
         st.markdown("<br>", unsafe_allow_html=True)
@@ -407,6 +504,10 @@ if predict_button:
         </div>
         """, unsafe_allow_html=True)
         
+        stats = cache.stats()
+        st.caption(f"⚡ Cache prediksi: {stats['hits']} hit • {stats['misses']} miss • "
+                   f"{stats['size']}/{stats['maxsize']} entri")
+        
         # Show probability
         st.markdown("<br>", unsafe_allow_html=True)
         col_prob1, col_prob2 = st.columns(2)
@@ -439,7 +540,7 @@ if predict_button:
             </div>
             <div style="display: flex; justify-content: space-between; margin-top: 10px; color: #333;">
                 <span style="font-weight: bold;">❌ FAIL (0%)</span>
-                <span style="font-weight: bold;">⚠️ BORDER (50%)</span>
+                <span style="font-weight: bold;">⚠️ BORDER ({threshold:g}%)</span>
                 <span style="font-weight: bold;">✅ PASS (100%)</span>
             </div>
         </div>
@@ -570,10 +671,4 @@ if predict_button:
         st.code(traceback.format_exc())
 
 # Footer
-st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: white; padding: 25px;'>
-    <p style='font-size: 18px; margin: 0; font-weight: 500;'>Made with ❤️ using Streamlit & Machine Learning</p>
-    <p style='font-size: 14px; margin: 10px 0 0 0; opacity: 0.8;'>🎓 Academic Performance Predictor © 2024</p>
-</div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+render_footer()
\ No newline at end of file
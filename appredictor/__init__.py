@@ -0,0 +1 @@
+"""Shared prediction helpers for the Academic Performance Predictor apps."""
@@ -0,0 +1,181 @@
+"""Compact binary format for the linear model artifacts.
+
+``joblib.load`` on the shipped .pkl files imports all of sklearn just to
+read about ten floats, and unpickling runs arbitrary code. An ``.apx``
+file holds the same information in a form that needs only NumPy to read
+and can be memory-mapped:
+
+    offset 0   magic  b"APXMODEL"
+    offset 8   uint32 format version (little endian)
+    offset 12  uint32 header length in bytes
+    offset 16  header, UTF-8 JSON: feature names, metrics, array table,
+               source file hashes and the content hash ("version")
+    ...        zero padding up to a 64-byte boundary
+    ...        float64 arrays (little endian, C order), each 64-byte aligned
+
+The content hash covers the header (without the hash itself) and the array
+bytes. It identifies the artifact version and is checked on load.
+"""
+import hashlib
+import json
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"APXMODEL"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+BINARY_SUFFIX = ".apx"
+
+_PREFIX = struct.Struct("<8sII")
+
+# Arrays written for every artifact, in file order
+ARRAY_NAMES = ("coef", "intercept", "mean", "scale", "classes")
+
+
+class ArtifactFormatError(ValueError):
+    """Raised when an .apx file is malformed or fails its integrity check."""
+
+
+def _align(n):
+    return -(-n // ALIGNMENT) * ALIGNMENT
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _content_hash(header, array_bytes):
+    h = hashlib.sha256()
+    h.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+    for data in array_bytes:
+        h.update(data)
+    return h.hexdigest()[:16]
+
+
+def _json_value(value):
+    # Metrics come out of the notebook as numpy scalars
+    if isinstance(value, dict):
+        return {str(k): _json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_value(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def write_artifact(path, model, scaler=None, feature_names=None, metrics=None,
+                   target_name=None, feature_labels=None, sources=None):
+    """Write a fitted scaler + linear model to ``path``; returns the version hash."""
+    arrays = {
+        "coef": np.asarray(model.coef_, dtype="<f8"),
+        "intercept": np.atleast_1d(np.asarray(model.intercept_, dtype="<f8")),
+    }
+    if scaler is not None:
+        if getattr(scaler, "with_mean", True):
+            arrays["mean"] = np.asarray(scaler.mean_, dtype="<f8")
+        if getattr(scaler, "with_std", True):
+            arrays["scale"] = np.asarray(scaler.scale_, dtype="<f8")
+    classes = getattr(model, "classes_", None)
+    if classes is not None:
+        arrays["classes"] = np.asarray(classes, dtype="<f8")
+    if feature_names is None and scaler is not None and hasattr(scaler, "feature_names_in_"):
+        feature_names = list(scaler.feature_names_in_)
+
+    # Lay out the arrays after the header; the header size is only known
+    # once the offsets are filled in, so iterate until it is stable.
+    table = {}
+    header = {}
+    header_len = 0
+    for _ in range(4):
+        offset = _align(_PREFIX.size + header_len)
+        for name in ARRAY_NAMES:
+            if name in arrays:
+                table[name] = {"offset": offset, "shape": list(arrays[name].shape)}
+                offset = _align(offset + arrays[name].nbytes)
+        header = {
+            "format_version": FORMAT_VERSION,
+            "model_type": type(model).__name__,
+            "scaler_type": type(scaler).__name__ if scaler is not None else None,
+            "feature_names": list(feature_names) if feature_names is not None else None,
+            "feature_labels": _json_value(feature_labels or {}),
+            "target_name": target_name,
+            "metrics": _json_value(metrics or {}),
+            "classes_dtype": str(np.asarray(classes).dtype) if classes is not None else None,
+            "arrays": table,
+            "sources": sources or {},
+        }
+        ordered = [np.ascontiguousarray(arrays[n]).tobytes() for n in ARRAY_NAMES if n in arrays]
+        header["version"] = _content_hash(header, ordered)
+        encoded = json.dumps(header, sort_keys=True).encode("utf-8")
+        if len(encoded) == header_len:
+            break
+        header_len = len(encoded)
+    else:
+        raise ArtifactFormatError("could not lay out the artifact header")
+
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(encoded)))
+        f.write(encoded)
+        for name in ARRAY_NAMES:
+            if name in arrays:
+                f.write(b"\0" * (table[name]["offset"] - f.tell()))
+                f.write(np.ascontiguousarray(arrays[name]).tobytes())
+    return header["version"]
+
+
+def read_header(path):
+    """Read and validate the JSON header of an .apx file."""
+    with open(path, "rb") as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) != _PREFIX.size:
+            raise ArtifactFormatError(f"{path} is too short to be an artifact")
+        magic, version, header_len = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ArtifactFormatError(f"{path} is not an {BINARY_SUFFIX} artifact")
+        if version != FORMAT_VERSION:
+            raise ArtifactFormatError(
+                f"{path} has format version {version}, expected {FORMAT_VERSION}"
+            )
+        try:
+            return json.loads(f.read(header_len).decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ArtifactFormatError(f"{path} has a corrupt header: {e}") from None
+
+
+def read_arrays(path, header, verify=True):
+    """Memory-map the arrays listed in ``header``."""
+    mapped = np.memmap(path, dtype=np.uint8, mode="r")
+    arrays = {}
+    for name, entry in header["arrays"].items():
+        count = int(np.prod(entry["shape"], dtype=np.int64))
+        if entry["offset"] + count * 8 > mapped.size:
+            raise ArtifactFormatError(f"{path} is truncated (array {name!r})")
+        arrays[name] = np.frombuffer(
+            mapped, dtype="<f8", count=count, offset=entry["offset"]
+        ).reshape(entry["shape"])
+    if verify:
+        unsigned = {k: v for k, v in header.items() if k != "version"}
+        ordered = [np.asarray(arrays[n]).tobytes() for n in ARRAY_NAMES if n in arrays]
+        if _content_hash(unsigned, ordered) != header.get("version"):
+            raise ArtifactFormatError(f"{path} failed its integrity check")
+    return arrays
+
+
+def sources_match(header, base_dir):
+    """True unless a recorded source file exists and has changed since export."""
+    for name, digest in header.get("sources", {}).items():
+        source = os.path.join(base_dir, name)
+        if os.path.exists(source) and file_sha256(source) != digest:
+            return False
+    return True
+
+
+def binary_path_for(path):
+    root, _ = os.path.splitext(path)
+    return root + BINARY_SUFFIX
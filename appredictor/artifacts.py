@@ -0,0 +1,192 @@
+"""Loading of the model artifacts outside of Streamlit.
+
+Artifacts are loaded from the binary ``.apx`` file next to the pickle when
+one exists and was exported from the current pickle (see
+``appredictor/artifact_format.py`` and ``export_artifacts.py``). That path
+needs only NumPy. Otherwise the pickle is loaded with joblib as before.
+"""
+import hashlib
+import os
+
+import numpy as np
+
+from appredictor import artifact_format
+from appredictor.inference import LinearKernel, compile_linear_pipeline
+
+
+class LinearModelView:
+    """Read-only stand-in for a fitted sklearn linear model.
+
+    Exposes the attributes the apps read (``coef_``, ``intercept_``,
+    ``classes_``) and the usual predict methods on already-scaled input.
+    """
+
+    def __init__(self, model_type, coef, intercept, classes=None):
+        self.model_type = model_type
+        self.coef_ = coef if classes is not None else coef.reshape(-1)
+        self.intercept_ = intercept if classes is not None else intercept[0]
+        if classes is not None:
+            self.classes_ = classes
+        self._kernel = LinearKernel(self.coef_, self.intercept_, classes=classes)
+        self.n_features_in_ = self._kernel.n_features
+
+    def decision_function(self, X):
+        return self._kernel.decision_function(X)
+
+    def predict(self, X):
+        return self._kernel.predict_fast(X)
+
+    def __getattr__(self, name):
+        # predict_proba only exists for classifiers, like in sklearn
+        if name == "predict_proba" and "classes_" in self.__dict__:
+            return self._kernel.predict_proba_fast
+        raise AttributeError(name)
+
+    def __repr__(self):
+        return f"{self.model_type}(from .apx)"
+
+
+class ScalerView:
+    """Read-only stand-in for a fitted StandardScaler."""
+
+    def __init__(self, mean=None, scale=None, feature_names=None):
+        self.mean_ = mean
+        self.scale_ = scale
+        self.with_mean = mean is not None
+        self.with_std = scale is not None
+        if feature_names is not None:
+            self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+
+    def transform(self, X):
+        X = np.array(X, dtype=np.float64, order="F")
+        if self.mean_ is not None:
+            X -= self.mean_
+        if self.scale_ is not None:
+            X /= self.scale_
+        return X
+
+    def __repr__(self):
+        return "StandardScaler(from .apx)"
+
+
+def load_binary_artifact(path, verify=True):
+    """Load an ``.apx`` file into the same dict layout as the pickled artifacts."""
+    header = artifact_format.read_header(path)
+    arrays = artifact_format.read_arrays(path, header, verify=verify)
+    classes = arrays.get("classes")
+    if classes is not None and header.get("classes_dtype"):
+        classes = classes.astype(header["classes_dtype"])
+    feature_names = header["feature_names"]
+    model = LinearModelView(header["model_type"], arrays["coef"], arrays["intercept"], classes)
+    scaler = None
+    if header.get("scaler_type"):
+        scaler = ScalerView(arrays.get("mean"), arrays.get("scale"), feature_names)
+    return {
+        "model": model,
+        "scaler": scaler,
+        "feature_names": feature_names,
+        "target_name": header.get("target_name"),
+        "metrics": header.get("metrics", {}),
+        "feature_labels": header.get("feature_labels", {}),
+        "fast_model": LinearKernel(
+            model.coef_, model.intercept_,
+            mean=arrays.get("mean"), scale=arrays.get("scale"),
+            classes=classes, feature_names=feature_names,
+        ),
+        "artifact_version": header["version"],
+    }
+
+
+def fresh_binary_for(path):
+    """Path of an up-to-date ``.apx`` twin of ``path``, or None."""
+    if path.endswith(artifact_format.BINARY_SUFFIX):
+        return path
+    binary = artifact_format.binary_path_for(path)
+    if not os.path.exists(binary):
+        return None
+    try:
+        header = artifact_format.read_header(binary)
+    except artifact_format.ArtifactFormatError:
+        return None
+    if not artifact_format.sources_match(header, os.path.dirname(binary)):
+        return None
+    return binary
+
+
+def artifact_stamp(*paths):
+    """Modification stamp of artifact files and their ``.apx`` twins.
+
+    Passed as an argument to cached loaders so that replacing a file on
+    disk produces a new cache entry instead of serving the old model.
+    """
+    stamp = []
+    for path in paths:
+        for candidate in (path, artifact_format.binary_path_for(path)):
+            try:
+                info = os.stat(candidate)
+            except FileNotFoundError:
+                continue
+            stamp.append((candidate, info.st_mtime_ns, info.st_size))
+    return tuple(stamp)
+
+
+def load_artifact(path):
+    """Load an artifact dict and attach the compiled ``fast_model``.
+
+    The artifact is the dict saved by the training notebook with ``model``,
+    ``scaler``, ``feature_names`` and ``metrics`` keys.
+    """
+    binary = fresh_binary_for(path)
+    if binary is not None:
+        return load_binary_artifact(binary)
+
+    import joblib
+
+    data = joblib.load(path)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} does not contain an artifact dict")
+    data["fast_model"] = compile_linear_pipeline(
+        data["model"], data.get("scaler"), data.get("feature_names")
+    )
+    data["artifact_version"] = artifact_format.file_sha256(path)[:16]
+    return data
+
+
+def pair_version(model_path, scaler_path):
+    """Version of a model and scaler pickle pair, from the hashes of both files.
+
+    Replacing only the scaler changes the scores, so it must change the
+    version too (cache keys use it), like the sources of an ``.apx`` file.
+    """
+    h = hashlib.sha256()
+    for path in (model_path, scaler_path):
+        h.update(artifact_format.file_sha256(path).encode("ascii"))
+    return h.hexdigest()[:16]
+
+
+def load_model_scaler_pair(model_path, scaler_path, feature_names=None):
+    """Load a model and scaler saved as two separate pickles.
+
+    The export of such a pair is stored as the ``.apx`` twin of ``model_path``.
+    ``feature_names=None`` reads the names, in training order, from the
+    fitted scaler (``feature_names_in_``), as ``export_artifacts.py`` does.
+    """
+    binary = fresh_binary_for(model_path)
+    if binary is not None:
+        return load_binary_artifact(binary)
+
+    import joblib
+
+    model = joblib.load(model_path)
+    scaler = joblib.load(scaler_path)
+    if feature_names is None:
+        feature_names = getattr(scaler, "feature_names_in_", None)
+        if feature_names is None:
+            raise ValueError(f"{scaler_path} has no feature names; pass feature_names")
+    return {
+        "model": model,
+        "scaler": scaler,
+        "feature_names": list(feature_names),
+        "fast_model": compile_linear_pipeline(model, scaler, feature_names),
+        "artifact_version": pair_version(model_path, scaler_path),
+    }
@@ -0,0 +1,256 @@
+"""Chunked batch scoring for CSV and columnar files.
+
+``pd.read_csv`` on a whole upload plus the copies made while scoring
+(``df[FEATURES].copy()``, ``to_csv`` for download) grows with the file
+size. The streaming path here reads a fixed number of rows at a time,
+scores them and appends the result to an output file, so peak memory only
+depends on the chunk size.
+"""
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from appredictor.export import ResultWriter
+from appredictor.grading import APP_CATEGORIES, DASHBOARD_GRADES
+from appredictor.ingest import detect_format, iter_frames, source_name
+from appredictor.rules import RULE_COLUMNS, apply_academic_rules_to
+from appredictor.timing import NULL_TIMER
+
+DEFAULT_CHUNKSIZE = 50_000
+SCORE_COLUMN = "Predicted_Final_Score"
+STATUS_COLUMN = "Predicted_Status"
+
+# Score histogram kept by BatchSummary: fixed 0.5-wide bins over 0-100, so
+# its size does not depend on the number of rows. ``histogram()`` merges
+# them into about 20 bars for display.
+HIST_BIN_WIDTH = 0.5
+HIST_BINS = 200
+NICE_BAR_WIDTHS = (0.5, 1.0, 2.0, 2.5, 5.0, 10.0, 20.0, 25.0, 50.0)
+
+
+def grade_scores(scores):
+    """Grade column used by the dashboard batch page."""
+    return DASHBOARD_GRADES.grade(scores)
+
+
+def categorize_scores(scores):
+    """Category column used by the app.py batch page."""
+    return APP_CATEGORIES.grade(scores)
+
+
+@dataclass
+class BatchSummary:
+    """Running totals collected while a file is scored chunk by chunk."""
+
+    rows: int = 0
+    chunks: int = 0
+    filled_values: int = 0
+    score_sum: float = 0.0
+    score_sumsq: float = 0.0
+    score_min: float = np.inf
+    score_max: float = -np.inf
+    grade_counts: dict = field(default_factory=dict)
+    status_counts: dict = field(default_factory=dict)
+    score_counts: np.ndarray = field(default_factory=lambda: np.zeros(HIST_BINS, np.int64))
+    preview: object = None  # first rows of the result (DataFrame)
+    elapsed: float = 0.0
+
+    def update(self, scored, score_column=SCORE_COLUMN, grade_column=None, status_column=None):
+        scores = scored[score_column].to_numpy(dtype=np.float64)
+        self.rows += len(scores)
+        self.chunks += 1
+        if len(scores):
+            self.score_sum += scores.sum()
+            self.score_sumsq += np.square(scores).sum()
+            self.score_min = min(self.score_min, scores.min())
+            self.score_max = max(self.score_max, scores.max())
+            scores = scores[~np.isnan(scores)]
+            bins = np.minimum((np.clip(scores, 0, 100) / HIST_BIN_WIDTH).astype(np.intp),
+                              HIST_BINS - 1)
+            self.score_counts += np.bincount(bins, minlength=HIST_BINS)
+        for column, counts in ((grade_column, self.grade_counts),
+                               (status_column, self.status_counts)):
+            if column is None:
+                continue
+            for label, count in scored[column].value_counts().items():
+                # A categorical column also lists the empty bands
+                if count:
+                    counts[label] = counts.get(label, 0) + int(count)
+        if self.preview is None:
+            self.preview = scored.head(10).copy()
+
+    def merge(self, other):
+        """Fold the totals of another summary (e.g. another partition) into this one."""
+        self.rows += other.rows
+        self.chunks += other.chunks
+        self.filled_values += other.filled_values
+        self.score_sum += other.score_sum
+        self.score_sumsq += other.score_sumsq
+        self.score_min = min(self.score_min, other.score_min)
+        self.score_max = max(self.score_max, other.score_max)
+        self.score_counts += other.score_counts
+        for grade, count in other.grade_counts.items():
+            self.grade_counts[grade] = self.grade_counts.get(grade, 0) + count
+        for status, count in other.status_counts.items():
+            self.status_counts[status] = self.status_counts.get(status, 0) + count
+        if self.preview is None:
+            self.preview = other.preview
+
+    @property
+    def mean(self):
+        return self.score_sum / self.rows if self.rows else float("nan")
+
+    @property
+    def std(self):
+        # Sample standard deviation, same as Series.std()
+        if self.rows < 2:
+            return float("nan")
+        var = (self.score_sumsq - self.rows * self.mean ** 2) / (self.rows - 1)
+        return float(np.sqrt(max(var, 0.0)))
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed else float("nan")
+
+    def histogram(self, bars=20):
+        """``(left_edges, counts, width)`` of at most ``bars`` bars over the scores seen.
+
+        The bar width is the smallest "nice" multiple of the stored bins
+        that covers the occupied score range in ``bars`` bars.
+        """
+        occupied = np.flatnonzero(self.score_counts)
+        if not len(occupied):
+            return np.empty(0), np.empty(0, np.int64), HIST_BIN_WIDTH
+        low = occupied[0] * HIST_BIN_WIDTH
+        high = (occupied[-1] + 1) * HIST_BIN_WIDTH
+        width = next((w for w in NICE_BAR_WIDTHS if (high - low) / w <= bars),
+                     NICE_BAR_WIDTHS[-1])
+        per_bar = int(round(width / HIST_BIN_WIDTH))
+        first = int(low // width) * per_bar
+        last = min(int(np.ceil(high / width)) * per_bar, HIST_BINS)
+        counts = self.score_counts[first:last]
+        counts = np.add.reduceat(counts, np.arange(0, len(counts), per_bar))
+        return first * HIST_BIN_WIDTH + width * np.arange(len(counts)), counts, width
+
+    def ordered_grades(self, labels):
+        """Grade counts in the order of ``labels``, leaving out empty grades."""
+        return {g: self.grade_counts[g] for g in labels if self.grade_counts.get(g)}
+
+
+def summarize_frame(df, score_column=SCORE_COLUMN, grade_column=None, status_column=None):
+    """``BatchSummary`` of a scored DataFrame that is fully in memory."""
+    summary = BatchSummary()
+    summary.update(df, score_column, grade_column, status_column)
+    return summary
+
+
+def model_scores(fast_model, X):
+    """Raw scores of the compiled model for a feature matrix.
+
+    A regressor's prediction, or for a binary classifier the probability
+    (in %) of the positive class. The class can be derived from that
+    probability and a threshold, so the linear part runs only once.
+    """
+    if getattr(fast_model, "is_classifier", False):
+        return 100 * fast_model.predict_proba_fast(X)[:, 1]
+    return fast_model.predict_fast(X)
+
+
+def score_frame(df, fast_model, feature_names, fill_values=None, apply_rules=True,
+                grader=grade_scores, score_column=SCORE_COLUMN, grade_column="Grade",
+                status=None, status_column=STATUS_COLUMN, timer=NULL_TIMER):
+    """Scale, predict, cap and grade one DataFrame, adding result columns in place.
+
+    ``status`` is a second grader for the scores (e.g. PASS/FAIL from a
+    threshold, see ``appredictor.grading.pass_fail_status``) written to
+    ``status_column``. Returns the number of feature values that had to be
+    filled. Each step is timed as a stage of ``timer`` (see
+    ``appredictor.timing``).
+    """
+    rows = len(df)
+    with timer.stage("fill_missing", rows):
+        X = df[feature_names]
+        n_missing = int(X.isna().to_numpy().sum())
+        if n_missing:
+            X = X.fillna(fill_values if fill_values is not None else X.median())
+
+    with timer.stage("scale_predict", rows):
+        predictions = model_scores(fast_model, X)
+    with timer.stage("rules" if apply_rules else "clip", rows):
+        if apply_rules:
+            df[score_column] = apply_academic_rules_to(predictions, df)
+        else:
+            df[score_column] = np.clip(predictions, 0, 100)
+    if grader is not None:
+        with timer.stage("grade", rows):
+            df[grade_column] = grader(df[score_column])
+    if status is not None:
+        with timer.stage("status", rows):
+            df[status_column] = status(df[score_column])
+    return n_missing
+
+
+def stream_score_file(source, destination, fast_model, feature_names, fill_values,
+                      chunksize=DEFAULT_CHUNKSIZE, apply_rules=True, grader=grade_scores,
+                      score_column=SCORE_COLUMN, grade_column="Grade", write_header=True,
+                      output_format="csv", name=None, columns=None, profile=None,
+                      status=None, status_column=STATUS_COLUMN, timer=NULL_TIMER):
+    """Score a file chunk by chunk and write the results to ``destination``.
+
+    ``source`` and ``destination`` can be paths or file objects. The input
+    format (CSV, compressed CSV, Parquet, Arrow IPC) is taken from ``name``
+    or the source's own name, and only ``columns`` are read (None: all);
+    see ``appredictor.ingest``. The whole file is never in memory at once,
+    so missing values are filled with the fixed ``fill_values`` (e.g. the
+    scaler's training means) instead of the column median of the file.
+    The features (and rule columns) are read as float64 and every other
+    column as text, so the chunks agree on one output schema.
+    ``output_format`` is one of ``appredictor.export.FORMATS``. A
+    ``profile`` (``appredictor.quality.DataProfile``) is updated with every
+    chunk before its missing values are filled. ``status`` and
+    ``status_column`` are passed on to ``score_frame``.
+    """
+    input_format = detect_format(source_name(source, name))[0]
+    summary = BatchSummary()
+    start = time.perf_counter()
+    writer = ResultWriter(destination, output_format, score_column=score_column,
+                          float_columns=feature_names, write_header=write_header)
+    numeric = list(feature_names)
+    if apply_rules:
+        numeric += [c for c in RULE_COLUMNS if c not in numeric]
+    chunks = iter_frames(source, name, columns=columns, float_columns=numeric,
+                         chunksize=chunksize, text=True)
+    with writer, closing(chunks):
+        while True:
+            read_start = time.perf_counter()
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            timer.add(f"read_{input_format}", time.perf_counter() - read_start, len(chunk))
+            if profile is not None:
+                with timer.stage("data_quality", len(chunk)):
+                    profile.update(chunk)
+            summary.filled_values += score_frame(
+                chunk, fast_model, feature_names,
+                fill_values=fill_values,
+                apply_rules=apply_rules,
+                grader=grader,
+                score_column=score_column,
+                grade_column=grade_column,
+                status=status,
+                status_column=status_column,
+                timer=timer,
+            )
+            with timer.stage(f"to_{output_format}", len(chunk)):
+                writer.write(chunk)
+            summary.update(chunk, score_column, grade_column if grader is not None else None,
+                           status_column if status is not None else None)
+    summary.elapsed = time.perf_counter() - start
+    return summary
+
+
+def training_means(scaler, feature_names):
+    """Fill values for the streaming path, taken from the fitted scaler."""
+    return dict(zip(feature_names, np.asarray(scaler.mean_, dtype=np.float64)))
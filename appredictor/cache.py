@@ -0,0 +1,86 @@
+"""LRU cache for single-student predictions.
+
+Teachers often press the predict button again with the same or nearly the
+same inputs. The cache maps the quantized feature vector plus the artifact
+version to the finished result, so a repeat skips the
+scale -> predict -> rules path. One instance is meant to be shared by all
+sessions of a server process (e.g. through ``st.cache_resource``).
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_MAXSIZE = 4096
+
+# Inputs closer than this are treated as the same student. The input
+# widgets step by 0.5 or 1.0, so two different UI inputs never collide.
+DEFAULT_RESOLUTION = 1e-3
+
+
+class PredictionCache:
+    """Thread-safe, bounded LRU cache of prediction results."""
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, resolution=DEFAULT_RESOLUTION):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.resolution = resolution
+        self.hits = 0
+        self.misses = 0
+        self._version = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, version, features):
+        quantized = np.rint(np.asarray(features, dtype=np.float64) / self.resolution)
+        return version, quantized.astype(np.int64).tobytes()
+
+    def get_or_compute(self, version, features, compute):
+        """Return the cached result for ``features`` or store ``compute()``.
+
+        A new artifact ``version`` drops every entry of the previous one.
+        Cached values are shared between sessions and must not be mutated.
+        """
+        key = self.key(version, features)
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Computed outside the lock; two sessions missing on the same key
+        # at once both compute, which is harmless.
+        value = compute()
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "version": self._version,
+            }
@@ -0,0 +1,44 @@
+"""Batch result charts drawn from a ``BatchSummary`` instead of the rows.
+
+``px.histogram(df, x=...)`` and a pie from ``df[...].value_counts()``
+embed or re-scan every score of the result, so the figure JSON sent to
+the browser grows with the file. The figures here are built from the
+fixed-size aggregates in ``appredictor.batch.BatchSummary`` (grade counts
+and the binned score histogram), collected while scoring, also chunk by
+chunk: one bar per bin and one slice per grade, whatever the row count.
+
+plotly is imported when a figure is built.
+"""
+import numpy as np
+
+
+def grade_pie(summary, labels, title, colors=None, **kwargs):
+    """Pie of the grade counts, slices in the order of ``labels``.
+
+    ``colors`` maps grades to colors; other keyword arguments go to ``px.pie``.
+    """
+    import plotly.express as px
+
+    counts = summary.ordered_grades(labels)
+    names = list(counts)
+    if colors is not None:
+        kwargs.update(color=names, color_discrete_map=colors)
+    return px.pie(values=list(counts.values()), names=names, title=title, **kwargs)
+
+
+def score_histogram(summary, title, bars=20, color="#667eea", x_title="Nilai",
+                    y_title="Frekuensi"):
+    """Histogram of the scores from the binned counts (at most ``bars`` bars)."""
+    import plotly.graph_objects as go
+
+    edges, counts, width = summary.histogram(bars)
+    fig = go.Figure(go.Bar(
+        x=edges + width / 2,
+        y=counts,
+        width=width,
+        marker_color=color,
+        customdata=np.column_stack([edges, edges + width]),
+        hovertemplate="%{customdata[0]:g} - %{customdata[1]:g}<br>%{y:,}<extra></extra>",
+    ))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title, bargap=0.02)
+    return fig
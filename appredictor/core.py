@@ -0,0 +1,320 @@
+"""Prediction core shared by all the apps.
+
+``Predictor`` wraps one model artifact and owns the whole hot path:
+feature validation, the compiled scale -> predict kernel, the academic
+rules, clipping and grading, for a single student as well as for
+DataFrames and CSV files. The Streamlit pages and ``score_batch.py`` only
+decide which profile to use and how to display the results.
+
+Profiles describe the pipelines the apps actually run:
+
+- ``dashboard`` (cobadashboard.py): pt6 artifact, academic rules, grades A-D
+- ``app`` (app.py): pt5 artifact, clipping only, five performance categories
+- ``kelulusan`` (appcoba.py): pass/fail classifier saved as a model and a
+  scaler pickle; the score is the pass probability (%), graded into risk
+  bands, plus a PASS/FAIL status from a threshold
+
+Artifact paths in the profiles are relative to the repository root, so the
+apps work regardless of the working directory they are started from.
+"""
+import os
+
+import numpy as np
+
+from appredictor import batch
+from appredictor.artifacts import artifact_stamp, load_artifact, load_model_scaler_pair
+from appredictor.export import write_result
+from appredictor.grading import (APP_CATEGORIES, DASHBOARD_GRADES, DEFAULT_PASS_THRESHOLD,
+                                 PASS_RISK_BANDS, pass_fail_status)
+from appredictor.ingest import read_columns, read_frame
+from appredictor.rules import RULE_COLUMNS, apply_academic_rules_to
+from appredictor.timing import NULL_TIMER
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROFILES = {
+    "dashboard": {
+        "artifact": "academic_predictor_pt6.pkl",
+        "apply_rules": True,
+        "grading": DASHBOARD_GRADES,
+        "grade_column": "Grade",
+    },
+    "app": {
+        "artifact": "academic_predictor_model_pt5.pkl",
+        "apply_rules": False,
+        "grading": APP_CATEGORIES,
+        "grade_column": "Category",
+    },
+    "kelulusan": {
+        "artifact": "model_kelulusan.pkl",
+        # Feature names and their order come from the scaler's feature_names_in_
+        "scaler": "scaler_kelulusan.pkl",
+        "apply_rules": False,
+        "grading": PASS_RISK_BANDS,
+        "grade_column": "Risk_Band",
+        "score_column": "Pass_Probability",
+        "status": pass_fail_status(DEFAULT_PASS_THRESHOLD),
+    },
+}
+
+
+class FeatureValidationError(ValueError):
+    """Raised when inputs lack some of the model's features."""
+
+    def __init__(self, missing):
+        self.missing = list(missing)
+        super().__init__(f"Missing features: {', '.join(self.missing)}")
+
+
+def profile_artifact_path(name):
+    return os.path.join(ROOT_DIR, PROFILES[name]["artifact"])
+
+
+def profile_stamp(name):
+    """File stamp of a profile's artifact, for cache keys (see ``artifact_stamp``)."""
+    paths = [profile_artifact_path(name)]
+    if "scaler" in PROFILES[name]:
+        paths.append(os.path.join(ROOT_DIR, PROFILES[name]["scaler"]))
+    return artifact_stamp(*paths)
+
+
+class Predictor:
+    """Scale -> predict -> rules -> grade pipeline of one model artifact."""
+
+    def __init__(self, artifact, apply_rules=False, grading=None, grade_column="Grade",
+                 score_column=batch.SCORE_COLUMN, status=None,
+                 status_column=batch.STATUS_COLUMN, source=None, scaler_source=None):
+        self.artifact = artifact
+        self.model = artifact["model"]
+        self.scaler = artifact.get("scaler")
+        self.fast_model = artifact["fast_model"]
+        self.feature_names = list(artifact["feature_names"])
+        self.metrics = artifact.get("metrics") or {}
+        self.feature_labels = artifact.get("feature_labels") or {}
+        self.version = artifact.get("artifact_version")
+        self.apply_rules = apply_rules
+        self.grading = grading
+        self.grade_column = grade_column
+        self.score_column = score_column
+        self.status = status
+        self.status_column = status_column
+        self.source = source
+        self.scaler_source = scaler_source
+
+    @classmethod
+    def from_file(cls, path, **options):
+        """Load a pickled artifact dict (or its ``.apx`` export)."""
+        return cls(load_artifact(path), source=path, **options)
+
+    @classmethod
+    def from_pair(cls, model_path, scaler_path, feature_names=None, **options):
+        """Load a model and scaler saved as two pickles.
+
+        ``feature_names=None`` takes them from the fitted scaler.
+        """
+        data = load_model_scaler_pair(model_path, scaler_path, feature_names)
+        return cls(data, source=model_path, scaler_source=scaler_path, **options)
+
+    @classmethod
+    def from_profile(cls, name, artifact=None):
+        """Predictor configured like one of the apps; ``artifact`` overrides the file."""
+        options = dict(PROFILES[name])
+        path = artifact or os.path.join(ROOT_DIR, options["artifact"])
+        del options["artifact"]
+        if "scaler" in options:
+            scaler = os.path.join(ROOT_DIR, options.pop("scaler"))
+            return cls.from_pair(path, scaler, options.pop("feature_names", None), **options)
+        return cls.from_file(path, **options)
+
+    @property
+    def is_classifier(self):
+        return getattr(self.fast_model, "is_classifier", False)
+
+    @property
+    def options(self):
+        """Post-processing options, enough to rebuild the pipeline elsewhere."""
+        return {
+            "apply_rules": self.apply_rules,
+            "grading": self.grading,
+            "grade_column": self.grade_column,
+            "score_column": self.score_column,
+            "status": self.status,
+            "status_column": self.status_column,
+        }
+
+    def with_options(self, **options):
+        """Copy sharing the loaded model, with some post-processing options replaced.
+
+        Cheap enough to call per rerun, e.g. for a new pass threshold:
+        ``predictor.with_options(status=pass_fail_status(60))``.
+        """
+        merged = {**self.options, **options}
+        return type(self)(self.artifact, source=self.source, scaler_source=self.scaler_source,
+                          **merged)
+
+    def missing_features(self, columns):
+        columns = set(columns)
+        return [f for f in self.feature_names if f not in columns]
+
+    def validate(self, columns):
+        missing = self.missing_features(columns)
+        if missing:
+            raise FeatureValidationError(missing)
+
+    def feature_vector(self, inputs):
+        """Values of a dict of inputs in the model's feature order."""
+        self.validate(inputs)
+        return [inputs[f] for f in self.feature_names]
+
+    @property
+    def required_columns(self):
+        """Input columns the pipeline reads: features plus rule columns."""
+        columns = list(self.feature_names)
+        if self.apply_rules:
+            columns += [c for c in RULE_COLUMNS if c not in columns]
+        return columns
+
+    def projection(self, file_columns, passthrough=None):
+        """Columns to read from a file: the required ones plus ``passthrough``.
+
+        ``passthrough=None`` keeps every column (no projection). The result
+        is in file order.
+        """
+        if passthrough is None:
+            return None
+        keep = set(self.required_columns) | set(passthrough)
+        return [c for c in file_columns if c in keep]
+
+    def read_input(self, source, name=None, passthrough=None, nrows=None):
+        """Read a batch input file with the features as float64; see ``appredictor.ingest``."""
+        columns = self.projection(read_columns(source, name), passthrough)
+        return read_frame(source, name, columns=columns, float_columns=self.feature_names,
+                          nrows=nrows)
+
+    def training_means(self):
+        """Fill values for missing data when the whole file is not in memory."""
+        return batch.training_means(self.scaler, self.feature_names)
+
+    def predict_scores(self, X, rule_data=None):
+        """Final scores for a feature matrix: rules (when enabled) and 0-100 clip.
+
+        For a classifier the score is the probability (%) of the positive class.
+
+        ``rule_data`` holds the rule columns (DataFrame or dict) and is
+        required when the profile applies the academic rules.
+        """
+        predictions = batch.model_scores(self.fast_model, X)
+        if self.apply_rules:
+            return apply_academic_rules_to(predictions, rule_data)
+        return np.clip(predictions, 0, 100)
+
+    def predict_one(self, inputs):
+        """Final score of one student given as a dict of inputs."""
+        return float(self.predict_scores([self.feature_vector(inputs)], inputs)[0])
+
+    def predict_records(self, records):
+        """Final scores of many students, given as dicts of inputs, in one call."""
+        X = np.array([self.feature_vector(r) for r in records], dtype=np.float64)
+        rule_data = None
+        if self.apply_rules:
+            rule_data = {
+                c: np.array([r.get(c, 0) for r in records], dtype=np.float64)
+                for c in RULE_COLUMNS
+            }
+        return self.predict_scores(X.reshape(len(records), len(self.feature_names)), rule_data)
+
+    def cache_key(self, inputs):
+        """Inputs that determine ``predict_one``: features plus rule columns."""
+        key = self.feature_vector(inputs)
+        if self.apply_rules:
+            key += [inputs.get(c, 0) for c in RULE_COLUMNS]
+        return key
+
+    def grade(self, scores):
+        return self.grading(scores) if self.grading is not None else None
+
+    def predict_labels(self, X):
+        return self.fast_model.predict_fast(X)
+
+    def predict_proba(self, X):
+        """Class probabilities of a binary classifier, one row per sample."""
+        if hasattr(self.model, "predict_proba"):
+            return self.fast_model.predict_proba_fast(X)
+        if hasattr(self.model, "decision_function"):
+            positive = 1 / (1 + np.exp(-np.asarray(self.fast_model.decision_function(X))))
+            return np.stack([1 - positive, positive], axis=1)
+        # No scores at all: the predicted class gets probability 1
+        positive = (np.asarray(self.predict_labels(X)) == 1).astype(np.float64)
+        return np.stack([1 - positive, positive], axis=1)
+
+    def classify(self, X, threshold=DEFAULT_PASS_THRESHOLD):
+        """Pass probability (%) and class of a binary classifier from one model call.
+
+        The class is the positive one where the probability reaches
+        ``threshold`` (%); at 50 that matches ``predict_labels``.
+        """
+        probability = 100 * self.predict_proba(X)[:, 1]
+        return probability, self.fast_model.classes[(probability >= threshold).astype(np.intp)]
+
+    def write_result(self, df, destination, output_format="csv"):
+        """Write a scored DataFrame; see ``appredictor.export``."""
+        write_result(df, destination, output_format, score_column=self.score_column,
+                     float_columns=self.feature_names)
+
+    def score_frame(self, df, fill_values=None, timer=NULL_TIMER):
+        """Add score and grade columns to ``df`` in place; returns the filled count.
+
+        Without ``fill_values`` missing features are filled with the column
+        medians of ``df``.
+        """
+        return batch.score_frame(
+            df, self.fast_model, self.feature_names,
+            fill_values=fill_values,
+            apply_rules=self.apply_rules,
+            grader=self.grading,
+            score_column=self.score_column,
+            grade_column=self.grade_column,
+            status=self.status,
+            status_column=self.status_column,
+            timer=timer,
+        )
+
+    def stream_score_file(self, source, destination, chunksize=batch.DEFAULT_CHUNKSIZE,
+                          write_header=True, output_format="csv", name=None, columns=None,
+                          profile=None, timer=NULL_TIMER):
+        """Score a file chunk by chunk; see ``appredictor.batch.stream_score_file``."""
+        return batch.stream_score_file(
+            source, destination, self.fast_model, self.feature_names,
+            fill_values=self.training_means(),
+            chunksize=chunksize,
+            apply_rules=self.apply_rules,
+            grader=self.grading,
+            score_column=self.score_column,
+            grade_column=self.grade_column,
+            write_header=write_header,
+            output_format=output_format,
+            name=name,
+            columns=columns,
+            profile=profile,
+            status=self.status,
+            status_column=self.status_column,
+            timer=timer,
+        )
+
+    def parallel_score_csv(self, input_path, output_path, workers=None,
+                           chunksize=batch.DEFAULT_CHUNKSIZE, output_format="csv", columns=None):
+        """Score a CSV across worker processes; see ``appredictor.parallel``."""
+        if self.source is None:
+            raise ValueError("parallel scoring needs a predictor loaded from a file")
+        from appredictor.parallel import parallel_score_csv
+
+        source = self.source
+        if self.scaler_source is not None:
+            source = (self.source, self.scaler_source, self.feature_names)
+        return parallel_score_csv(input_path, output_path, source, self.options,
+                                  workers=workers, chunksize=chunksize,
+                                  output_format=output_format, columns=columns)
+
+    def __repr__(self):
+        return (f"Predictor({self.source or 'artifact'}, version={self.version}, "
+                f"apply_rules={self.apply_rules})")
@@ -0,0 +1,171 @@
+"""Batching dispatcher for predictions from concurrent Streamlit sessions.
+
+Every Streamlit session runs its script in its own thread. When many
+teachers press "Prediksi" at the same time, each of them used to score a
+one-row matrix on its own. A ``BatchingDispatcher`` sits between the pages
+and the model: one worker thread collects the rows submitted at about the
+same time into a small matrix, scores them with one call and hands every
+session its own result.
+
+The wait is adaptive. The dispatcher keeps a moving average of the batch
+sizes it sees; while requests come in alone it does not wait at all, so a
+single user pays no extra latency, and as concurrency grows it waits up to
+``max_wait`` for more rows.
+"""
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from queue import Empty, Queue
+
+DEFAULT_MAX_BATCH = 32
+DEFAULT_MAX_WAIT = 0.002
+
+# Weight of the newest batch in the moving average of batch sizes
+LOAD_SMOOTHING = 0.2
+
+_STOP = object()
+
+
+def resolve_futures(score, items):
+    """Score ``(record, future)`` pairs with one call and resolve every future.
+
+    Works for ``concurrent.futures`` and asyncio futures. When ``score``
+    fails, or returns a different number of results than records (which
+    result belongs to which record is then unknown, and a future without
+    one would never resolve), every future gets the exception.
+    """
+    try:
+        results = list(score([record for record, _ in items]))
+        if len(results) != len(items):
+            raise ValueError(f"score returned {len(results)} results for {len(items)} records")
+    except Exception as e:
+        for _, future in items:
+            future.set_exception(e)
+        return
+    for (_, future), result in zip(items, results):
+        future.set_result(result)
+
+
+class BatchStats:
+    """Thread-safe batch size histogram and counters."""
+
+    def __init__(self):
+        self.batches = 0
+        self.items = 0
+        self.largest = 0
+        self.sizes = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, size):
+        with self._lock:
+            self.batches += 1
+            self.items += size
+            self.largest = max(self.largest, size)
+            self.sizes[size] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "items": self.items,
+                "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+                "largest_batch": self.largest,
+                "batch_sizes": dict(sorted(self.sizes.items())),
+            }
+
+
+class BatchingDispatcher:
+    """Collects concurrent ``submit`` calls into batched ``score`` calls.
+
+    ``score`` is passed with every record and gets a list of records,
+    returning one result per record (e.g. ``Predictor.predict_records``);
+    any other number of results fails every submission of that call.
+    Records queued with different ``score`` callables, such as the old and
+    the new predictor right after a model reload, are scored separately.
+    """
+
+    def __init__(self, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT, adaptive=True):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.adaptive = adaptive
+        self.stats = BatchStats()
+        self._load = 1.0
+        self._queue = Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, score, record, timeout=None):
+        """Score ``record`` together with concurrent submissions; blocks until done."""
+        future = Future()
+        self._ensure_worker()
+        self._queue.put((score, record, future))
+        return future.result(timeout)
+
+    def current_wait(self):
+        if not self.adaptive:
+            return self.max_wait
+        # 0 while batches hold a single row, the full wait from two rows up
+        return self.max_wait * min(1.0, max(0.0, self._load - 1.0))
+
+    def close(self):
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+                self._thread = None
+
+    def metrics(self):
+        return {
+            **self.stats.snapshot(),
+            "load": self._load,
+            "current_wait_ms": self.current_wait() * 1000,
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="appredictor-dispatch", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.current_wait()
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except Empty:
+                        break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch):
+        self.stats.record(len(batch))
+        self._load += LOAD_SMOOTHING * (len(batch) - self._load)
+        groups = {}
+        for score, record, future in batch:
+            groups.setdefault(score, []).append((record, future))
+        for score, items in groups.items():
+            resolve_futures(score, items)
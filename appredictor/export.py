@@ -0,0 +1,156 @@
+"""Result files in CSV, Parquet and Arrow IPC format.
+
+CSV is what spreadsheets open; the columnar formats are for analytics
+tools, which load them without parsing text and with the right dtypes:
+the score is stored as float32 and the grade as a dictionary column (the
+Arrow form of the pandas Categorical built by ``appredictor.grading``).
+"arrow" is the Arrow IPC file format, the same thing as Feather v2.
+
+A ``ResultWriter`` takes the scored result one DataFrame chunk at a time,
+so the batch functions can write any format without holding the whole
+result in memory. pyarrow is imported only when a columnar format is used.
+"""
+import shutil
+
+import numpy as np
+
+FORMATS = {
+    "csv": {"suffix": ".csv", "mime": "text/csv", "label": "CSV"},
+    "parquet": {"suffix": ".parquet", "mime": "application/vnd.apache.parquet",
+                "label": "Parquet"},
+    "arrow": {"suffix": ".arrow", "mime": "application/vnd.apache.arrow.file",
+              "label": "Arrow IPC (Feather)"},
+}
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+PARQUET_COMPRESSION = "zstd"
+SCORE_DTYPE = np.float32
+
+
+def check_format(fmt):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown output format {fmt!r}, expected one of {', '.join(FORMATS)}")
+    return fmt
+
+
+class ResultWriter:
+    """Write scored chunks to ``destination`` (a path or file object) in ``fmt``.
+
+    The first chunk fixes the schema of a columnar file: ``float_columns``
+    (the model features) are always float64, so a later chunk with filled
+    NaN values still matches, and ``score_column`` becomes float32. The
+    other columns must have the same dtypes in every chunk, which is what
+    ``appredictor.ingest.iter_frames(text=True)`` reads. Use as a context
+    manager, or call ``close()``.
+    """
+
+    def __init__(self, destination, fmt="csv", score_column=None, float_columns=(),
+                 write_header=True):
+        self.destination = destination
+        self.fmt = check_format(fmt)
+        self.score_column = score_column
+        self.float_columns = list(float_columns)
+        self.write_header = write_header
+        self.rows = 0
+        self._schema = None
+        self._writer = None
+        self._chunks = 0
+
+    def write(self, frame):
+        if self.fmt == "csv":
+            frame.to_csv(self.destination, index=False,
+                         header=(self.write_header and self._chunks == 0),
+                         mode="w" if self._chunks == 0 else "a")
+        else:
+            self._write_table(self.to_table(frame))
+        self._chunks += 1
+        self.rows += len(frame)
+
+    def to_table(self, frame):
+        """``frame`` as an Arrow table with the result dtypes."""
+        import pyarrow as pa
+
+        columns = {}
+        if self.score_column in frame:
+            columns[self.score_column] = frame[self.score_column].astype(SCORE_DTYPE)
+        for name in self.float_columns:
+            if name in frame and frame[name].dtype != np.float64:
+                columns[name] = frame[name].astype(np.float64)
+        if columns:
+            frame = frame.assign(**columns)
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self._schema is None:
+            self._schema = table.schema.remove_metadata()
+        return table.cast(self._schema)
+
+    def _write_table(self, table):
+        if self._writer is None:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            if self.fmt == "parquet":
+                self._writer = pq.ParquetWriter(self.destination, self._schema,
+                                                compression=PARQUET_COMPRESSION)
+            else:
+                self._writer = pa.ipc.new_file(self.destination, self._schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def write_result(frame, destination, fmt="csv", score_column=None, float_columns=()):
+    """Write a whole scored DataFrame in one go."""
+    with ResultWriter(destination, fmt, score_column=score_column,
+                      float_columns=float_columns) as writer:
+        writer.write(frame)
+
+
+def concat_files(paths, destination, fmt="csv"):
+    """Concatenate result files with the same columns, in order.
+
+    CSV parts (only the first with a header) are copied byte by byte;
+    columnar parts are copied record batch by record batch, cast to the
+    combined schema of all parts.
+    """
+    check_format(fmt)
+    if fmt == "csv":
+        with open(destination, "wb") as out:
+            for path in paths:
+                with open(path, "rb") as part:
+                    shutil.copyfileobj(part, out)
+        return
+
+    if not paths:
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    def open_part(path):
+        if fmt == "parquet":
+            source = pq.ParquetFile(path)
+            return source.schema_arrow, source.iter_batches()
+        source = pa.ipc.open_file(pa.memory_map(path))
+        return source.schema, (source.get_batch(i) for i in range(source.num_record_batches))
+
+    # Parts are written independently, so a column can have a different type
+    # in each (e.g. null where a part had only missing values): write them
+    # with the combined schema of all parts, read from the file footers.
+    schema = pa.unify_schemas([open_part(path)[0].remove_metadata() for path in paths],
+                              promote_options="permissive")
+    writer = (pq.ParquetWriter(destination, schema, compression=PARQUET_COMPRESSION)
+              if fmt == "parquet" else pa.ipc.new_file(destination, schema))
+    with writer:
+        for path in paths:
+            for batch in open_part(path)[1]:
+                writer.write_table(pa.Table.from_batches([batch]).cast(schema))
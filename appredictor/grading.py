@@ -0,0 +1,102 @@
+"""Grade bands for predicted scores.
+
+A ``GradingScheme`` maps scores to labels with one ``np.searchsorted`` over
+the whole array instead of calling a Python function per row, and returns
+a pandas Categorical (one small integer code per row) instead of an object
+column of strings.
+
+The apps use different bands, all defined here: ``DASHBOARD_GRADES``
+(cobadashboard.py), ``APP_CATEGORIES`` (app.py) and, for the pass/fail
+classifier of appcoba.py, ``PASS_RISK_BANDS`` over the pass probability
+(in %) plus ``pass_fail_status(threshold)`` for the predicted status.
+"""
+import numpy as np
+
+# pandas is only imported when grades are built, so importing the schemes
+# (and appredictor.core) does not load it on the apps' light pages
+
+
+class GradingScheme:
+    """Score bands given by ascending lower ``edges``.
+
+    ``labels[0]`` covers scores below ``edges[0]``, ``labels[i]`` covers
+    ``edges[i-1] <= score < edges[i]`` and ``labels[-1]`` everything from
+    ``edges[-1]`` up. Instances are callable, so they can be passed as the
+    ``grader`` of the batch functions.
+    """
+
+    def __init__(self, edges, labels):
+        edges = np.asarray(edges, dtype=np.float64)
+        if edges.ndim != 1 or len(labels) != len(edges) + 1:
+            raise ValueError("need exactly one more label than edges")
+        if np.any(np.diff(edges) <= 0):
+            raise ValueError("edges must be strictly increasing")
+        if len(set(labels)) != len(labels):
+            raise ValueError("labels must be unique")
+        self.edges = edges
+        self.labels = list(labels)
+        self._dtype = None
+
+    @property
+    def dtype(self):
+        if self._dtype is None:
+            import pandas as pd
+
+            self._dtype = pd.CategoricalDtype(self.labels, ordered=True)
+        return self._dtype
+
+    def codes(self, scores):
+        """Band index of every score (0 = lowest band)."""
+        scores = np.asarray(scores, dtype=np.float64)
+        codes = np.searchsorted(self.edges, scores, side="right")
+        # The old per-row if/elif chain put NaN in the lowest band
+        codes[np.isnan(scores)] = 0
+        return codes.astype(np.int8 if len(self.labels) < 128 else np.int32)
+
+    def grade(self, scores):
+        """Categorical labels for ``scores``; a Series in gives a Series out."""
+        import pandas as pd
+
+        grades = pd.Categorical.from_codes(self.codes(scores), dtype=self.dtype)
+        if isinstance(scores, pd.Series):
+            return pd.Series(grades, index=scores.index, name=scores.name)
+        return grades
+
+    __call__ = grade
+
+    def label(self, score):
+        """Label of a single score."""
+        return self.labels[int(self.codes([score])[0])]
+
+    def __repr__(self):
+        return f"GradingScheme(edges={self.edges.tolist()}, labels={self.labels})"
+
+
+DASHBOARD_GRADES = GradingScheme([65, 80, 90], ["D", "C", "B", "A"])
+
+APP_CATEGORIES = GradingScheme(
+    [60, 70, 80, 90],
+    [
+        "Needs Improvement (D)",
+        "Average (C)",
+        "Good (B)",
+        "Very Good (B+)",
+        "Excellent (A)",
+    ],
+)
+
+# Risk of failing, by predicted pass probability (%). The logistic model's
+# probabilities are used as they are, so "Rendah" means at least 75% of
+# similar students passed.
+PASS_RISK_BANDS = GradingScheme(
+    [25, 50, 75],
+    ["Sangat Tinggi", "Tinggi", "Sedang", "Rendah"],
+)
+
+PASS_FAIL_LABELS = ["FAIL", "PASS"]
+DEFAULT_PASS_THRESHOLD = 50.0
+
+
+def pass_fail_status(threshold=DEFAULT_PASS_THRESHOLD):
+    """PASS for a pass probability (%) of at least ``threshold``, else FAIL."""
+    return GradingScheme([threshold], PASS_FAIL_LABELS)
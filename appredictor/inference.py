@@ -0,0 +1,194 @@
+"""Fast inference path for StandardScaler + linear model pipelines.
+
+``scaler.transform`` followed by ``model.predict`` spends most of its time
+in sklearn's input validation when scoring a single student. The shipped
+models are all linear, so the whole pipeline can be replayed with a couple
+of NumPy operations on precomputed arrays.
+
+The kernel keeps the exact operation order sklearn uses
+(``X -= mean; X /= scale; X @ coef + intercept``) on a column-major copy
+of the input, so results are bit-for-bit identical to the sklearn pipeline
+fed with a DataFrame. Folding the scaler into the
+coefficients would be slightly cheaper but changes the floating point
+rounding, so it is not done here.
+"""
+import warnings
+
+import numpy as np
+
+
+def _expit(x):
+    # scipy's expit is what sklearn uses; it is imported lazily so that
+    # loading an artifact does not pull in scipy.
+    try:
+        from scipy.special import expit
+    except ImportError:
+        return 1.0 / (1.0 + np.exp(-x))
+    return expit(x)
+
+
+class LinearKernel:
+    """Precompiled scaler + linear model, exposed through ``predict_fast``."""
+
+    def __init__(self, coef, intercept, mean=None, scale=None, classes=None,
+                 feature_names=None):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64)
+        self.intercept = np.asarray(intercept, dtype=np.float64)
+        self.mean = None if mean is None else np.ascontiguousarray(mean, dtype=np.float64)
+        self.scale = None if scale is None else np.ascontiguousarray(scale, dtype=np.float64)
+        self.classes = None if classes is None else np.asarray(classes)
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        self.n_features = self.coef.shape[-1]
+        # Classifiers keep the (n_classes, n_features) layout sklearn uses,
+        # regressors have a flat coefficient vector.
+        self._coef_t = self.coef.T if self.coef.ndim == 2 else self.coef
+
+    @classmethod
+    def from_sklearn(cls, model, scaler=None, feature_names=None):
+        """Build a kernel from fitted sklearn objects."""
+        mean = scale = None
+        if scaler is not None:
+            if getattr(scaler, "with_mean", True):
+                mean = scaler.mean_
+            if getattr(scaler, "with_std", True):
+                scale = scaler.scale_
+        return cls(
+            coef=model.coef_,
+            intercept=model.intercept_,
+            mean=mean,
+            scale=scale,
+            classes=getattr(model, "classes_", None),
+            feature_names=feature_names,
+        )
+
+    @property
+    def is_classifier(self):
+        return self.classes is not None
+
+    def _as_matrix(self, X):
+        # Always copy: the scaling below works in place. Column-major order
+        # matches what sklearn gets from a DataFrame, and the BLAS result of
+        # the matrix product depends on the memory layout.
+        X = np.array(X, dtype=np.float64, order="F")
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected {self.n_features} features, got {X.shape[1]}"
+            )
+        return X
+
+    def decision_function(self, X):
+        """Raw linear output for each row of ``X``."""
+        X = self._as_matrix(X)
+        if self.mean is not None:
+            X -= self.mean
+        if self.scale is not None:
+            X /= self.scale
+        scores = X @ self._coef_t + self.intercept
+        if scores.ndim > 1 and scores.shape[1] == 1:
+            scores = scores.reshape(-1)
+        return scores
+
+    def predict_fast(self, X):
+        """Predict scores (regression) or class labels (classification)."""
+        scores = self.decision_function(X)
+        if not self.is_classifier:
+            return scores
+        if scores.ndim == 1:
+            return self.classes[(scores > 0).astype(np.intp)]
+        return self.classes[np.argmax(scores, axis=1)]
+
+    def predict_proba_fast(self, X):
+        """Class probabilities, binary classifiers only."""
+        if not self.is_classifier:
+            raise AttributeError("predict_proba_fast is only available for classifiers")
+        scores = self.decision_function(X)
+        if scores.ndim != 1:
+            raise ValueError("predict_proba_fast only supports binary classifiers")
+        prob = _expit(scores)
+        return np.stack([1 - prob, prob], axis=1)
+
+
+class SklearnPipeline:
+    """Fallback with the same interface, calling sklearn directly."""
+
+    def __init__(self, model, scaler=None, feature_names=None):
+        self.model = model
+        self.scaler = scaler
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        self.classes = getattr(model, "classes_", None)
+
+    @property
+    def is_classifier(self):
+        return self.classes is not None
+
+    def _transform(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if self.feature_names is not None:
+            import pandas as pd
+            X = pd.DataFrame(X, columns=self.feature_names)
+        return self.scaler.transform(X) if self.scaler is not None else X
+
+    def decision_function(self, X):
+        return self.model.decision_function(self._transform(X))
+
+    def predict_fast(self, X):
+        return self.model.predict(self._transform(X))
+
+    def predict_proba_fast(self, X):
+        return self.model.predict_proba(self._transform(X))
+
+
+def _probe_matrix(kernel, n_rows=256, seed=0):
+    rng = np.random.default_rng(seed)
+    center = kernel.mean if kernel.mean is not None else np.zeros(kernel.n_features)
+    spread = kernel.scale if kernel.scale is not None else np.ones(kernel.n_features)
+    return center + rng.standard_normal((n_rows, kernel.n_features)) * 3 * spread
+
+
+def verify_kernel(kernel, model, scaler=None, X=None):
+    """Check that the kernel reproduces the sklearn pipeline bit for bit."""
+    if X is None:
+        X = _probe_matrix(kernel)
+    X = np.asarray(X, dtype=np.float64)
+    # Score both the whole matrix and a single row, the two shapes the apps
+    # use. Each shape goes through its own transform, as it does in the apps.
+    for X_part in (X, X[:1]):
+        if kernel.feature_names is not None:
+            import pandas as pd
+            X_in = pd.DataFrame(X_part, columns=kernel.feature_names)
+        else:
+            X_in = X_part
+        X_scaled = scaler.transform(X_in) if scaler is not None else X_in
+        if not np.array_equal(kernel.predict_fast(X_part), model.predict(X_scaled)):
+            return False
+        if kernel.is_classifier and hasattr(model, "predict_proba"):
+            if not np.array_equal(kernel.predict_proba_fast(X_part),
+                                  model.predict_proba(X_scaled)):
+                return False
+    return True
+
+
+def compile_linear_pipeline(model, scaler=None, feature_names=None, verify=True):
+    """Return a ``predict_fast`` kernel for a fitted scaler + linear model.
+
+    Models that are not plain linear models, or whose kernel output does not
+    match sklearn exactly, get the sklearn-backed fallback instead.
+    """
+    if not (hasattr(model, "coef_") and hasattr(model, "intercept_")):
+        return SklearnPipeline(model, scaler, feature_names)
+    kernel = LinearKernel.from_sklearn(model, scaler, feature_names)
+    if verify:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            ok = verify_kernel(kernel, model, scaler)
+        if not ok:
+            warnings.warn(
+                "Fast linear kernel does not match sklearn exactly, "
+                "falling back to the sklearn pipeline"
+            )
+            return SklearnPipeline(model, scaler, feature_names)
+    return kernel
@@ -0,0 +1,187 @@
+"""Reading batch inputs: CSV (also compressed), Parquet and Arrow IPC.
+
+The format is taken from the file name (``x.csv.gz``, ``x.parquet``,
+``x.feather``). A bare compression suffix (``x.gz``, ``x.zip``) is read
+as compressed CSV. Reads can be limited to some columns, so a wide upload
+only materializes the model's features plus the passthrough columns the
+caller asked for, and the feature columns are parsed straight to float64
+instead of going through pandas' type inference. float64 is what the
+compiled kernel computes in; reading float32 would change the scores.
+``iter_frames`` can also read every other column as text, so all chunks of
+a file have the same dtypes: inferred per chunk, a column that is empty in
+the first chunk would come out as float64 there and as text later on.
+
+Sources are paths or binary file objects (a Streamlit upload); file
+objects are rewound before every read. pyarrow is imported only for the
+columnar formats.
+"""
+import os
+
+import numpy as np
+
+FEATURE_DTYPE = np.float64
+# Nullable string dtype; unlike object columns it stays a string column in
+# Arrow when a chunk holds only missing values
+TEXT_DTYPE = "string"
+
+INPUT_FORMATS = ("csv", "parquet", "arrow")
+
+# Compression suffixes and their pandas compression names; the uploader
+# only sees the last extension, so "x.gz" is compressed CSV like "x.csv.gz"
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".zip": "zip",
+    ".xz": "xz",
+    ".zst": "zstd",
+}
+# File name endings of compressed CSV
+CSV_COMPRESSIONS = {".csv" + suffix: c for suffix, c in COMPRESSION_SUFFIXES.items()}
+PARQUET_SUFFIXES = (".parquet", ".pq")
+ARROW_SUFFIXES = (".feather", ".arrow", ".ipc")
+
+# For st.file_uploader(type=...), which matches on the last extension
+UPLOAD_TYPES = ["csv", "gz", "bz2", "zip", "xz", "zst", "parquet", "pq", "feather", "arrow"]
+
+
+def source_name(source, name=None):
+    if name is not None:
+        return name
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    return getattr(source, "name", "") or ""
+
+
+def detect_format(name):
+    """``(format, compression)`` of a file name, e.g. ``("csv", "gzip")``."""
+    lower = name.lower()
+    if lower.endswith(PARQUET_SUFFIXES):
+        return "parquet", None
+    if lower.endswith(ARROW_SUFFIXES):
+        return "arrow", None
+    for suffix, compression in COMPRESSION_SUFFIXES.items():
+        if lower.endswith(suffix):
+            return "csv", compression
+    return "csv", None
+
+
+def is_splittable(name):
+    """True for plain CSV, which ``appredictor.parallel`` can split by byte range."""
+    return detect_format(name) == ("csv", None)
+
+
+def _rewind(source):
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def _float_dtypes(columns, float_columns):
+    return {c: FEATURE_DTYPE for c in float_columns if columns is None or c in columns}
+
+
+def _text_dtypes(source, name, columns, float_columns):
+    columns = columns if columns is not None else read_columns(source, name)
+    return {c: TEXT_DTYPE for c in columns if c not in set(float_columns)}
+
+
+def _to_frame(table, float_columns, text=False):
+    if text:
+        import pandas as pd
+        import pyarrow as pa
+
+        text_types = {pa.string(): pd.StringDtype(), pa.large_string(): pd.StringDtype()}
+        df = table.to_pandas(types_mapper=text_types.get)
+    else:
+        df = table.to_pandas()
+    casts = {c: FEATURE_DTYPE for c in float_columns
+             if c in df and df[c].dtype != FEATURE_DTYPE}
+    return df.astype(casts) if casts else df
+
+
+def read_columns(source, name=None):
+    """Column names of the file, without reading its rows."""
+    fmt, compression = detect_format(source_name(source, name))
+    if fmt == "csv":
+        import pandas as pd
+
+        columns = list(pd.read_csv(_rewind(source), nrows=0, compression=compression).columns)
+    elif fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        columns = pq.ParquetFile(_rewind(source)).schema_arrow.names
+    else:
+        import pyarrow as pa
+
+        columns = pa.ipc.open_file(_rewind(source)).schema.names
+    _rewind(source)
+    return columns
+
+
+def read_frame(source, name=None, columns=None, float_columns=(), nrows=None):
+    """The file as one DataFrame; ``columns=None`` reads every column.
+
+    ``float_columns`` are parsed as float64. With ``nrows`` only the first
+    rows are read (for a preview).
+    """
+    fmt, compression = detect_format(source_name(source, name))
+    _rewind(source)
+    if fmt == "csv":
+        import pandas as pd
+
+        df = pd.read_csv(source, usecols=columns, nrows=nrows, compression=compression,
+                         dtype=_float_dtypes(columns, float_columns))
+    elif nrows is not None:
+        df = next(iter_frames(source, name, columns, float_columns, chunksize=nrows), None)
+        if df is None:
+            import pandas as pd
+
+            df = pd.DataFrame(columns=read_columns(source, name))
+        df = df.head(nrows)
+    elif fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        df = _to_frame(pq.read_table(source, columns=columns), float_columns)
+    else:
+        import pyarrow.feather as feather
+
+        df = _to_frame(feather.read_table(source, columns=columns), float_columns)
+    _rewind(source)
+    return df
+
+
+def iter_frames(source, name=None, columns=None, float_columns=(), chunksize=50_000,
+                text=False):
+    """DataFrames of about ``chunksize`` rows (Arrow IPC: one per record batch).
+
+    With ``text`` the columns other than ``float_columns`` are read with
+    ``TEXT_DTYPE`` (string columns of a columnar file keep their own type
+    otherwise), so every chunk has the dtypes of the first one.
+    """
+    fmt, compression = detect_format(source_name(source, name))
+    _rewind(source)
+    if fmt == "csv":
+        import pandas as pd
+
+        dtypes = _float_dtypes(columns, float_columns)
+        if text:
+            # Reading the header rewinds the source again
+            dtypes.update(_text_dtypes(source, name, columns, float_columns))
+        with pd.read_csv(source, usecols=columns, chunksize=chunksize, compression=compression,
+                         dtype=dtypes) as reader:
+            yield from reader
+    elif fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize, columns=columns):
+            yield _to_frame(pa.Table.from_batches([batch]), float_columns, text)
+    else:
+        import pyarrow as pa
+
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(columns)
+            yield _to_frame(pa.Table.from_batches([batch]), float_columns, text)
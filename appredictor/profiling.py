@@ -0,0 +1,214 @@
+"""Opt-in profiling of Streamlit script reruns.
+
+Switched on by the server admin with the environment variable
+``APPREDICTOR_PROFILE``: ``1`` profiles every rerun of every session,
+``query`` only the sessions opened with ``?profile=1`` in the URL. Without
+the variable the query parameter is ignored, so visitors cannot make the
+server write profiles. The app script then calls
+``run_profiled(__file__)``, which executes the script again under
+``cProfile`` and saves, per rerun:
+
+- ``<dir>/<page>/<time>_<ms>ms.txt``: top functions by cumulative time
+- ``<dir>/<page>/<time>_<ms>ms.prof``: raw stats (``snakeviz``, ``pstats``)
+- ``<dir>/<page>/cumulative.txt``: top functions over all reruns of the page
+- ``<dir>/reruns.jsonl``: one line per rerun with its duration
+
+Reruns slower than ``APPREDICTOR_PROFILE_SLOW_MS`` (default 500 ms) get
+``_SLOW`` in their file name, ``"slow": true`` in the index and a logged
+warning. ``<dir>`` is ``APPREDICTOR_PROFILE_DIR`` or a folder in the
+system temp directory. Only the newest ``APPREDICTOR_PROFILE_KEEP``
+(default 50) reruns of a page keep their ``.txt``/``.prof`` files; the
+page shows the file name, not its path on the server.
+
+Only full script reruns are profiled; a fragment rerun only runs the
+fragment function. cProfile can only profile one thread at a time, so
+while one rerun is being profiled, concurrent reruns run unprofiled.
+"""
+import cProfile
+import datetime
+import io
+import json
+import logging
+import os
+import pstats
+import re
+import runpy
+import tempfile
+import threading
+import time
+
+ENV_FLAG = "APPREDICTOR_PROFILE"
+ENV_DIR = "APPREDICTOR_PROFILE_DIR"
+ENV_SLOW_MS = "APPREDICTOR_PROFILE_SLOW_MS"
+ENV_KEEP = "APPREDICTOR_PROFILE_KEEP"
+QUERY_PARAM = "profile"
+# ENV_FLAG value that leaves profiling to ?profile=1
+QUERY_MODE = "query"
+
+DEFAULT_SLOW_MS = 500
+DEFAULT_KEEP = 50
+DEFAULT_TOP = 30
+
+logger = logging.getLogger(__name__)
+
+_state = threading.local()
+_profiler_lock = threading.Lock()
+_cumulative = {}
+_cumulative_lock = threading.Lock()
+
+
+def profile_dir():
+    return os.environ.get(ENV_DIR) or os.path.join(tempfile.gettempdir(), "appredictor_profiles")
+
+
+def slow_threshold_ms():
+    try:
+        return float(os.environ.get(ENV_SLOW_MS, DEFAULT_SLOW_MS))
+    except ValueError:
+        return DEFAULT_SLOW_MS
+
+
+def keep_reruns():
+    try:
+        return max(int(os.environ.get(ENV_KEEP, DEFAULT_KEEP)), 1)
+    except ValueError:
+        return DEFAULT_KEEP
+
+
+def profiling_requested():
+    """True when this rerun should be profiled (and is not already inside one)."""
+    if getattr(_state, "active", False):
+        return False
+    mode = os.environ.get(ENV_FLAG, "")
+    if mode in ("", "0"):
+        return False
+    if mode != QUERY_MODE:
+        return True
+    import streamlit as st
+
+    return st.query_params.get(QUERY_PARAM) == "1"
+
+
+def label_rerun(label):
+    """Name the page being rendered; profiles are grouped by it."""
+    if getattr(_state, "active", False):
+        _state.label = str(label)
+
+
+def run_profiled(script_path):
+    """Run the app script under cProfile; the caller should ``st.stop()`` after.
+
+    Returns the index record of the rerun, or None when another rerun was
+    already being profiled.
+    """
+    if not _profiler_lock.acquire(blocking=False):
+        _run_script(script_path)
+        return None
+    profiler = cProfile.Profile()
+    _state.label = os.path.splitext(os.path.basename(script_path))[0]
+    start = time.perf_counter()
+    error = None
+    try:
+        profiler.enable()
+        try:
+            _run_script(script_path)
+        finally:
+            profiler.disable()
+    except BaseException as e:
+        # Includes Streamlit's rerun/stop control-flow exceptions
+        error = type(e).__name__
+        raise
+    finally:
+        _profiler_lock.release()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        record = save_profile(profiler, _state.label, elapsed_ms, error)
+    _show_summary(record)
+    return record
+
+
+def _run_script(script_path):
+    _state.active = True
+    try:
+        runpy.run_path(script_path, run_name="__main__")
+    finally:
+        _state.active = False
+
+
+def _slug(label):
+    return re.sub(r"[^0-9A-Za-z_-]+", "_", label).strip("_") or "page"
+
+
+def _top_functions(stats, top):
+    out = io.StringIO()
+    stats.stream = out
+    stats.sort_stats("cumulative").print_stats(top)
+    return out.getvalue()
+
+
+def _prune(page_dir, keep):
+    """Delete the profile files of all but the newest ``keep`` reruns of a page."""
+    # File names start with the time, so they sort by age
+    reruns = sorted({name.rsplit(".", 1)[0] for name in os.listdir(page_dir)
+                     if name.endswith((".prof", ".txt")) and name != "cumulative.txt"})
+    for base in reruns[:-keep]:
+        for suffix in (".prof", ".txt"):
+            try:
+                os.remove(os.path.join(page_dir, base + suffix))
+            except FileNotFoundError:
+                pass
+
+
+def save_profile(profiler, label, elapsed_ms, error=None, top=DEFAULT_TOP):
+    """Write the profile files of one rerun and return its index record."""
+    slow = elapsed_ms > slow_threshold_ms()
+    page_dir = os.path.join(profile_dir(), _slug(label))
+    os.makedirs(page_dir, exist_ok=True)
+    now = datetime.datetime.now()
+    base = os.path.join(
+        page_dir,
+        f"{now:%Y%m%d-%H%M%S-%f}_{elapsed_ms:.0f}ms{'_SLOW' if slow else ''}",
+    )
+
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(base + ".prof")
+    with open(base + ".txt", "w") as f:
+        f.write(f"# {label}: {elapsed_ms:.1f} ms{' (SLOW)' if slow else ''}\n")
+        f.write(_top_functions(stats, top))
+
+    with _cumulative_lock:
+        if label in _cumulative:
+            _cumulative[label].add(stats)
+        else:
+            _cumulative[label] = stats
+        total = _cumulative[label]
+        total.reruns = getattr(total, "reruns", 0) + 1
+        with open(os.path.join(page_dir, "cumulative.txt"), "w") as f:
+            f.write(f"# {label}: {total.reruns} reruns\n")
+            f.write(_top_functions(total, top))
+
+    record = {
+        "time": now.isoformat(timespec="milliseconds"),
+        "page": label,
+        "ms": round(elapsed_ms, 1),
+        "slow": slow,
+        "error": error,
+        "profile": base + ".txt",
+    }
+    with open(os.path.join(profile_dir(), "reruns.jsonl"), "a") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    _prune(page_dir, keep_reruns())
+    if slow:
+        logger.warning("Slow rerun of %s: %.0f ms (profile: %s)", label, elapsed_ms, base + ".txt")
+    return record
+
+
+def _show_summary(record):
+    import streamlit as st
+
+    # Only the file name: the server's directory layout is not the visitor's business
+    name = os.path.basename(record["profile"])
+    if record["slow"]:
+        st.warning(f"🐢 Rerun {record['page']}: {record['ms']:.0f} ms "
+                   f"(> {slow_threshold_ms():.0f} ms) • profil: {name}")
+    else:
+        st.caption(f"⏱️ Rerun {record['page']}: {record['ms']:.0f} ms • profil: {name}")
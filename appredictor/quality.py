@@ -0,0 +1,216 @@
+"""Data-quality profile of a batch input, built in one pass.
+
+The batch page used to scan an upload several times before scoring it:
+``df.isnull().sum().sum()``, ``df.duplicated().sum()`` (which hashes every
+column of every row) and later ``X.median()`` for the missing values. A
+``DataProfile`` collects all of that while going over the data once, chunk
+by chunk, so it also works for files that are streamed:
+
+- missing values, over all columns read and per feature
+- duplicate rows, judged on the feature columns only (one 64-bit hash per
+  row instead of comparing every column)
+- per feature: min, max, mean, median and values outside a plausible range
+
+The median is exact as long as every value of a feature fits in the
+sample (``sample_size``, or all values with ``sample_size=None``);
+beyond that it is estimated from a uniform random sample of the values.
+``medians()`` is meant to be passed as ``fill_values`` to ``score_frame``.
+
+Duplicates are found through the set of distinct row hashes seen so far,
+kept as a sorted array of at most ``hash_cap`` hashes (8 bytes each), so a
+streamed file does not hold one hash per row. Once the set is full, new
+distinct rows are no longer added: a later repeat of such a row is missed
+and ``duplicate_rows`` becomes a lower bound (``duplicates_exact`` is
+False). Repeats within one chunk are always counted.
+
+``finish()`` settles the results and frees the row hashes and sampled
+values, so a finished profile can be kept next to a stored result.
+"""
+import numpy as np
+
+DEFAULT_SAMPLE_SIZE = 100_000
+# Distinct row hashes kept for the duplicate count: 8 MB
+DEFAULT_HASH_CAP = 1_000_000
+
+# Fixed, so repeated profiles of a file agree. Not 0: synthetic test data
+# drawn with default_rng(0) would correlate with the sampling keys.
+SAMPLE_SEED = 0x5EED
+
+# Plausible ranges by feature name, the widest the input forms allow
+PLAUSIBLE_RANGES = (
+    ("Persentase", 0.0, 100.0),
+    ("Kehadiran", 0.0, 100.0),
+    ("Nilai_Internal", 0.0, 40.0),
+    ("Skor", 0.0, 100.0),
+    ("Jam", 0.0, 24.0),
+)
+
+
+def plausible_range(feature):
+    """``(low, high)`` for a feature name; unknown features only must not be negative."""
+    for pattern, low, high in PLAUSIBLE_RANGES:
+        if pattern in feature:
+            return low, high
+    return 0.0, np.inf
+
+
+class _FeatureStats:
+    def __init__(self, low, high, sample_size, rng):
+        self.low = low
+        self.high = high
+        self.sample_size = sample_size
+        self.rng = rng
+        self.count = 0
+        self.nulls = 0
+        self.total = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.out_of_range = 0
+        self._values = []
+        self._priorities = np.empty(0)
+        self._median = None
+
+    def update(self, values):
+        valid = values[~np.isnan(values)]
+        self.nulls += len(values) - len(valid)
+        if not len(valid):
+            return
+        self.count += len(valid)
+        self.total += valid.sum()
+        self.min = min(self.min, valid.min())
+        self.max = max(self.max, valid.max())
+        self.out_of_range += int(np.count_nonzero((valid < self.low) | (valid > self.high)))
+        self._median = None
+        if self.sample_size is None:
+            self._values.append(valid)
+            return
+        # Bottom-k sampling: keep the values with the k smallest random keys,
+        # a uniform sample over everything seen so far
+        values = np.concatenate(self._values + [valid])
+        priorities = np.concatenate([self._priorities, self.rng.random(len(valid))])
+        if len(values) > self.sample_size:
+            keep = np.argpartition(priorities, self.sample_size)[:self.sample_size]
+            values, priorities = values[keep], priorities[keep]
+        self._values, self._priorities = [values], priorities
+
+    @property
+    def exact(self):
+        return self.sample_size is None or self.count <= self.sample_size
+
+    def median(self):
+        if self._median is None:
+            self._median = (float(np.median(np.concatenate(self._values)))
+                            if self.count else float("nan"))
+        return self._median
+
+    def finish(self):
+        self.median()
+        self._values = self._priorities = None
+
+    def mean(self):
+        return self.total / self.count if self.count else float("nan")
+
+
+class DataProfile:
+    """Running data-quality statistics; feed chunks with ``update``."""
+
+    def __init__(self, feature_names, ranges=None, sample_size=DEFAULT_SAMPLE_SIZE,
+                 seed=SAMPLE_SEED, hash_cap=DEFAULT_HASH_CAP):
+        ranges = ranges or {}
+        rng = np.random.default_rng(seed)
+        self.feature_names = list(feature_names)
+        self.rows = 0
+        self.null_count = 0
+        self.columns = None
+        self.features = {
+            f: _FeatureStats(*ranges.get(f, plausible_range(f)), sample_size, rng)
+            for f in self.feature_names
+        }
+        self.hash_cap = hash_cap
+        self.duplicate_rows = 0
+        self.duplicates_exact = True
+        self._hashes = np.empty(0, np.uint64)  # sorted distinct row hashes
+
+    def update(self, chunk):
+        """Add one DataFrame chunk (before missing values are filled)."""
+        import pandas as pd
+
+        if self._hashes is None:
+            raise RuntimeError("the profile is finished")
+        if self.columns is None:
+            self.columns = list(chunk.columns)
+        self.rows += len(chunk)
+        self.null_count += int(chunk.isna().to_numpy().sum())
+        # Features missing from the file keep empty statistics; the page
+        # reports them as missing columns
+        X = chunk[[f for f in self.feature_names if f in chunk.columns]]
+        for name in X.columns:
+            self.features[name].update(X[name].to_numpy(dtype=np.float64))
+        self._count_duplicates(pd.util.hash_pandas_object(X, index=False).to_numpy())
+        return self
+
+    def _count_duplicates(self, hashes):
+        """Count the rows of ``hashes`` whose hash was seen before (in or before the chunk)."""
+        distinct, counts = np.unique(hashes, return_counts=True)
+        positions = np.searchsorted(self._hashes, distinct)
+        seen = positions < len(self._hashes)
+        seen[seen] = self._hashes[positions[seen]] == distinct[seen]
+        # All rows of a hash seen in earlier chunks are duplicates, else all but one
+        self.duplicate_rows += int(counts[seen].sum() + (counts[~seen] - 1).sum())
+        new, positions = distinct[~seen], positions[~seen]
+        if self.hash_cap is not None:
+            room = max(self.hash_cap - len(self._hashes), 0)
+            if len(new) > room:
+                self.duplicates_exact = False
+                new, positions = new[:room], positions[:room]
+        self._hashes = np.insert(self._hashes, positions, new)
+
+    def finish(self):
+        """Settle the medians and free the row hashes and sampled values."""
+        self._hashes = None
+        for stats in self.features.values():
+            stats.finish()
+        return self
+
+    @property
+    def feature_nulls(self):
+        return sum(stats.nulls for stats in self.features.values())
+
+    @property
+    def out_of_range(self):
+        return sum(stats.out_of_range for stats in self.features.values())
+
+    def medians(self):
+        """Median (or its estimate) of every feature, for ``fillna``."""
+        return {name: stats.median() for name, stats in self.features.items()}
+
+    def table(self, labels=None):
+        """Per-feature statistics as a DataFrame, for display."""
+        import pandas as pd
+
+        labels = labels or {}
+        return pd.DataFrame(
+            [
+                {
+                    "Fitur": labels.get(name, name),
+                    "Kosong": stats.nulls,
+                    "Min": stats.min if stats.count else np.nan,
+                    "Maks": stats.max if stats.count else np.nan,
+                    "Rata-rata": stats.mean(),
+                    "Median": stats.median(),
+                    "Median pasti": stats.exact,
+                    "Rentang wajar": f"{stats.low:g} - {stats.high:g}",
+                    "Di luar rentang": stats.out_of_range,
+                }
+                for name, stats in self.features.items()
+            ]
+        )
+
+
+def profile_frame(df, feature_names, ranges=None, sample_size=None):
+    """Profile of a DataFrame that is fully in memory (exact medians and duplicates).
+
+    The hash set is not capped; it is smaller than ``df`` itself.
+    """
+    return DataProfile(feature_names, ranges=ranges, sample_size=sample_size,
+                       hash_cap=None).update(df).finish()
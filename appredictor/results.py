@@ -0,0 +1,216 @@
+"""Server-side store for scored batch results.
+
+The batch page used to score an upload inside ``if st.button(...)``, so the
+next interaction (a download, a toggle) threw the results away. Results are
+now stored under a key made from the content hash of the upload and the
+artifact version, and every later render reads them back from here.
+
+Scored DataFrames are kept in memory up to a byte budget; older ones are
+spilled to a pickle file in the store's directory and loaded back on
+demand. Result files written by the streaming path (see ``new_file_path``)
+are owned by the store and deleted when their entry is evicted.
+
+pandas is imported when a spilled frame is read back, so importing the
+store does not load it.
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 32
+
+
+def content_hash(source, block_size=1 << 20):
+    """sha256 of a path, bytes or a seekable file object (rewound afterwards)."""
+    h = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        h.update(source)
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                h.update(block)
+    else:
+        source.seek(0)
+        for block in iter(lambda: source.read(block_size), b""):
+            h.update(block)
+        source.seek(0)
+    return h.hexdigest()
+
+
+@dataclass
+class StoredResult:
+    key: tuple
+    frame: object = None  # pandas DataFrame
+    meta: dict = field(default_factory=dict)
+    files: list = field(default_factory=list)
+    nbytes: int = 0
+    spill_path: str = None
+
+    @property
+    def in_memory(self):
+        return self.frame is not None
+
+
+class ResultStore:
+    """Thread-safe LRU store of scored results, shared by all sessions."""
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, max_entries=DEFAULT_MAX_ENTRIES,
+                 directory=None):
+        self.memory_budget = memory_budget
+        self.max_entries = max_entries
+        self.directory = directory or tempfile.mkdtemp(prefix="appredictor_results_")
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.spills = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._counter = 0
+
+    def new_file_path(self, suffix=".csv"):
+        """A fresh path inside the store directory for a result file."""
+        with self._lock:
+            self._counter += 1
+            return os.path.join(self.directory, f"result_{self._counter:06d}{suffix}")
+
+    def put(self, key, frame=None, files=(), **meta):
+        """Store a result; replaces any previous entry with the same key."""
+        entry = StoredResult(
+            key=key,
+            frame=frame,
+            meta=meta,
+            files=list(files),
+            nbytes=int(frame.memory_usage(deep=True).sum()) if frame is not None else 0,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._enforce_limits()
+        return entry
+
+    def get(self, key):
+        """The stored result for ``key`` (loading a spilled frame), or None.
+
+        The frame is shared with other sessions and must not be modified.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            if entry.frame is None and entry.spill_path is not None:
+                import pandas as pd
+
+                entry.frame = pd.read_pickle(entry.spill_path)
+                self._enforce_limits()
+            # A copy, so a later spill does not take the frame away from the caller
+            return replace(entry)
+
+    def result_file(self, key, suffix, write):
+        """Path of the ``suffix`` file of ``key``, created by ``write(path)`` on first use.
+
+        The file is owned by the entry like the files passed to ``put``.
+        Returns None when ``key`` is not stored. ``write`` runs without the
+        store lock, so other sessions are not blocked while a large export
+        is written; if the entry is evicted meanwhile, or another session
+        attached the same file first, the new file is deleted.
+        """
+        with self._lock:
+            existing = self._existing_file(key, suffix)
+            if existing is not None or key not in self._entries:
+                return existing
+            path = self.new_file_path(suffix)
+        try:
+            write(path)
+        except BaseException:
+            _remove_file(path)
+            raise
+        with self._lock:
+            existing = self._existing_file(key, suffix)
+            if existing is not None or key not in self._entries:
+                _remove_file(path)
+                return existing
+            self._entries[key].files.append(path)
+            return path
+
+    def _existing_file(self, key, suffix):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        for path in entry.files:
+            if path.endswith(suffix):
+                return path
+        return None
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def discard(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def close(self):
+        self.clear()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "in_memory": sum(e.in_memory for e in self._entries.values()),
+                "memory_bytes": self._memory_bytes(),
+                "memory_budget": self.memory_budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "spills": self.spills,
+            }
+
+    def _memory_bytes(self):
+        return sum(e.nbytes for e in self._entries.values() if e.in_memory)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        for path in entry.files + ([entry.spill_path] if entry.spill_path else []):
+            _remove_file(path)
+
+    def _enforce_limits(self):
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+        # Spill least recently used frames; the newest entry always stays
+        # in memory, even when it alone exceeds the budget
+        for key in list(self._entries)[:-1]:
+            if self._memory_bytes() <= self.memory_budget:
+                break
+            entry = self._entries[key]
+            if not entry.in_memory:
+                continue
+            if entry.spill_path is None:
+                entry.spill_path = self.new_file_path(".pkl")
+                entry.frame.to_pickle(entry.spill_path)
+            entry.frame = None
+            self.spills += 1
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
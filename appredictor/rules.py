@@ -0,0 +1,81 @@
+"""Academic rule engine.
+
+The rules cap the raw model output based on the student's internal test
+scores, attendance and assignment score, then clip to the 0-100 range:
+
+- min(Nilai_Internal_1, Nilai_Internal_2) < 15  -> max 69 (Python ``min``
+  semantics for missing values, see ``apply_academic_rules``)
+- min(Nilai_Internal_1, Nilai_Internal_2) < 20  -> max 79
+- not (min internal >= 25 and kehadiran >= 85 and skor tugas >= 75) -> max 89
+
+Everything works on whole NumPy columns at once so the batch page and the
+single-student page share exactly the same code path.
+"""
+import numpy as np
+
+RULE_COLUMNS = (
+    "Nilai_Internal_1",
+    "Nilai_Internal_2",
+    "Persentase_Kehadiran",
+    "Skor_Tugas",
+)
+
+# Syarat minimum untuk boleh mendapat nilai A (>= 90)
+GRADE_A_MIN_INTERNAL = 25
+GRADE_A_MIN_KEHADIRAN = 85
+GRADE_A_MIN_SKOR_TUGAS = 75
+
+
+def academic_caps(min_internal, kehadiran, skor_tugas):
+    """Return the per-row upper bound imposed by the academic rules."""
+    min_internal = np.asarray(min_internal, dtype=np.float64)
+    kehadiran = np.asarray(kehadiran, dtype=np.float64)
+    skor_tugas = np.asarray(skor_tugas, dtype=np.float64)
+
+    eligible_a = (
+        (min_internal >= GRADE_A_MIN_INTERNAL)
+        & (kehadiran >= GRADE_A_MIN_KEHADIRAN)
+        & (skor_tugas >= GRADE_A_MIN_SKOR_TUGAS)
+    )
+    # np.select picks the first matching condition, same as the if/elif chain
+    return np.select(
+        [min_internal < 15, min_internal < 20, ~eligible_a],
+        [69.0, 79.0, 89.0],
+        default=np.inf,
+    )
+
+
+def apply_academic_rules(predictions, nilai_internal_1, nilai_internal_2,
+                         kehadiran, skor_tugas):
+    """Cap raw predictions with the academic rules and clip to 0-100."""
+    predictions = np.asarray(predictions, dtype=np.float64)
+    nilai_internal_1 = np.asarray(nilai_internal_1, dtype=np.float64)
+    nilai_internal_2 = np.asarray(nilai_internal_2, dtype=np.float64)
+    # Python's min(a, b): a unless b < a. Unlike np.minimum, a NaN in the
+    # second test keeps the first one, so its cap still applies
+    min_internal = np.where(nilai_internal_2 < nilai_internal_1, nilai_internal_2,
+                            nilai_internal_1)
+    capped = np.minimum(predictions, academic_caps(min_internal, kehadiran, skor_tugas))
+    return np.clip(capped, 0, 100)
+
+
+def rule_inputs(data, n_rows):
+    """Pull the rule columns out of a DataFrame or dict of inputs.
+
+    Missing columns default to 0, like ``row.get(column, 0)`` did in the
+    old per-row loop.
+    """
+    columns = []
+    for name in RULE_COLUMNS:
+        if name in data:
+            values = np.asarray(data[name], dtype=np.float64)
+        else:
+            values = np.zeros(n_rows)
+        columns.append(np.broadcast_to(values, (n_rows,)))
+    return columns
+
+
+def apply_academic_rules_to(predictions, data):
+    """Apply the academic rules using columns looked up by name in ``data``."""
+    predictions = np.atleast_1d(np.asarray(predictions, dtype=np.float64))
+    return apply_academic_rules(predictions, *rule_inputs(data, len(predictions)))
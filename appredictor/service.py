@@ -0,0 +1,287 @@
+"""HTTP JSON prediction service, as a plain ASGI application.
+
+Routes:
+
+- ``GET /health``: artifact version and the expected input fields
+- ``POST /predict``: one student, e.g. ``{"Nilai_Internal_1": 22, ...}``
+- ``POST /predict/batch``: ``{"records": [{...}, {...}]}``, scored in one call
+- ``GET /metrics``: request and micro-batching counters
+- ``GET /metrics/prometheus``: per-stage timings in the Prometheus text format
+
+Single-student requests are not scored one by one. A ``MicroBatcher``
+collects the ones that arrive within ``max_wait`` seconds of each other
+(up to ``max_batch``) and scores them with one vectorized
+``Predictor.predict_records`` call, like the batch page does for a CSV.
+As on the batch page, a score can differ from a one-row prediction in the
+last bit of the float.
+
+A response has the ``score`` plus the profile's grade and, when the
+profile has one, its status, keyed by the lower-cased column names (for
+the ``kelulusan`` profile: the pass probability, ``risk_band`` and
+``predicted_status`` PASS/FAIL).
+
+The app has no framework dependency; run it with any ASGI server, e.g.
+``python serve.py`` (uvicorn).
+"""
+import asyncio
+import json
+import math
+import time
+
+import numpy as np
+
+from appredictor.core import FeatureValidationError
+from appredictor.dispatch import BatchStats, resolve_futures
+from appredictor.timing import TimingRegistry
+from appredictor.rules import RULE_COLUMNS
+
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_WAIT = 0.002
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+
+class RequestError(Exception):
+    """Client error, turned into a JSON response with ``status``."""
+
+    def __init__(self, status, message, **extra):
+        super().__init__(message)
+        self.status = status
+        self.body = {"error": message, **extra}
+
+
+class MicroBatcher:
+    """Coalesces concurrent single-record predictions into one call.
+
+    ``score`` gets a list of records and returns one result per record;
+    any other number of results fails every request of that batch.
+    It runs on the event loop: a batch of a few dozen rows takes
+    microseconds, less than a hop to a worker thread would.
+    """
+
+    def __init__(self, score, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.score = score
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.stats = BatchStats()
+        self._queue = None
+        self._task = None
+
+    async def submit(self, record):
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((record, future))
+        return await future
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        # Requests cancelled while waiting (client went away) are dropped
+        batch = [(record, future) for record, future in batch if not future.done()]
+        if not batch:
+            return
+        self.stats.record(len(batch))
+        resolve_futures(self.score, batch)
+
+    def metrics(self):
+        return {
+            **self.stats.snapshot(),
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+class PredictionService:
+    """ASGI app serving one ``Predictor``."""
+
+    def __init__(self, predictor, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT,
+                 timings=None):
+        self.predictor = predictor
+        self.batcher = MicroBatcher(self.score_records, max_batch=max_batch, max_wait=max_wait)
+        self.timings = timings or TimingRegistry()
+        self.requests = 0
+        self.errors = 0
+        self.started = time.time()
+        self._routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/metrics"): self.metrics,
+            ("GET", "/metrics/prometheus"): self.prometheus,
+            ("POST", "/predict"): self.predict,
+            ("POST", "/predict/batch"): self.predict_batch,
+        }
+
+    # ASGI entry point
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        self.requests += 1
+        try:
+            handler = self._routes.get((scope["method"], scope["path"]))
+            if handler is None:
+                if any(path == scope["path"] for _, path in self._routes):
+                    raise RequestError(405, "method not allowed")
+                raise RequestError(404, "not found")
+            status, body = 200, await handler(await self._read_body(receive))
+        except RequestError as e:
+            self.errors += 1
+            status, body = e.status, e.body
+        except Exception as e:
+            self.errors += 1
+            status, body = 500, {"error": f"{type(e).__name__}: {e}"}
+        await self._send(send, status, body)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.batcher.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _read_body(self, receive):
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise RequestError(400, "client disconnected")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise RequestError(413, f"request body larger than {MAX_BODY_BYTES} bytes")
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _send(send, status, body):
+        # Handlers return a dict (JSON) or plain text
+        if isinstance(body, str):
+            payload, content_type = body.encode(), b"text/plain; version=0.0.4"
+        else:
+            payload, content_type = json.dumps(body).encode(), b"application/json"
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", content_type),
+                (b"content-length", str(len(payload)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": payload})
+
+    def _parse(self, body):
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise RequestError(400, "body is not valid JSON")
+
+    def _check_record(self, record):
+        if not isinstance(record, dict):
+            raise RequestError(422, "a record must be a JSON object")
+        try:
+            self.predictor.validate(record)
+        except FeatureValidationError as e:
+            raise RequestError(422, str(e), missing=e.missing)
+        rule_columns = list(RULE_COLUMNS) if self.predictor.apply_rules else []
+        for name in self.predictor.feature_names + rule_columns:
+            value = record.get(name, 0)
+            if (isinstance(value, bool) or not isinstance(value, (int, float))
+                    or not math.isfinite(value)):
+                raise RequestError(422, f"'{name}' must be a finite number")
+        return record
+
+    def score_records(self, records):
+        """Score, grade and (if the profile has a status) classify records in one call."""
+        predictor = self.predictor
+        scores = predictor.predict_records(records)
+        results = [{"score": float(s)} for s in scores]
+        for scheme, column in ((predictor.grading, predictor.grade_column),
+                               (predictor.status, predictor.status_column)):
+            if scheme is None:
+                continue
+            labels = np.asarray(scheme.labels, dtype=object)[scheme.codes(scores)]
+            for result, label in zip(results, labels):
+                result[column.lower()] = label
+        return results
+
+    async def health(self, body):
+        return {
+            "status": "ok",
+            "version": self.predictor.version,
+            "features": self.predictor.feature_names,
+            "rule_columns": list(RULE_COLUMNS) if self.predictor.apply_rules else [],
+            "uptime_s": time.time() - self.started,
+        }
+
+    async def metrics(self, body):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "micro_batching": self.batcher.metrics(),
+        }
+
+    async def prometheus(self, body):
+        return self.timings.prometheus_text()
+
+    async def predict(self, body):
+        with self.timings.run("http_predict", rows=1) as timer:
+            with timer.stage("validate", 1):
+                record = self._check_record(self._parse(body))
+            # Queue wait plus the batched model call
+            with timer.stage("batched_predict", 1):
+                return await self.batcher.submit(record)
+
+    async def predict_batch(self, body):
+        with self.timings.run("http_predict_batch") as timer:
+            with timer.stage("parse"):
+                payload = self._parse(body)
+            records = payload.get("records") if isinstance(payload, dict) else payload
+            if not isinstance(records, list):
+                raise RequestError(422, "expected {\"records\": [...]} or a JSON list")
+            timer.rows = len(records)
+            with timer.stage("validate", len(records)):
+                for index, record in enumerate(records):
+                    try:
+                        self._check_record(record)
+                    except RequestError as e:
+                        e.body["index"] = index
+                        raise
+            with timer.stage("score", len(records)):
+                return {"predictions": self.score_records(records) if records else []}
+
+
+def create_app(predictor, max_batch=DEFAULT_MAX_BATCH, max_wait=DEFAULT_MAX_WAIT):
+    return PredictionService(predictor, max_batch=max_batch, max_wait=max_wait)
@@ -0,0 +1,96 @@
+"""Stylesheets and HTML cards shared by the Streamlit apps.
+
+Each app used to send its whole ``<style>`` block (2-9 KB) through
+``st.markdown`` at the top of every rerun, and the dashboard built its
+stat cards from f-strings with every style inline. The stylesheets now
+live in ``static/`` at the repository root:
+
+- ``dashboard.css`` (cobadashboard.py and dashboard_pages/)
+- ``app.css`` (app.py)
+- ``appcoba.css`` (appcoba.py)
+
+With ``server.enableStaticServing`` (set in ``.streamlit/config.toml``)
+Streamlit serves them at ``app/static/<name>`` and ``apply_theme`` only
+sends a ``<link>`` tag per rerun. Its ``?v=`` query is a hash of the file,
+so the browser reuses its copy until the stylesheet changes. When static
+serving is off, or the running script has no ``static/`` folder next to
+it (the ``V2/`` entry point), the stylesheet is inlined as before.
+
+``stat_card`` and ``metric_card`` return the card markup; the looks come
+from classes in the stylesheet, so a card costs a few hundred bytes.
+"""
+import functools
+import hashlib
+import html
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(ROOT, "static")
+# Relative, so it also works behind server.baseUrlPath and on page URLs
+STATIC_URL = "./app/static"
+
+# Card colors, as CSS classes (see dashboard.css)
+STAT_CARD_VARIANTS = ("purple", "pink", "blue", "green", "sunset")
+METRIC_CARD_ACCENTS = ("purple", "pink", "blue", "green")
+
+
+@functools.lru_cache(maxsize=16)
+def _load(path, mtime_ns):
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    return text, hashlib.sha256(text.encode()).hexdigest()[:12]
+
+
+def stylesheet(name):
+    """``(css, version)`` of a stylesheet in ``static/``; reread when the file changes."""
+    path = os.path.join(STATIC_DIR, name)
+    return _load(path, os.stat(path).st_mtime_ns)
+
+
+def static_serving_active():
+    """True if Streamlit serves this repository's ``static/`` folder."""
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None or not st.get_option("server.enableStaticServing"):
+        return False
+    served = os.path.join(os.path.dirname(os.path.abspath(ctx.main_script_path)), "static")
+    return os.path.realpath(served) == os.path.realpath(STATIC_DIR)
+
+
+def theme_markup(name, linked=None):
+    """``<link>`` to the stylesheet, or the whole ``<style>`` block if it is not served."""
+    css, version = stylesheet(name)
+    if linked is None:
+        linked = static_serving_active()
+    if linked:
+        return f'<link rel="stylesheet" href="{STATIC_URL}/{name}?v={version}">'
+    return f"<style>\n{css}</style>"
+
+
+def apply_theme(name):
+    """Load a stylesheet from ``static/``; call once per rerun, near the top of the app."""
+    import streamlit as st
+
+    st.markdown(theme_markup(name), unsafe_allow_html=True)
+
+
+def stat_card(icon, value, label, variant="purple"):
+    """Gradient card with an icon, a big value and a label."""
+    return (f"<div class='stat-card {variant}'><div class='card-icon'>{icon}</div>"
+            f"<h2>{html.escape(str(value))}</h2><p>{html.escape(label)}</p></div>")
+
+
+def metric_card(icon, title, value, caption, accent="purple"):
+    """White card with an icon, a colored title, a big value and a caption."""
+    return (f"<div class='metric-card'><div class='card-icon'>{icon}</div>"
+            f"<h3 class='card-title {accent}'>{html.escape(title)}</h3>"
+            f"<h1 class='card-value'>{html.escape(str(value))}</h1>"
+            f"<p class='card-caption'>{html.escape(caption)}</p></div>")
+
+
+def render_card(card):
+    import streamlit as st
+
+    st.markdown(card, unsafe_allow_html=True)
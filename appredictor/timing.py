@@ -0,0 +1,199 @@
+"""Per-stage timings of predictions and batch runs.
+
+A run (one batch upload, one single prediction, ...) is timed stage by
+stage with a ``RunTimer``:
+
+    with registry.run("batch_full") as timer:
+        with timer.stage("read_csv"):
+            df = pd.read_csv(file)
+        timer.rows = len(df)
+        predictor.score_frame(df, timer=timer)
+
+Stages entered more than once in a run (e.g. once per chunk) are summed.
+The ``TimingRegistry`` keeps totals per operation and stage plus the most
+recent runs, renders them in the Prometheus text exposition format and can
+mirror that text to a file for a node_exporter textfile collector.
+
+Code that may or may not be timed takes ``timer=NULL_TIMER``, which
+records nothing.
+"""
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+DEFAULT_RECENT_RUNS = 50
+METRIC_PREFIX = "appredictor"
+
+
+class RunTimer:
+    """Stage durations and row counts of one run."""
+
+    def __init__(self, operation, registry=None, rows=None):
+        self.operation = operation
+        self.registry = registry
+        self.rows = rows
+        self.started = time.time()
+        self.total = None
+        self.error = None
+        self.stages = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, rows)
+
+    def add(self, name, seconds, rows=None):
+        """Add a stage measured elsewhere (e.g. in a worker process)."""
+        entry = self.stages.setdefault(name, {"seconds": 0.0, "rows": 0, "calls": 0})
+        entry["seconds"] += seconds
+        entry["rows"] += rows or 0
+        entry["calls"] += 1
+
+    def finish(self, error=None):
+        if self.total is None:
+            self.total = time.perf_counter() - self._start
+            self.error = error
+            if self.registry is not None:
+                self.registry.record(self)
+        return self
+
+    def as_dict(self):
+        return {
+            "operation": self.operation,
+            "started": self.started,
+            "total_s": self.total,
+            "rows": self.rows,
+            "error": self.error,
+            "stages": {name: dict(entry) for name, entry in self.stages.items()},
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.finish(error=exc_type.__name__ if exc_type else None)
+        return False
+
+
+class _NullTimer:
+    rows = None
+
+    def stage(self, name, rows=None):
+        return nullcontext()
+
+    def add(self, name, seconds, rows=None):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class TimingRegistry:
+    """Thread-safe totals and recent runs, shared by all sessions."""
+
+    def __init__(self, recent=DEFAULT_RECENT_RUNS, textfile=None):
+        self.textfile = textfile
+        self._recent = deque(maxlen=recent)
+        self._runs = {}
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def run(self, operation, rows=None):
+        return RunTimer(operation, registry=self, rows=rows)
+
+    def record(self, timer):
+        with self._lock:
+            run = self._runs.setdefault(
+                timer.operation,
+                {"count": 0, "errors": 0, "seconds": 0.0, "rows": 0, "last_seconds": 0.0},
+            )
+            run["count"] += 1
+            run["errors"] += timer.error is not None
+            run["seconds"] += timer.total
+            run["rows"] += timer.rows or 0
+            run["last_seconds"] = timer.total
+            for name, entry in timer.stages.items():
+                total = self._stages.setdefault(
+                    (timer.operation, name), {"seconds": 0.0, "rows": 0, "calls": 0}
+                )
+                for field in total:
+                    total[field] += entry[field]
+            self._recent.append(timer.as_dict())
+        if self.textfile:
+            self.write_textfile(self.textfile)
+
+    def recent_runs(self, operation=None):
+        """Most recent runs first."""
+        with self._lock:
+            runs = list(self._recent)
+        return [r for r in reversed(runs) if operation in (None, r["operation"])]
+
+    def stage_totals(self):
+        with self._lock:
+            return [
+                {"operation": op, "stage": stage, **dict(entry)}
+                for (op, stage), entry in self._stages.items()
+            ]
+
+    def reset(self):
+        with self._lock:
+            self._recent.clear()
+            self._runs.clear()
+            self._stages.clear()
+
+    def prometheus_text(self, prefix=METRIC_PREFIX):
+        """Totals in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            runs = {op: dict(entry) for op, entry in self._runs.items()}
+            stages = {key: dict(entry) for key, entry in self._stages.items()}
+
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f"{prefix}_{name}{{{label_text}}} {value:.9g}")
+
+        family("runs_total", "counter", "Completed runs.",
+               [({"operation": op}, r["count"]) for op, r in runs.items()])
+        family("run_errors_total", "counter", "Runs that raised an exception.",
+               [({"operation": op}, r["errors"]) for op, r in runs.items()])
+        family("run_seconds_total", "counter", "Wall time spent in runs.",
+               [({"operation": op}, r["seconds"]) for op, r in runs.items()])
+        family("run_rows_total", "counter", "Rows processed by runs.",
+               [({"operation": op}, r["rows"]) for op, r in runs.items()])
+        family("last_run_seconds", "gauge", "Duration of the most recent run.",
+               [({"operation": op}, r["last_seconds"]) for op, r in runs.items()])
+        family("stage_seconds_total", "counter", "Wall time spent per stage.",
+               [({"operation": op, "stage": st}, s["seconds"]) for (op, st), s in stages.items()])
+        family("stage_rows_total", "counter", "Rows processed per stage.",
+               [({"operation": op, "stage": st}, s["rows"]) for (op, st), s in stages.items()])
+        family("stage_calls_total", "counter", "Times a stage was entered.",
+               [({"operation": op, "stage": st}, s["calls"]) for (op, st), s in stages.items()])
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """Write ``prometheus_text`` atomically, for a textfile collector."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.prometheus_text())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,157 @@
+"""Paged viewer for large scored results.
+
+``st.dataframe(frame)`` sends every row to the browser, which stalls on a
+few hundred thousand rows. ``render_result_viewer`` keeps the frame on the
+server and only sends the page being looked at. Filtering by grade and
+score range, sorting and paging happen on the server.
+
+``query_window`` does the work without Streamlit:
+
+- the grade filter compares the small integer codes of the Categorical
+  grade column
+- for sorting, only the rows up to the end of the requested page are
+  ordered (``argpartition`` first), not the whole filtered column
+- only the rows of the window are copied out of the frame
+"""
+import math
+
+import numpy as np
+
+PAGE_SIZES = [25, 50, 100, 250, 500]
+DEFAULT_PAGE_SIZE = 50
+
+
+def filter_positions(frame, score_column, grade_column=None, grades=None, score_range=None):
+    """Row positions that pass the grade and score filters (None: no filter)."""
+    mask = np.ones(len(frame), dtype=bool)
+    if score_range is not None:
+        scores = frame[score_column].to_numpy(dtype=np.float64)
+        low, high = score_range
+        mask &= (scores >= low) & (scores <= high)
+    if grade_column is not None and grades is not None:
+        column = frame[grade_column]
+        if hasattr(column, "cat"):
+            wanted = [i for i, c in enumerate(column.cat.categories) if c in set(grades)]
+            mask &= np.isin(column.cat.codes.to_numpy(), wanted)
+        else:
+            mask &= column.isin(grades).to_numpy()
+    return np.flatnonzero(mask)
+
+
+def _sort_key(frame, column, positions, ascending):
+    values = frame[column]
+    if hasattr(values, "cat"):
+        key = values.cat.codes.to_numpy()[positions].astype(np.float64)
+        key[key < 0] = np.nan
+    else:
+        key = values.to_numpy(dtype=np.float64)[positions]
+    if not ascending:
+        key = -key
+    # Missing values go last in both directions
+    return np.where(np.isnan(key), np.inf, key)
+
+
+def query_window(frame, score_column, grade_column=None, grades=None, score_range=None,
+                 sort_by=None, ascending=True, page=1, page_size=DEFAULT_PAGE_SIZE):
+    """One page of the filtered, sorted frame and the number of matching rows.
+
+    The returned rows keep the original index, so row numbers stay
+    meaningful. ``page`` starts at 1 and is clamped to the last page.
+    """
+    positions = filter_positions(frame, score_column, grade_column, grades, score_range)
+    matches = len(positions)
+    pages = max(math.ceil(matches / page_size), 1)
+    page = min(max(int(page), 1), pages)
+    start = (page - 1) * page_size
+    end = min(start + page_size, matches)
+    if sort_by is not None and matches:
+        key = _sort_key(frame, sort_by, positions, ascending)
+        if end < matches:
+            head = np.argpartition(key, end - 1)[:end]
+        else:
+            head = np.arange(matches)
+        order = head[np.argsort(key[head], kind="stable")]
+        positions = positions[order]
+    return frame.iloc[positions[start:end]], matches
+
+
+def render_result_viewer(frame, key, score_column, grade_column=None, labels=None):
+    """Paged viewer of ``frame`` with grade/score filters and sorting.
+
+    Runs as a fragment: its widgets rerun only the viewer, not the page.
+    """
+    import streamlit as st
+
+    _viewer_fragment(st)(frame, key, score_column, grade_column, labels or {})
+
+
+_fragment = None
+
+
+def _viewer_fragment(st):
+    global _fragment
+    if _fragment is None:
+        _fragment = st.fragment(_render_viewer)
+    return _fragment
+
+
+def _render_viewer(frame, key, score_column, grade_column, labels):
+    import streamlit as st
+
+    page_key = f"{key}_page"
+
+    def reset_page():
+        st.session_state[page_key] = 1
+
+    grades = None
+    col1, col2 = st.columns(2)
+    if grade_column is not None:
+        column = frame[grade_column]
+        options = (list(column.cat.categories) if hasattr(column, "cat")
+                   else sorted(column.dropna().unique()))
+        with col1:
+            grades = st.multiselect(labels.get("grade", "🏷️ Filter grade"), options,
+                                    default=options, key=f"{key}_grades", on_change=reset_page)
+    with col2:
+        score_range = st.slider(labels.get("score", "🎯 Rentang nilai"), 0.0, 100.0,
+                                (0.0, 100.0), step=0.5, key=f"{key}_scores",
+                                on_change=reset_page)
+
+    from pandas.api.types import is_numeric_dtype
+
+    numeric = [c for c in frame.columns if c == grade_column or is_numeric_dtype(frame[c])]
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        sort_by = st.selectbox("↕️ Urutkan berdasarkan", ["(urutan file)"] + numeric,
+                               key=f"{key}_sort", on_change=reset_page)
+    with col2:
+        descending = st.toggle("Menurun", value=True, key=f"{key}_desc", on_change=reset_page)
+    with col3:
+        page_size = st.selectbox("Baris per halaman", PAGE_SIZES,
+                                 index=PAGE_SIZES.index(DEFAULT_PAGE_SIZE),
+                                 key=f"{key}_size", on_change=reset_page)
+
+    if score_range == (0.0, 100.0):
+        score_range = None
+    if grades is not None and len(grades) == len(options):
+        grades = None
+
+    page = st.session_state.get(page_key, 1)
+    window, matches = query_window(
+        frame, score_column, grade_column,
+        grades=grades,
+        score_range=score_range,
+        sort_by=None if sort_by == "(urutan file)" else sort_by,
+        ascending=not descending,
+        page=page,
+        page_size=page_size,
+    )
+    pages = max(math.ceil(matches / page_size), 1)
+    if page > pages:
+        st.session_state[page_key] = page = pages
+    st.number_input(f"Halaman (dari {pages:,})", min_value=1, max_value=pages, step=1,
+                    key=page_key)
+
+    st.dataframe(window, use_container_width=True)
+    st.caption(f"{matches:,} dari {len(frame):,} baris cocok • halaman {page:,} dari {pages:,} • "
+               f"hanya {len(window):,} baris yang dikirim ke browser")
@@ -0,0 +1,162 @@
+"""Cold-start benchmark for the Streamlit apps.
+
+Measures, each in a fresh Python process:
+
+1. the import time of the heavy modules the apps may use, on top of
+   ``import streamlit`` (which every app pays anyway);
+2. the time of the first script run of an app, and the time of the first
+   render of every page in a process where only the default page has run
+   before. The modules loaded at that point are listed as well.
+
+Run from the repository root:
+    python benchmarks/cold_start.py
+    python benchmarks/cold_start.py --apps cobadashboard.py --repeat 5 --json cold_start.json
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "numpy",
+    "pandas",
+    "pyarrow",
+    "plotly.express",
+    "plotly.graph_objects",
+    "scipy.special",
+    "joblib",
+    "sklearn.linear_model",
+]
+
+TRACKED = ["pandas", "pyarrow", "plotly", "scipy", "sklearn", "joblib"]
+
+APPS = ["cobadashboard.py", "app.py", "appcoba.py"]
+
+_IMPORT_SNIPPET = """
+import time, warnings
+warnings.filterwarnings("ignore")
+import streamlit
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+_PAGE_SNIPPET = """
+import glob, json, logging, os, sys, time, warnings
+warnings.filterwarnings("ignore")
+logging.disable(logging.WARNING)
+from streamlit.testing.v1 import AppTest
+
+app, page = sys.argv[1], sys.argv[2]
+os.chdir(os.path.dirname(app))
+at = AppTest.from_file(app, default_timeout=120)
+start = time.perf_counter()
+at.run()
+first_run = time.perf_counter() - start
+loaded_first = [m for m in {tracked!r} if m in sys.modules]
+# st.navigation apps list their pages as page links; the others use a sidebar radio
+links = {{link.proto.label: link.proto.page for link in at.get("page_link")}}
+if links:
+    pages = list(links)
+else:
+    pages = [str(o) for o in at.sidebar.radio[0].options] if at.sidebar.radio else []
+page_time = None
+if page != "-":
+    if links and links[page]:
+        # The URL path of a page is its file name, e.g. dashboard_pages/visualisasi.py
+        path = glob.glob(os.path.join("**", links[page] + ".py"), recursive=True)[0]
+        at.switch_page(path)
+    elif not links:
+        at.sidebar.radio[0].set_value(page)
+    # else: the default page, which the first run showed; render it again
+    start = time.perf_counter()
+    at.run()
+    page_time = time.perf_counter() - start
+tracked = {tracked!r}
+print(json.dumps({{
+    "first_run": first_run,
+    "page_time": page_time,
+    "pages": pages,
+    "loaded_first_run": loaded_first,
+    "exceptions": [str(e.value) for e in at.exception],
+    "loaded": [m for m in tracked if m in sys.modules],
+}}))
+"""
+
+
+def _run(code, *args):
+    out = subprocess.run(
+        [sys.executable, "-c", code, *args],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return out.stdout.strip().splitlines()[-1]
+
+
+def measure_imports(repeat):
+    results = {}
+    for module in MODULES:
+        times = [float(_run(_IMPORT_SNIPPET.format(module=module))) for _ in range(repeat)]
+        results[module] = statistics.median(times)
+    return results
+
+
+def measure_app(app, repeat):
+    app_path = os.path.join(ROOT, app)
+    snippet = _PAGE_SNIPPET.format(tracked=TRACKED)
+    probe = json.loads(_run(snippet, app_path, "-"))
+    pages = probe["pages"] or ["-"]
+    results = []
+    for page in pages:
+        runs = [json.loads(_run(snippet, app_path, page)) for _ in range(repeat)]
+        results.append({
+            "page": page if page != "-" else "(single page)",
+            "modules_loaded_first_run": runs[-1]["loaded_first_run"],
+            "first_run_s": statistics.median(r["first_run"] for r in runs),
+            "page_render_s": (statistics.median(r["page_time"] for r in runs)
+                              if page != "-" else None),
+            "modules_loaded": runs[-1]["loaded"],
+            "exceptions": runs[-1]["exceptions"],
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold-start benchmark for the Streamlit apps")
+    parser.add_argument("--apps", nargs="*", default=APPS)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Fresh processes per measurement; the median is reported")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = {"imports_s": measure_imports(args.repeat), "apps": {}}
+
+    print("=" * 72)
+    print("IMPORT TIME (fresh process, after `import streamlit`)")
+    print("=" * 72)
+    for module, seconds in report["imports_s"].items():
+        print(f"  {module:<24} {seconds * 1000:8.1f} ms")
+
+    for app in args.apps:
+        results = measure_app(app, args.repeat)
+        report["apps"][app] = results
+        print("=" * 72)
+        print(f"{app}: first run {results[0]['first_run_s'] * 1000:.0f} ms (default page), "
+              f"loaded: {', '.join(results[0]['modules_loaded_first_run']) or '-'}")
+        print("=" * 72)
+        for r in results:
+            page_ms = f"{r['page_render_s'] * 1000:8.0f} ms" if r["page_render_s"] is not None else "       -"
+            flag = "  ❌ " + "; ".join(r["exceptions"]) if r["exceptions"] else ""
+            print(f"  {r['page']:<32} {page_ms}   loaded: {', '.join(r['modules_loaded']) or '-'}{flag}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""Load test for the HTTP prediction service (serve.py).
+
+Starts ``serve.py`` on a free localhost port (or uses a running one with
+``--url``), then keeps ``--concurrency`` keep-alive connections busy
+sending ``POST /predict`` (or ``/predict/batch`` with ``--batch-size``)
+requests with random student records. Reports requests per second, the
+p50/p99 latency and the micro-batch sizes the server saw.
+
+The client only uses asyncio streams, so the numbers are not skewed by an
+HTTP library.
+
+Run from the repository root:
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --concurrency 64 --requests 20000 --max-wait-ms 5
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --json load.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Connection:
+    """Minimal HTTP/1.1 keep-alive client for JSON requests."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def open(self):
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method, path, body=None):
+        payload = b"" if body is None else json.dumps(body).encode()
+        head = (
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n\r\n"
+        )
+        self.writer.write(head.encode() + payload)
+        await self.writer.drain()
+        status_line, *header_lines = (
+            (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        )
+        headers = dict(
+            line.split(":", 1) for line in header_lines if ":" in line
+        )
+        length = int({k.lower(): v for k, v in headers.items()}.get("content-length", 0))
+        data = await self.reader.readexactly(length)
+        return int(status_line.split()[1]), json.loads(data) if data else None
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def random_record(fields, rng):
+    record = {}
+    for name in fields:
+        if "Internal" in name:
+            record[name] = round(rng.uniform(5, 30), 1)
+        elif "Jam" in name:
+            record[name] = round(rng.uniform(0, 8), 1)
+        else:
+            record[name] = round(rng.uniform(40, 100), 1)
+    return record
+
+
+async def run_load(host, port, concurrency, total, batch_size, seed):
+    probe = Connection(host, port)
+    await probe.open()
+    _, health = await probe.request("GET", "/health")
+    fields = list(dict.fromkeys(health["features"] + health["rule_columns"]))
+
+    rng = random.Random(seed)
+    records = [random_record(fields, rng) for _ in range(1024)]
+    remaining = [total]
+    latencies, failures = [], [0]
+
+    async def client(index):
+        conn = Connection(host, port)
+        await conn.open()
+        i = index
+        while remaining[0] > 0:
+            remaining[0] -= 1
+            if batch_size:
+                path = "/predict/batch"
+                body = {"records": [records[(i + k) % len(records)] for k in range(batch_size)]}
+            else:
+                path, body = "/predict", records[i % len(records)]
+            i += concurrency
+            start = time.perf_counter()
+            status, _ = await conn.request("POST", path, body)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                failures[0] += 1
+        await conn.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    _, metrics = await probe.request("GET", "/metrics")
+    await probe.close()
+
+    latencies.sort()
+    n = len(latencies)
+    return {
+        "requests": n,
+        "failed": failures[0],
+        "concurrency": concurrency,
+        "batch_size": batch_size,
+        "elapsed_s": elapsed,
+        "requests_per_s": n / elapsed,
+        "records_per_s": n * (batch_size or 1) / elapsed,
+        "p50_ms": latencies[n // 2] * 1000,
+        "p99_ms": latencies[min(n - 1, int(n * 0.99))] * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "server": metrics,
+    }
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, args):
+    cmd = [
+        sys.executable, os.path.join(ROOT, "serve.py"),
+        "--port", str(port),
+        "--profile", args.profile,
+        "--max-batch", str(args.max_batch),
+        "--max-wait-ms", str(args.max_wait_ms),
+    ]
+    proc = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"serve.py exited with code {proc.returncode}")
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("serve.py did not start within 60 seconds")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test for the HTTP prediction service")
+    parser.add_argument("--url", help="Running service to test (default: start serve.py)")
+    parser.add_argument("--profile", default="dashboard")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=0,
+                        help="Records per request on /predict/batch (default: /predict)")
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Also write the result to this JSON file")
+    args = parser.parse_args(argv)
+
+    proc = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = "127.0.0.1", free_port()
+        proc = start_server(port, args)
+    try:
+        result = asyncio.run(run_load(host, port, args.concurrency, args.requests,
+                                      args.batch_size, args.seed))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    route = f"/predict/batch ({args.batch_size} records)" if args.batch_size else "/predict"
+    batching = result["server"]["micro_batching"]
+    print("=" * 60)
+    print(f"LOAD TEST - {route}, {args.concurrency} connections")
+    print("=" * 60)
+    print(f"  requests      {result['requests']:,} ({result['failed']} failed)")
+    print(f"  throughput    {result['requests_per_s']:,.0f} req/s, "
+          f"{result['records_per_s']:,.0f} records/s")
+    print(f"  p50           {result['p50_ms']:.2f} ms")
+    print(f"  p99           {result['p99_ms']:.2f} ms")
+    print(f"  mean          {result['mean_ms']:.2f} ms")
+    if batching["batches"]:
+        print(f"  micro-batches {batching['batches']:,}, mean size "
+              f"{batching['mean_batch_size']:.1f}, largest {batching['largest_batch']}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Rerun latency of the dashboard's individual prediction page.
+
+Opens "Prediksi Individual", then changes one of the number inputs
+repeatedly and times each resulting rerun, the same work Streamlit does
+for every keystroke-and-blur in the browser. The first interactions warm
+the caches and are discarded.
+
+Works with the single-script layout (page picked with the sidebar radio)
+and the multipage layout (page picked with ``st.navigation``).
+
+Run from the repository root:
+    python benchmarks/rerun_latency.py
+    python benchmarks/rerun_latency.py --interactions 200 --json rerun.json
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGE_LABEL = "🎯 Prediksi Individual"
+PAGE_FILE = "dashboard_pages/prediksi_individual.py"
+
+
+def open_page(at):
+    at.run()
+    if at.sidebar.radio and PAGE_LABEL in at.sidebar.radio[0].options:
+        at.sidebar.radio[0].set_value(PAGE_LABEL).run()
+    else:
+        at.switch_page(PAGE_FILE).run()
+    return at
+
+
+def measure(app, interactions, warmup):
+    from streamlit.testing.v1 import AppTest
+
+    at = open_page(AppTest.from_file(os.path.join(ROOT, app), default_timeout=120))
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    timings = []
+    for i in range(warmup + interactions):
+        widget = at.number_input[0]
+        # Alternate between two values so every run is a real change
+        value = widget.min + (1 if i % 2 else 2) * widget.step
+        start = time.perf_counter()
+        widget.set_value(value).run()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            timings.append(elapsed)
+    return {
+        "app": app,
+        "interactions": interactions,
+        "median_ms": statistics.median(timings) * 1000,
+        "p95_ms": sorted(timings)[int(len(timings) * 0.95) - 1] * 1000,
+        "mean_ms": statistics.fmean(timings) * 1000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rerun latency of the individual prediction page")
+    parser.add_argument("--app", default="cobadashboard.py")
+    parser.add_argument("--interactions", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--json", help="Also write the result to this JSON file")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+    os.chdir(ROOT)
+    result = measure(args.app, args.interactions, args.warmup)
+
+    print("=" * 60)
+    print(f"RERUN LATENCY - {args.app}, {PAGE_LABEL}")
+    print("=" * 60)
+    print(f"  interactions  {result['interactions']}")
+    print(f"  median        {result['median_ms']:.1f} ms")
+    print(f"  p95           {result['p95_ms']:.1f} ms")
+    print(f"  mean          {result['mean_ms']:.1f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,369 @@
+"""Benchmark suite for the prediction hot path.
+
+Areas (pick some with ``--areas``):
+
+- ``load``: ``joblib.load`` of every shipped .pkl, and ``load_artifact``
+  (which reads the .apx export when it is up to date)
+- ``single``: one-row predict through sklearn on a DataFrame, as the pages
+  used to, vs. the compiled kernel on a raw list vs. ``Predictor.predict_one``
+- ``batch``: scale -> predict -> academic rules -> grade on synthetic rows
+  generated from the model's features, through sklearn and through the kernel
+- ``csv``: ``pd.read_csv`` vs. ``Predictor.read_input`` (typed, projected
+  read), ``to_csv`` of a scored file, the Parquet and Arrow IPC writers,
+  and ``stream_score_file`` end to end per input and output format
+- ``charts``: the batch page's score histogram and grade pie built with
+  plotly express from the scored rows vs. from the ``BatchSummary``
+  aggregates, including the size of the figure JSON sent to the browser
+- ``payload``: one rerun of each app page in ``AppTest``, with the
+  stylesheet inlined vs. linked from ``static/`` (``appredictor.theme``);
+  reports the bytes of the elements sent to the browser per rerun
+- ``classify``: the pass/fail model of appcoba.py (``kelulusan`` profile,
+  whatever ``--profile`` says): class and probability from two model calls
+  vs. ``Predictor.classify``, and ``score_frame`` with probability, risk
+  band and PASS/FAIL status
+
+Every measurement is repeated and the median and best times are reported.
+``--json`` writes the results together with the environment (versions,
+CPU count, git commit), and ``--compare`` prints the ratio against an
+earlier JSON file, so runs can be compared over time.
+
+Run from the repository root:
+    python benchmarks/suite.py
+    python benchmarks/suite.py --sizes 1000 100000 --areas single batch
+    python benchmarks/suite.py --json new.json --compare old.json
+"""
+import argparse
+import datetime
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from appredictor.artifacts import load_artifact  # noqa: E402
+from appredictor.core import Predictor  # noqa: E402
+
+AREAS = ["load", "single", "batch", "csv", "charts", "payload", "classify"]
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+DEFAULT_CSV_ROWS = 100_000
+
+# Ratios outside this band are flagged by --compare
+REGRESSION_THRESHOLD = 1.10
+
+
+def _loop(fn, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number
+
+
+def measure(fn, repeat, min_time=0.2):
+    """Median and best seconds per call; fast calls are looped for ``min_time``."""
+    fn()  # warm-up
+    number = 1
+    while _loop(fn, number) * number < min_time:
+        number *= 10
+    times = [_loop(fn, number) for _ in range(repeat)]
+    return {"median_s": statistics.median(times), "best_s": min(times), "loops": number}
+
+
+def synthetic_frame(predictor, n_rows, seed=0):
+    """Plausible inputs: normal around the scaler's training mean, no negatives."""
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    mean = np.asarray(predictor.scaler.mean_)
+    scale = np.asarray(predictor.scaler.scale_)
+    values = np.clip(rng.normal(mean, scale, size=(n_rows, len(mean))), 0, None)
+    return pd.DataFrame(values.round(1), columns=predictor.feature_names)
+
+
+def bench_load(predictor, args):
+    import joblib
+
+    results = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "*.pkl"))):
+        name = os.path.basename(path)
+        results.append({"name": f"joblib.load {name}",
+                        **measure(lambda: joblib.load(path), args.repeat)})
+        data = joblib.load(path)
+        if isinstance(data, dict) and "model" in data:
+            results.append({"name": f"load_artifact {name}",
+                            **measure(lambda: load_artifact(path), args.repeat)})
+    return results
+
+
+def bench_single(predictor, args):
+    import pandas as pd
+
+    features = predictor.feature_names
+    inputs = synthetic_frame(predictor, 1).iloc[0].to_dict()
+    values = [inputs[f] for f in features]
+    model, scaler, fast_model = predictor.model, predictor.scaler, predictor.fast_model
+
+    def sklearn_dataframe():
+        return model.predict(scaler.transform(pd.DataFrame([values], columns=features)))
+
+    return [
+        {"name": "sklearn DataFrame", **measure(sklearn_dataframe, args.repeat)},
+        {"name": "kernel raw list", **measure(lambda: fast_model.predict_fast(values), args.repeat)},
+        {"name": "Predictor.predict_one", **measure(lambda: predictor.predict_one(inputs), args.repeat)},
+    ]
+
+
+def bench_batch(predictor, args):
+    from appredictor.rules import apply_academic_rules_to
+
+    features = predictor.feature_names
+    model, scaler = predictor.model, predictor.scaler
+    results = []
+    for n_rows in args.sizes:
+        df = synthetic_frame(predictor, n_rows)
+
+        def sklearn_path():
+            predictions = model.predict(scaler.transform(df[features]))
+            return predictor.grade(apply_academic_rules_to(predictions, df))
+
+        def kernel_path():
+            return predictor.grade(predictor.predict_scores(df[features], df))
+
+        for name, fn in (("sklearn + rules + grade", sklearn_path),
+                         ("kernel + rules + grade", kernel_path),
+                         ("score_frame", lambda: predictor.score_frame(df.copy()))):
+            timing = measure(fn, args.repeat, min_time=0)
+            results.append({"name": name, "rows": n_rows,
+                            "rows_per_s": n_rows / timing["median_s"], **timing})
+    return results
+
+
+def bench_csv(predictor, args):
+    import pandas as pd
+
+    n_rows = args.csv_rows
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, "input.csv")
+        out_path = os.path.join(tmp, "output.csv")
+        df = synthetic_frame(predictor, n_rows)
+        df.to_csv(raw_path, index=False)
+        parquet_path = os.path.join(tmp, "input.parquet")
+        df.to_parquet(parquet_path)
+        scored = df.copy()
+        predictor.score_frame(scored)
+
+        for name, fn in (
+            ("read_csv", lambda: pd.read_csv(raw_path)),
+            ("read_input csv", lambda: predictor.read_input(raw_path, passthrough=[])),
+            ("read_input parquet", lambda: predictor.read_input(parquet_path, passthrough=[])),
+            ("to_csv scored", lambda: scored.to_csv(out_path, index=False)),
+            ("write_result parquet", lambda: predictor.write_result(scored, out_path, "parquet")),
+            ("write_result arrow", lambda: predictor.write_result(scored, out_path, "arrow")),
+            ("stream_score_file", lambda: predictor.stream_score_file(raw_path, out_path)),
+            ("stream_score_file parquet", lambda: predictor.stream_score_file(
+                raw_path, out_path, output_format="parquet")),
+            ("stream_score_file parquet in", lambda: predictor.stream_score_file(
+                parquet_path, out_path, output_format="parquet")),
+        ):
+            timing = measure(fn, args.repeat, min_time=0)
+            results.append({"name": name, "rows": n_rows,
+                            "rows_per_s": n_rows / timing["median_s"], **timing})
+    return results
+
+
+def bench_charts(predictor, args):
+    import plotly.express as px
+
+    from appredictor.batch import summarize_frame
+    from appredictor.charts import grade_pie, score_histogram
+
+    labels = predictor.grading.labels[::-1]
+    results = []
+    for n_rows in args.sizes:
+        scored = synthetic_frame(predictor, n_rows)
+        predictor.score_frame(scored)
+        score, grade = predictor.score_column, predictor.grade_column
+
+        def from_rows():
+            counts = scored[grade].value_counts()
+            counts = counts[counts > 0]
+            return (px.histogram(scored, x=score, nbins=20).to_json()
+                    + px.pie(values=counts.values, names=counts.index).to_json())
+
+        def from_summary():
+            summary = summarize_frame(scored, score, grade)
+            return (score_histogram(summary, "").to_json()
+                    + grade_pie(summary, labels, "").to_json())
+
+        for name, fn in (("px from rows", from_rows), ("from BatchSummary", from_summary)):
+            timing = measure(fn, args.repeat, min_time=0)
+            results.append({"name": name, "rows": n_rows, "payload_bytes": len(fn()),
+                            "rows_per_s": n_rows / timing["median_s"], **timing})
+    return results
+
+
+# (script, page file for st.navigation or radio option, short name)
+PAYLOAD_PAGES = [
+    ("cobadashboard.py", "dashboard_pages/dashboard.py", "dashboard"),
+    ("cobadashboard.py", "dashboard_pages/visualisasi.py", "dashboard visualisasi"),
+    ("cobadashboard.py", "dashboard_pages/prediksi_batch.py", "dashboard batch"),
+    ("app.py", "📈 Visualisasi Model", "app visualisasi"),
+    ("appcoba.py", None, "appcoba"),
+]
+
+
+def _element_bytes(node):
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if hasattr(proto, "ByteSize") else 0
+    return size + sum(_element_bytes(child) for child in getattr(node, "children", {}).values())
+
+
+def bench_payload(predictor, args):
+    from streamlit import config
+    from streamlit.testing.v1 import AppTest
+
+    results = []
+    for linked in (False, True):
+        config.set_option("server.enableStaticServing", linked)
+        for script, page, name in PAYLOAD_PAGES:
+            at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=120).run()
+            if page is not None and page.endswith(".py"):
+                at.switch_page(page).run()
+            elif page is not None:
+                at.sidebar.radio[0].set_value(page).run()
+            timing = measure(at.run, args.repeat, min_time=0)
+            results.append({"name": f"{name} ({'linked' if linked else 'inline'} css)",
+                            "payload_bytes": _element_bytes(at._tree), **timing})
+    config.set_option("server.enableStaticServing", False)
+    return results
+
+
+def bench_classify(predictor, args):
+    classifier = Predictor.from_profile("kelulusan")
+    results = []
+    for n_rows in args.sizes:
+        df = synthetic_frame(classifier, n_rows)
+        X = df[classifier.feature_names]
+
+        def two_calls():
+            return classifier.predict_labels(X), classifier.predict_proba(X)
+
+        for name, fn in (("predict_labels + predict_proba", two_calls),
+                         ("Predictor.classify", lambda: classifier.classify(X)),
+                         ("score_frame", lambda: classifier.score_frame(df.copy()))):
+            timing = measure(fn, args.repeat, min_time=0)
+            results.append({"name": name, "rows": n_rows,
+                            "rows_per_s": n_rows / timing["median_s"], **timing})
+    return results
+
+
+BENCHMARKS = {
+    "load": bench_load,
+    "single": bench_single,
+    "batch": bench_batch,
+    "csv": bench_csv,
+    "charts": bench_charts,
+    "payload": bench_payload,
+    "classify": bench_classify,
+}
+
+
+def environment():
+    import pandas as pd
+    import sklearn
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def result_key(area, result):
+    return f"{area} | {result['name']} | {result.get('rows', '')}"
+
+
+def format_time(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:9.1f} µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:9.2f} ms"
+    return f"{seconds:9.2f} s "
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite for the prediction hot path")
+    parser.add_argument("--areas", nargs="*", choices=AREAS, default=AREAS)
+    parser.add_argument("--profile", default="dashboard",
+                        help="Predictor profile whose artifact is benchmarked")
+    parser.add_argument("--sizes", nargs="*", type=int, default=DEFAULT_SIZES,
+                        help="Row counts for the batch benchmarks")
+    parser.add_argument("--csv-rows", type=int, default=DEFAULT_CSV_ROWS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Earlier JSON result to compare against")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings("ignore")
+    predictor = Predictor.from_profile(args.profile)
+    report = {"environment": environment(), "profile": args.profile, "results": {}}
+    previous = {}
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+        previous = {
+            result_key(area, r): r["median_s"]
+            for area, results in old["results"].items() for r in results
+        }
+
+    for area in args.areas:
+        results = BENCHMARKS[area](predictor, args)
+        report["results"][area] = results
+        print("=" * 72)
+        print(f"{area.upper()}")
+        print("=" * 72)
+        width = max(len(r["name"]) for r in results)
+        for r in results:
+            rows = f"{r['rows']:>9,} rows" if "rows" in r else " " * 14
+            line = f"  {r['name']:<{width}} {rows} {format_time(r['median_s'])}"
+            if "payload_bytes" in r:
+                line += f" {r['payload_bytes'] / 1024:10,.1f} KiB"
+            old_median = previous.get(result_key(area, r))
+            if old_median:
+                ratio = r["median_s"] / old_median
+                flag = ("⚠️ slower" if ratio > REGRESSION_THRESHOLD
+                        else "✅ faster" if ratio < 1 / REGRESSION_THRESHOLD else "")
+                line += f"  x{ratio:5.2f} {flag}"
+            print(line)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✅ Hasil disimpan ke {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Regression check of columnar batch exports (appredictor/export.py).
+
+Scores a CSV whose text column is empty in the first chunk (and in the
+first partition of a parallel run) to Parquet and Arrow IPC, and compares
+every column with the CSV output of the same file. Exits with status 1 on
+any failure.
+
+    python check_export.py
+"""
+import io
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from appredictor.batch import SCORE_COLUMN
+from appredictor.core import Predictor
+
+
+def sample_file(path, n_rows=3_000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "Persentase_Kehadiran": rng.uniform(50, 100, n_rows).round(1),
+        "Nilai_Internal_1": rng.uniform(0, 40, n_rows).round(1),
+        "Nilai_Internal_2": rng.uniform(0, 40, n_rows).round(1),
+        "Skor_Tugas": rng.uniform(40, 100, n_rows).round(1),
+        "Jam_Belajar_Harian": rng.uniform(0, 8, n_rows).round(1),
+        "NIS": np.arange(n_rows),
+    })
+    # Empty for the whole first half, so also in the first chunks and partitions
+    df["Catatan"] = [None] * (n_rows // 2) + ["remedial", "aktif"] * (n_rows // 4)
+    df.to_csv(path, index=False)
+
+
+def read_output(path, fmt):
+    """The result file as text columns, formatted the way the CSV writer does."""
+    if fmt != "csv":
+        reader = pd.read_parquet if fmt == "parquet" else pd.read_feather
+        path = io.StringIO(reader(path).to_csv(index=False))
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def same_result(actual, expected):
+    """Same columns and text; the score only to float32 precision (see export.py)."""
+    if list(actual.columns) != list(expected.columns):
+        return False
+    scores = [frame.pop(SCORE_COLUMN).astype(np.float64) for frame in (actual, expected)]
+    return actual.equals(expected) and np.allclose(*scores, rtol=1e-6, atol=0)
+
+
+def main():
+    print("=" * 60)
+    print("REGRESSION CHECK - Columnar exports")
+    print("=" * 60)
+
+    predictor = Predictor.from_profile("dashboard")
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "input.csv")
+        sample_file(source)
+        expected_path = os.path.join(tmp, "expected.csv")
+        predictor.stream_score_file(source, expected_path, chunksize=500)
+        expected = read_output(expected_path, "csv")
+
+        runs = {}
+        for fmt in ("parquet", "arrow"):
+            runs[f"stream {fmt}"] = (fmt, lambda out, fmt=fmt: predictor.stream_score_file(
+                source, out, chunksize=500, output_format=fmt))
+            runs[f"parallel {fmt}"] = (fmt, lambda out, fmt=fmt: predictor.parallel_score_csv(
+                source, out, workers=2, chunksize=500, output_format=fmt))
+        for name, (fmt, run) in runs.items():
+            out = os.path.join(tmp, f"out_{name.replace(' ', '_')}.{fmt}")
+            try:
+                run(out)
+                actual = read_output(out, fmt)
+            except Exception as e:
+                failed += 1
+                print(f"❌ {name}: {type(e).__name__}: {e}")
+                continue
+            if same_result(actual, expected.copy()):
+                print(f"✅ {name}: {len(actual):,} rows identical to the CSV output")
+            else:
+                failed += 1
+                print(f"❌ {name}: differs from the CSV output")
+
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -79,4 +79,38 @@ except Exception as e:
     import traceback
     traceback.print_exc()
 
-print("\n" + "=" * 60)
\ No newline at end of file
+print("\n" + "=" * 60)
+
+# Verify the NumPy fast path against sklearn on every shipped artifact
+print("\n⚡ Checking fast inference path (bit-for-bit vs sklearn)...")
+from appredictor.inference import LinearKernel, verify_kernel
+
+fast_path_artifacts = [
+    "academic_predictor_pt6.pkl",
+    "academic_predictor_model_pt5.pkl",
+    "academic_predictor_model_pt3.pkl",
+    "academic_predictor_model_pt2.pkl",
+    "academic_predictor_model.pkl",
+]
+
+for path in fast_path_artifacts:
+    try:
+        artifact = joblib.load(path)
+        kernel = LinearKernel.from_sklearn(
+            artifact["model"], artifact["scaler"], artifact["feature_names"]
+        )
+        X_check = np.random.default_rng(0).uniform(0, 100, (10000, kernel.n_features))
+        ok = verify_kernel(kernel, artifact["model"], artifact["scaler"], X_check)
+        print(f"  {'✅' if ok else '❌'} {path}")
+    except Exception as e:
+        print(f"  ❌ {path}: {e}")
+
+try:
+    kernel = LinearKernel.from_sklearn(model, scaler, list(scaler.feature_names_in_))
+    X_check = np.random.default_rng(0).uniform(0, 100, (10000, kernel.n_features))
+    ok = verify_kernel(kernel, model, scaler, X_check)
+    print(f"  {'✅' if ok else '❌'} model_kelulusan.pkl + scaler_kelulusan.pkl")
+except Exception as e:
+    print(f"  ❌ model_kelulusan.pkl: {e}")
+
+print("\n" + "=" * 60)
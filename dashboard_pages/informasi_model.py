@@ -0,0 +1,142 @@
+import streamlit as st
+
+from dashboard_pages.shared import load_predictor
+
+predictor = load_predictor()
+model = predictor.model
+FEATURES = predictor.feature_names
+metrics = predictor.metrics
+
+# ======================================================
+# INFORMASI MODEL
+# ======================================================
+st.markdown("""
+    <div class='main-header'>
+        <h1>ℹ️ Informasi Model</h1>
+        <p class='header-subtitle'>
+            📚 Detail teknis dan dokumentasi sistem
+        </p>
+    </div>
+""", unsafe_allow_html=True)
+
+# Model information
+st.markdown("### 🤖 Tentang Model")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("""
+        <div class='info-box'>
+            <h4>🔧 Tipe Model:</h4>
+            <ul>
+                <li>📊 Linear Regression</li>
+                <li>🎯 Supervised Learning</li>
+                <li>📈 Regression Task</li>
+            </ul>
+            <h4>📚 Library:</h4>
+            <ul>
+                <li>🔬 Scikit-learn</li>
+                <li>🐼 Pandas</li>
+                <li>🔢 NumPy</li>
+            </ul>
+        </div>
+    """, unsafe_allow_html=True)
+
+with col2:
+    st.markdown(f"""
+        <div class='success-box'>
+            <h4>⚡ Performa:</h4>
+            <ul>
+                <li>🎯 R² Score: {metrics['r2']:.3f}</li>
+                <li>📊 MAE: {metrics['mae']:.2f}</li>
+                <li>📈 RMSE: {metrics['rmse']:.2f}</li>
+            </ul>
+            <h4>🔢 Features:</h4>
+            <ul>
+                <li>📋 Total: {len(FEATURES)} fitur</li>
+            </ul>
+        </div>
+    """, unsafe_allow_html=True)
+
+# Academic rules
+st.markdown("### 📜 Aturan Akademik")
+
+st.markdown("""
+    <div class='warning-box'>
+        <h4>🎓 Sistem Penilaian:</h4>
+        
+        <div class='grade-rule a'>
+            <h5>🌟 Grade A (≥ 90)</h5>
+            <ul>
+                <li>Nilai Internal minimum ≥ 25</li>
+                <li>Kehadiran ≥ 85%</li>
+                <li>Skor Tugas ≥ 75</li>
+            </ul>
+        </div>
+        
+        <div class='grade-rule b'>
+            <h5>👍 Grade B (80-89)</h5>
+            <ul>
+                <li>Nilai Internal minimum ≥ 20</li>
+                <li>Atau tidak memenuhi semua syarat A</li>
+            </ul>
+        </div>
+        
+        <div class='grade-rule c'>
+            <h5>🙂 Grade C (65-79)</h5>
+            <ul>
+                <li>Nilai Internal minimum ≥ 15</li>
+                <li>Atau tidak memenuhi syarat B</li>
+            </ul>
+        </div>
+        
+        <div class='grade-rule d'>
+            <h5>⚠️ Grade D (< 65)</h5>
+            <ul>
+                <li>Nilai Internal minimum < 15</li>
+            </ul>
+        </div>
+    </div>
+""", unsafe_allow_html=True)
+
+# Features list
+st.markdown("### 📋 Daftar Fitur Lengkap")
+
+import pandas as pd
+
+features_detail = pd.DataFrame({
+    "No": range(1, len(FEATURES) + 1),
+    "Nama Fitur": [f"📌 {f.replace('_', ' ')}" for f in FEATURES],
+    "Kode Fitur": FEATURES,
+    "Koefisien": model.coef_,
+    "Pengaruh": ["⬆️ Positif" if c > 0 else "⬇️ Negatif" for c in model.coef_]
+})
+
+st.dataframe(features_detail, use_container_width=True, hide_index=True)
+
+# System requirements
+st.markdown("### 💻 System Requirements")
+
+st.code("""
+Python >= 3.8
+streamlit >= 1.28.0
+pandas >= 1.5.0
+numpy >= 1.24.0
+scikit-learn >= 1.3.0
+plotly >= 5.17.0
+joblib >= 1.3.0
+""", language="text")
+
+# Contact
+st.markdown("### 📧 Support & Feedback")
+
+st.markdown("""
+    <div class='info-box'>
+        <h4>💬 Jika Anda memiliki pertanyaan atau masukan, silakan hubungi:</h4>
+        <ul>
+            <li>📧 Email: support@example.com</li>
+            <li>🌐 Website: https://example.com</li>
+            <li>📱 Phone: +62 XXX-XXXX-XXXX</li>
+        </ul>
+    </div>
+""", unsafe_allow_html=True)
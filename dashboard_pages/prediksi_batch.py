@@ -0,0 +1,525 @@
+import os
+import shutil
+import tempfile
+import time
+
+import streamlit as st
+import pandas as pd
+
+from appredictor.batch import summarize_frame
+from appredictor.charts import grade_pie, score_histogram
+from appredictor.export import FORMATS
+from appredictor.ingest import UPLOAD_TYPES, detect_format, is_splittable, read_columns
+from appredictor.quality import DataProfile, profile_frame
+from appredictor.results import content_hash
+from appredictor.theme import render_card, stat_card
+from appredictor.timing import NULL_TIMER
+from appredictor.viewer import render_result_viewer
+from dashboard_pages.shared import (
+    STREAMING_CHUNKSIZE,
+    STREAMING_THRESHOLD_MB,
+    load_predictor,
+    result_store,
+    timing_registry,
+)
+
+predictor = load_predictor()
+FEATURES = predictor.feature_names
+store = result_store()
+timings = timing_registry()
+
+
+def upload_key(file, mode):
+    """Store key of an upload: scoring mode, content hash and model version."""
+    # Each upload is hashed once per session; file_id changes with every upload
+    hashes = st.session_state.setdefault("upload_hashes", {})
+    if file.file_id not in hashes:
+        hashes[file.file_id] = content_hash(file)
+    return mode, hashes[file.file_id], predictor.version
+
+
+def show_reused(scored_now):
+    if not scored_now:
+        st.info("♻️ Hasil diambil dari penyimpanan server, file tidak diprediksi ulang.")
+
+
+def select_output_format(key):
+    # Parquet/Arrow: skor float32 dan grade sebagai kolom kategorikal
+    return st.selectbox(
+        "📦 Format file hasil",
+        list(FORMATS),
+        format_func=lambda f: FORMATS[f]["label"],
+        key=key,
+        help="Parquet dan Arrow IPC (Feather) lebih kecil dan lebih cepat dibaca oleh tools analitik"
+    )
+
+
+def download_result(path, output_format):
+    info = FORMATS[output_format]
+    with open(path, "rb") as result_file:
+        st.download_button(
+            f"📥 Download Hasil Prediksi ({info['label']})",
+            result_file,
+            f"hasil_prediksi{info['suffix']}",
+            info["mime"],
+            use_container_width=True
+        )
+
+
+def grade_chart(summary):
+    fig_pie = grade_pie(
+        summary,
+        # Grades from A down to D
+        predictor.grading.labels[::-1],
+        "🎯 Distribusi Grade",
+        colors={"A": "#38ef7d", "B": "#00f2fe", "C": "#fee140", "D": "#f7b733"}
+    )
+    fig_pie.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig_pie
+
+
+def duplicates_label(profile):
+    """Duplicate count for display; "≥" when it is only a lower bound."""
+    count = f"{profile.duplicate_rows:,}"
+    return count if profile.duplicates_exact else f"≥ {count}"
+
+
+def render_profile(profile):
+    with st.expander("🔬 Profil Kualitas Data per Fitur"):
+        st.dataframe(profile.table(predictor.feature_labels), use_container_width=True, hide_index=True)
+        st.caption(
+            f"Baris duplikat dihitung dari kolom fitur saja. {profile.out_of_range} nilai "
+            "berada di luar rentang wajar. Median yang tidak pasti adalah perkiraan "
+            "dari sampel acak."
+        )
+        if not profile.duplicates_exact:
+            st.caption(
+                f"Jumlah baris duplikat adalah batas bawah: hanya {profile.hash_cap:,} "
+                "kombinasi fitur unik yang disimpan untuk pembanding."
+            )
+
+
+def render_stream_result(result, timer=NULL_TIMER):
+    summary = result.meta["summary"]
+    st.success(
+        f"✅ Prediksi berhasil! {summary.rows:,} baris dalam {summary.chunks} potongan "
+        f"({summary.elapsed:.1f} detik, {summary.rows_per_second:,.0f} baris/detik)"
+    )
+    if summary.filled_values:
+        st.warning(
+            f"⚠️ {summary.filled_values} nilai kosong diisi dengan rata-rata data latih model."
+        )
+    
+    profile = result.meta.get("profile")
+    if profile is None and result.meta.get("worker_table") is not None:
+        st.info("ℹ️ Profil kualitas data tidak dihitung karena file diproses secara paralel.")
+    if profile is not None:
+        st.markdown("### 🧪 Kualitas Data")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("❓ Missing Values", f"{profile.null_count:,}")
+        col2.metric("🔄 Duplicate Rows", duplicates_label(profile))
+        col3.metric("📏 Di Luar Rentang", f"{profile.out_of_range:,}")
+        render_profile(profile)
+    
+    if result.meta.get("worker_table") is not None:
+        st.markdown("### 🧵 Throughput per Worker")
+        st.dataframe(result.meta["worker_table"], use_container_width=True, hide_index=True)
+    
+    st.markdown("### 📊 Ringkasan Hasil Prediksi")
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("📊 Rata-rata Nilai", f"{summary.mean:.2f}")
+    col2.metric("⬆️ Nilai Tertinggi", f"{summary.score_max:.2f}")
+    col3.metric("⬇️ Nilai Terendah", f"{summary.score_min:.2f}")
+    col4.metric("📈 Std Deviasi", f"{summary.std:.2f}")
+    
+    st.markdown("### 📈 Distribusi Grade")
+    with timer.stage("charts"):
+        st.plotly_chart(grade_chart(summary), use_container_width=True)
+    
+    st.markdown("### 📋 Preview Hasil Prediksi")
+    st.dataframe(summary.preview, use_container_width=True)
+    
+    st.markdown("### ⬇️ Download Hasil")
+    download_result(result.files[0], result.meta["output_format"])
+
+
+def render_full_result(result, timer=NULL_TIMER):
+    frame = result.frame
+    if result.meta.get("filled"):
+        st.warning("⚠️ Terdapat nilai kosong dalam data. Mengisi dengan median...")
+    st.success("✅ Prediksi berhasil!")
+    
+    # Results summary with colorful metrics
+    st.markdown("### 📊 Ringkasan Hasil Prediksi")
+
+    # Statistics and charts come from the summary collected while scoring
+    summary = result.meta["summary"]
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        render_card(stat_card("📊", f"{summary.mean:.2f}", "Rata-rata Nilai", "purple"))
+
+    with col2:
+        render_card(stat_card("⬆️", f"{summary.score_max:.2f}", "Nilai Tertinggi", "green"))
+
+    with col3:
+        render_card(stat_card("⬇️", f"{summary.score_min:.2f}", "Nilai Terendah", "sunset"))
+
+    with col4:
+        render_card(stat_card("📈", f"{summary.std:.2f}", "Std Deviasi", "blue"))
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Grade distribution
+    charts_start = time.perf_counter()
+    st.markdown("### 📈 Distribusi Grade")
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.plotly_chart(grade_chart(summary), use_container_width=True)
+
+    with col2:
+        fig_hist = score_histogram(summary, "📊 Distribusi Nilai Prediksi")
+        fig_hist.update_layout(
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)'
+        )
+        st.plotly_chart(fig_hist, use_container_width=True)
+    timer.add("charts", time.perf_counter() - charts_start)
+
+    # Show results
+    st.markdown("### 📋 Hasil Prediksi Lengkap")
+    # Only the visible page is sent to the browser
+    with timer.stage("results_table", len(frame)):
+        render_result_viewer(frame, "full_result", predictor.score_column, predictor.grade_column)
+
+    # Download results: the CSV is written while scoring, other formats
+    # on first request, and the store keeps them for later downloads
+    st.markdown("### ⬇️ Download Hasil")
+    output_format = select_output_format("full_output_format")
+
+    def write(path):
+        with timer.stage(f"to_{output_format}", len(frame)):
+            predictor.write_result(frame, path, output_format)
+
+    path = store.result_file(result.key, FORMATS[output_format]["suffix"], write)
+    if path is not None:
+        download_result(path, output_format)
+
+
+# ======================================================
+# PREDIKSI BATCH
+# ======================================================
+st.markdown("""
+    <div class='main-header'>
+        <h1>📁 Prediksi Batch (CSV)</h1>
+        <p class='header-subtitle'>
+            📤 Upload file CSV untuk memprediksi nilai banyak siswa sekaligus
+        </p>
+    </div>
+""", unsafe_allow_html=True)
+
+# Instructions
+st.markdown("### 📝 Instruksi Penggunaan")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("""
+        <div class='info-box'>
+            <h4>📄 Format File CSV:</h4>
+            <ul>
+                <li>File berformat .csv (boleh dikompres .gz/.bz2/.zip/.xz/.zst, mis. data.csv.gz atau data.zip), .parquet, atau .feather</li>
+                <li>Harus memiliki kolom sesuai fitur model</li>
+                <li>Pastikan tidak ada nilai kosong (NaN)</li>
+                <li>Gunakan pemisah koma (,)</li>
+            </ul>
+        </div>
+    """, unsafe_allow_html=True)
+
+with col2:
+    st.markdown("""
+        <div class='success-box'>
+            <h4>✅ Fitur yang Diperlukan:</h4>
+            <ul>
+                <li>📝 Nilai_Internal_1, Nilai_Internal_2</li>
+                <li>📚 Skor_Tugas, Skor_Kuis</li>
+                <li>👥 Persentase_Kehadiran</li>
+                <li>🎯 Skor_Partisipasi</li>
+                <li>📖 Dan fitur lainnya sesuai model</li>
+            </ul>
+        </div>
+    """, unsafe_allow_html=True)
+
+# Download template with icon
+st.markdown("### 📥 Download Template")
+template_df = pd.DataFrame(columns=FEATURES)
+template_df.loc[0] = [70.0] * len(FEATURES)
+
+csv_template = template_df.to_csv(index=False).encode("utf-8")
+st.download_button(
+    "⬇️ Download Template CSV",
+    csv_template,
+    "template_prediksi.csv",
+    "text/csv",
+    help="Download template CSV dengan format yang benar",
+    use_container_width=True
+)
+
+st.markdown("---")
+
+
+# Upload, toggles and the predict button only rerun this fragment
+@st.fragment
+def batch_form():
+    # File upload
+    st.markdown("### 📤 Upload File Data")
+    file = st.file_uploader(
+        "Pilih file CSV, Parquet, atau Feather",
+        type=UPLOAD_TYPES,
+        help="Upload file yang berisi data siswa untuk diprediksi"
+    )
+    
+    if file:
+        # File besar diproses per potongan supaya pemakaian memori tetap konstan
+        streaming_mode = st.toggle(
+            "⚡ Mode Streaming (untuk file besar)",
+            value=file.size > STREAMING_THRESHOLD_MB * 1024 * 1024,
+            help="Baca, prediksi, dan tulis hasil per potongan data tanpa memuat seluruh file ke memori"
+        )
+        
+        # Hanya kolom model dan kolom tambahan yang dipilih yang dibaca dari file
+        try:
+            file_columns = read_columns(file)
+        except Exception as e:
+            st.error(f"❌ Error saat membaca file: {str(e)}")
+            st.info("💡 Pastikan file Anda memiliki format yang benar dan tidak corrupt.")
+            return
+        passthrough = st.multiselect(
+            "🪪 Kolom tambahan yang ikut disertakan (mis. ID atau nama siswa)",
+            [c for c in file_columns if c not in predictor.required_columns],
+            help="Kolom lain tidak dibaca sama sekali, sehingga file yang lebar lebih cepat diproses"
+        )
+        input_format = detect_format(file.name)[0]
+    
+    if file and streaming_mode:
+        timer = timings.run("batch_stream")
+        try:
+            with timer.stage("read_preview"):
+                preview_df = predictor.read_input(file, passthrough=passthrough, nrows=10)
+            
+            st.success(f"✅ File berhasil diupload! Ukuran: {file.size / (1024 * 1024):.1f} MB")
+            st.markdown("### 👀 Preview Data")
+            st.dataframe(preview_df, use_container_width=True)
+            
+            st.markdown("### 🔍 Validasi Kolom")
+            missing_cols = predictor.missing_features(file_columns)
+            extra_cols = [c for c in file_columns if c not in FEATURES]
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                if missing_cols:
+                    st.error(f"❌ **Kolom yang hilang:** {', '.join(missing_cols)}")
+                else:
+                    st.success("✅ Semua kolom yang diperlukan tersedia!")
+            with col2:
+                if extra_cols:
+                    st.info(f"ℹ️ **Kolom tambahan:** {', '.join(extra_cols)}")
+            
+            if not missing_cols:
+                st.markdown("---")
+                
+                # Hanya CSV tanpa kompresi yang bisa dibagi per rentang byte. Default 1:
+                # server dipakai bersama, jadi proses paralel harus dipilih sendiri
+                n_workers = 1
+                if is_splittable(file.name):
+                    n_workers = st.number_input(
+                        "🧵 Jumlah proses paralel",
+                        min_value=1,
+                        max_value=os.cpu_count() or 1,
+                        value=1,
+                        step=1,
+                        help="Lebih dari 1: file dibagi ke beberapa proses CPU lalu digabung kembali sesuai urutan baris"
+                    )
+                    if n_workers > 1:
+                        st.caption("ℹ️ Dengan proses paralel, profil kualitas data tidak dihitung.")
+                
+                output_format = select_output_format("stream_output_format")
+                columns = predictor.projection(file_columns, passthrough)
+                
+                key = upload_key(file, "stream") + (output_format, tuple(passthrough))
+                scored_now = False
+                if st.button("🚀 Prediksi Semua Data", use_container_width=True, type="primary"):
+                    if key not in store:
+                        output_path = store.new_file_path(FORMATS[output_format]["suffix"])
+                        report = None
+                        profile = None
+                        try:
+                            with st.spinner("🔄 Sedang memproses prediksi per potongan data..."):
+                                if n_workers > 1:
+                                    # Proses paralel butuh file di disk untuk dibagi per rentang byte
+                                    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as tmp_input:
+                                        shutil.copyfileobj(file, tmp_input)
+                                    try:
+                                        with timer.stage("parallel_score"):
+                                            report = predictor.parallel_score_csv(
+                                                tmp_input.name,
+                                                output_path,
+                                                workers=int(n_workers),
+                                                chunksize=STREAMING_CHUNKSIZE,
+                                                output_format=output_format,
+                                                columns=columns
+                                            )
+                                    finally:
+                                        os.remove(tmp_input.name)
+                                    summary = report.summary
+                                else:
+                                    # Kualitas data dihitung sambil membaca setiap potongan
+                                    profile = DataProfile(predictor.feature_names)
+                                    summary = predictor.stream_score_file(
+                                        file,
+                                        output_path,
+                                        chunksize=STREAMING_CHUNKSIZE,
+                                        output_format=output_format,
+                                        columns=columns,
+                                        profile=profile,
+                                        timer=timer
+                                    )
+                        except Exception:
+                            if os.path.exists(output_path):
+                                os.remove(output_path)
+                            raise
+                        store.put(
+                            key,
+                            files=[output_path],
+                            summary=summary,
+                            output_format=output_format,
+                            profile=profile.finish() if profile is not None else None,
+                            worker_table=report.worker_table() if report is not None else None
+                        )
+                        scored_now = True
+                
+                # Hasil tetap tampil (dan bisa diunduh) pada interaksi berikutnya
+                result = store.get(key)
+                if result is not None:
+                    timer.rows = result.meta["summary"].rows
+                    show_reused(scored_now)
+                    render_stream_result(result, timer)
+
+        except Exception as e:
+            timer.finish(error=type(e).__name__)
+            st.error(f"❌ Error saat membaca file: {str(e)}")
+            st.info("💡 Pastikan file CSV Anda memiliki format yang benar dan tidak corrupt.")
+        finally:
+            timer.finish()
+    
+    elif file:
+        timer = timings.run("batch_full")
+        try:
+            # A stored result already holds the scored frame and its data
+            # profile, so the upload is not read or profiled again
+            key = upload_key(file, "full") + (tuple(passthrough),)
+            result = store.get(key)
+            if result is not None:
+                df = result.frame
+                profile = result.meta["profile"]
+                input_columns = [c for c in df.columns
+                                 if c not in (predictor.score_column, predictor.grade_column)]
+            else:
+                with timer.stage(f"read_{input_format}"):
+                    df = predictor.read_input(file, passthrough=passthrough)
+                input_columns = list(df.columns)
+                # One pass for nulls, duplicates and per-feature statistics; the
+                # medians are reused to fill missing values when scoring
+                with timer.stage("data_quality", len(df)):
+                    profile = profile_frame(df, FEATURES)
+            timer.rows = len(df)
+            n_null = profile.null_count
+            n_duplicated = duplicates_label(profile)
+            
+            st.success(f"✅ File berhasil diupload! Total data: {len(df)} baris")
+            
+            # Preview data
+            st.markdown("### 👀 Preview Data")
+            st.dataframe(df.head(10)[input_columns], use_container_width=True)
+            
+            # Data statistics with colorful cards
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                render_card(stat_card("📊", len(df), "Total Baris", "purple"))
+            
+            with col2:
+                render_card(stat_card("📋", len(file_columns), "Total Kolom", "pink"))
+            
+            with col3:
+                render_card(stat_card("❓", n_null, "Missing Values", "blue"))
+            
+            with col4:
+                render_card(stat_card("🔄", n_duplicated, "Duplicate Rows", "green"))
+            
+            render_profile(profile)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # Check columns
+            st.markdown("### 🔍 Validasi Kolom")
+            missing_cols = predictor.missing_features(file_columns)
+            extra_cols = [c for c in file_columns if c not in FEATURES]
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if missing_cols:
+                    st.error(f"❌ **Kolom yang hilang:** {', '.join(missing_cols)}")
+                else:
+                    st.success("✅ Semua kolom yang diperlukan tersedia!")
+            
+            with col2:
+                if extra_cols:
+                    st.info(f"ℹ️ **Kolom tambahan:** {', '.join(extra_cols)}")
+            
+            # Prediction button
+            if not missing_cols:
+                st.markdown("---")
+                
+                scored_now = False
+                if st.button("🚀 Prediksi Semua Data", use_container_width=True, type="primary"):
+                    # df is only scored when it was read for this run; a
+                    # stored frame is shared with other sessions
+                    if result is None:
+                        with st.spinner("🔄 Sedang memproses prediksi..."):
+                            # Missing values are filled with the column medians
+                            n_missing = predictor.score_frame(df, fill_values=profile.medians(),
+                                                              timer=timer)
+                            
+                            csv_path = store.new_file_path(".csv")
+                            with timer.stage("to_csv", len(df)):
+                                df.to_csv(csv_path, index=False)
+                            with timer.stage("summary", len(df)):
+                                summary = summarize_frame(df, predictor.score_column,
+                                                          predictor.grade_column)
+                            store.put(key, frame=df, files=[csv_path], filled=n_missing,
+                                      summary=summary, profile=profile)
+                            scored_now = True
+                        st.balloons()
+                
+                # Hasil tetap tampil (dan bisa diunduh) pada interaksi berikutnya
+                if scored_now:
+                    result = store.get(key)
+                if result is not None:
+                    show_reused(scored_now)
+                    render_full_result(result, timer)
+
+        except Exception as e:
+            timer.finish(error=type(e).__name__)
+            st.error(f"❌ Error saat membaca file: {str(e)}")
+            st.info("💡 Pastikan file CSV Anda memiliki format yang benar dan tidak corrupt.")
+        finally:
+            timer.finish()
+
+
+batch_form()
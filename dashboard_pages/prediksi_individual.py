@@ -0,0 +1,208 @@
+import streamlit as st
+
+from dashboard_pages.shared import (
+    load_predictor,
+    prediction_cache,
+    prediction_dispatcher,
+    timing_registry,
+)
+
+predictor = load_predictor()
+FEATURES = predictor.feature_names
+cache = prediction_cache()
+dispatcher = prediction_dispatcher()
+timings = timing_registry()
+
+# Badge of each grade of predictor.grading (appredictor.grading.DASHBOARD_GRADES),
+# the same bands the batch page uses
+GRADE_BADGES = {
+    "A": ("grade-a", "🌟", "Excellent"),
+    "B": ("grade-b", "👍", "Very Good"),
+    "C": ("grade-c", "🙂", "Good"),
+    "D": ("grade-d", "⚠️", "Needs Improvement"),
+}
+
+# ======================================================
+# PREDIKSI INDIVIDUAL
+# ======================================================
+st.markdown("""
+    <div class='main-header'>
+        <h1>🎯 Prediksi Nilai Individual</h1>
+        <p class='header-subtitle'>
+            📝 Masukkan data siswa untuk memprediksi nilai akhir
+        </p>
+    </div>
+""", unsafe_allow_html=True)
+
+# Instructions with icon
+st.markdown("""
+    <div class='info-box'>
+        <h4>📝 Instruksi:</h4>
+        <p>Masukkan semua nilai fitur di bawah ini, kemudian klik tombol 'Prediksi Nilai Akhir' untuk mendapatkan hasil prediksi berbasis AI!</p>
+    </div>
+""", unsafe_allow_html=True)
+
+
+# Changing an input only reruns this fragment, not the whole app
+@st.fragment
+def prediction_form():
+    # Input form
+    st.markdown("### 📋 Input Data Siswa")
+    
+    inputs = {}
+    
+    # Organize inputs by category with colorful headers
+    categories = {
+        "📝 Nilai Internal": ["Nilai_Internal_1", "Nilai_Internal_2"],
+        "📚 Tugas & Kuis": ["Skor_Tugas", "Skor_Kuis"],
+        "👥 Kehadiran & Partisipasi": ["Persentase_Kehadiran", "Skor_Partisipasi"],
+        "📖 Aktivitas Belajar": ["Waktu_Belajar", "Akses_Materi"],
+        "🎯 Lainnya": []
+    }
+    
+    # Categorize remaining features
+    categorized = set()
+    for cat_features in categories.values():
+        categorized.update(cat_features)
+    
+    categories["🎯 Lainnya"] = [f for f in FEATURES if f not in categorized]
+    
+    for category, features in categories.items():
+        if features:
+            st.markdown(f"""
+                <div class='category-header'>
+                    <h4>{category}</h4>
+                </div>
+            """, unsafe_allow_html=True)
+            
+            cols = st.columns(3)
+            
+            for i, feature in enumerate(features):
+                with cols[i % 3]:
+                    # Set appropriate ranges and defaults
+                    if "Persentase" in feature:
+                        max_val, step, default = 100.0, 1.0, 80.0
+                    elif "Nilai_Internal" in feature:
+                        max_val, step, default = 30.0, 0.5, 20.0
+                    elif "Skor" in feature:
+                        max_val, step, default = 100.0, 1.0, 70.0
+                    else:
+                        max_val, step, default = 100.0, 1.0, 50.0
+                    
+                    inputs[feature] = st.number_input(
+                        f"📊 {feature.replace('_', ' ')}",
+                        min_value=0.0,
+                        max_value=max_val,
+                        value=default,
+                        step=step,
+                        help=f"Masukkan nilai untuk {feature.replace('_', ' ')}"
+                    )
+    
+    st.markdown("---")
+    
+    # Prediction button
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        predict_button = st.button("🔮 Prediksi Nilai Akhir", use_container_width=True, type="primary")
+    
+    if predict_button:
+        import pandas as pd
+        
+        with st.spinner("🔄 Memproses prediksi dengan AI..."):
+            # Scale, predict and apply the academic rules (same engine as the
+            # batch page), batched with other sessions predicting right now;
+            # same inputs -> cached result
+            with timings.run("predict_single", rows=1) as timer:
+                with timer.stage("predict", 1):
+                    prediction = cache.get_or_compute(
+                        predictor.version, predictor.cache_key(inputs),
+                        lambda: float(dispatcher.submit(predictor.predict_records, inputs))
+                    )
+            min_internal = min(
+                inputs.get("Nilai_Internal_1", 0),
+                inputs.get("Nilai_Internal_2", 0)
+            )
+            kehadiran = inputs.get("Persentase_Kehadiran", 0)
+            skor_tugas = inputs.get("Skor_Tugas", 0)
+            
+            # Display results with celebration
+            st.balloons()
+            st.markdown("---")
+            st.markdown("### 🎯 Hasil Prediksi")
+            
+            # Score display
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col2:
+                grade = predictor.grading.label(prediction)
+                grade_class, emoji, message = GRADE_BADGES[grade]
+                
+                st.markdown(f"""
+                    <div class='result-card'>
+                        <div class='card-icon'>🎓</div>
+                        <h1 class='result-score'>{prediction:.2f}</h1>
+                        <p class='result-label'>Nilai Akhir Prediksi</p>
+                        <div class='{grade_class} grade-badge'>{emoji} Grade {grade} - {message}</div>
+                    </div>
+                """, unsafe_allow_html=True)
+
+                stats = cache.stats()
+                batching = dispatcher.metrics()
+                st.caption(
+                    f"⚡ Cache prediksi: {stats['hits']} hit • {stats['misses']} miss • "
+                    f"{stats['size']}/{stats['maxsize']} entri • "
+                    f"{batching['batches']} batch model, rata-rata "
+                    f"{batching['mean_batch_size']:.1f} baris"
+                )
+
+            # Detailed breakdown
+            st.markdown("### 📊 Rincian Analisis")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("#### 📈 Data Input")
+                input_df = pd.DataFrame({
+                    "Fitur": [f"📌 {f.replace('_', ' ')}" for f in FEATURES],
+                    "Nilai": [inputs[f] for f in FEATURES]
+                })
+                st.dataframe(input_df, use_container_width=True, hide_index=True)
+            
+            with col2:
+                st.markdown("#### 🎯 Evaluasi Akademik")
+                
+                # Academic evaluation
+                rules_met = []
+                rules_not_met = []
+                
+                if min_internal >= 25:
+                    rules_met.append("✅ Nilai Internal ≥ 25")
+                else:
+                    rules_not_met.append(f"❌ Nilai Internal minimum: {min_internal:.1f} (perlu ≥ 25 untuk A)")
+                
+                if kehadiran >= 85:
+                    rules_met.append("✅ Kehadiran ≥ 85%")
+                else:
+                    rules_not_met.append(f"❌ Kehadiran: {kehadiran:.1f}% (perlu ≥ 85% untuk A)")
+                
+                if skor_tugas >= 75:
+                    rules_met.append("✅ Skor Tugas ≥ 75")
+                else:
+                    rules_not_met.append(f"❌ Skor Tugas: {skor_tugas:.1f} (perlu ≥ 75 untuk A)")
+                
+                for rule in rules_met:
+                    st.success(rule)
+                
+                for rule in rules_not_met:
+                    st.warning(rule)
+                
+                # Recommendations
+                if rules_not_met:
+                    st.markdown("""
+                        <div class='info-box'>
+                            <h4>💡 Rekomendasi</h4>
+                            <p>Tingkatkan aspek yang belum memenuhi syarat untuk mendapatkan nilai yang lebih baik!</p>
+                        </div>
+                    """, unsafe_allow_html=True)
+
+
+prediction_form()
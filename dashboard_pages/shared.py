@@ -0,0 +1,134 @@
+"""State shared by the dashboard pages.
+
+The predictor, the prediction cache, the batching dispatcher, the batch
+result store and the stage timings are created once per server process
+through ``st.cache_resource``, so every page (and every session) gets the
+same objects without reloading.
+"""
+import datetime
+import os
+
+import streamlit as st
+
+from appredictor.cache import PredictionCache
+from appredictor.core import Predictor, profile_stamp
+from appredictor.dispatch import BatchingDispatcher
+from appredictor.results import ResultStore
+from appredictor.timing import TimingRegistry
+
+PROFILE = "dashboard"
+PAGES_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Batas ukuran file (MB) sebelum mode streaming aktif otomatis
+STREAMING_THRESHOLD_MB = 20
+STREAMING_CHUNKSIZE = 50_000
+
+# Prediksi individual dari banyak sesi sekaligus digabung menjadi satu batch:
+# maksimum baris per batch dan waktu tunggu maksimum (ms) untuk mengumpulkannya
+DISPATCH_MAX_BATCH = 32
+DISPATCH_MAX_WAIT_MS = 2.0
+
+# Panel "Performance" untuk admin: selalu tampil, atau hanya dengan ?admin=1
+SHOW_PERFORMANCE_PANEL = False
+# File teks format Prometheus (textfile collector), diperbarui setiap run
+METRICS_TEXTFILE = os.environ.get("APPREDICTOR_METRICS_FILE")
+
+
+def page_path(name):
+    # Absolute, so navigation also works when the app is started through
+    # the V2/cobadashboard.py shim
+    return os.path.join(PAGES_DIR, f"{name}.py")
+
+
+@st.cache_resource(max_entries=1)
+def _load_predictor(stamp):
+    try:
+        return Predictor.from_profile(PROFILE)
+    except FileNotFoundError:
+        st.error("❌ File model tidak ditemukan! Pastikan 'academic_predictor_pt6.pkl' ada di direktori yang sama.")
+        st.stop()
+
+
+def artifact_version():
+    # File stamp of the model artifact; a new .pkl on disk gives a new stamp
+    return profile_stamp(PROFILE)
+
+
+def load_predictor():
+    # The file stamp is part of the cache key: replacing the .pkl on disk
+    # loads the new model on the next rerun
+    return _load_predictor(artifact_version())
+
+
+@st.cache_resource
+def prediction_cache():
+    return PredictionCache()
+
+
+@st.cache_resource
+def prediction_dispatcher():
+    # One worker thread scores the rows of all concurrent sessions together
+    return BatchingDispatcher(max_batch=DISPATCH_MAX_BATCH, max_wait=DISPATCH_MAX_WAIT_MS / 1000)
+
+
+@st.cache_resource
+def result_store():
+    # Scored uploads, keyed by content hash; spills to disk past the memory budget
+    return ResultStore()
+
+
+@st.cache_resource
+def timing_registry():
+    # Per-stage durations of every prediction and batch run, all sessions
+    return TimingRegistry(textfile=METRICS_TEXTFILE)
+
+
+def performance_panel_enabled():
+    return SHOW_PERFORMANCE_PANEL or st.query_params.get("admin") == "1"
+
+
+def render_performance_panel():
+    import pandas as pd
+
+    timings = timing_registry()
+    with st.expander("⏱️ Performance"):
+        st.button("🔄 Muat ulang", key="performance_refresh")
+        runs = timings.recent_runs()
+        if not runs:
+            st.info("Belum ada prediksi yang tercatat.")
+            return
+
+        st.markdown("#### 🕒 Run Terakhir")
+        st.dataframe(pd.DataFrame([
+            {
+                "Waktu": datetime.datetime.fromtimestamp(r["started"]).strftime("%H:%M:%S"),
+                "Operasi": r["operation"],
+                "Total (ms)": round(r["total_s"] * 1000, 1),
+                "Baris": r["rows"],
+                "Tahapan": " • ".join(
+                    f"{name} {stage['seconds'] * 1000:.1f} ms" for name, stage in r["stages"].items()
+                ),
+                "Error": r["error"] or "",
+            }
+            for r in runs[:20]
+        ]), use_container_width=True, hide_index=True)
+
+        latest = runs[0]
+        st.markdown(f"#### 🔬 Rincian Run Terakhir ({latest['operation']})")
+        st.dataframe(pd.DataFrame([
+            {
+                "Tahap": name,
+                "Waktu (ms)": round(stage["seconds"] * 1000, 2),
+                "% dari total": round(100 * stage["seconds"] / latest["total_s"], 1)
+                if latest["total_s"] else 0.0,
+                "Baris": stage["rows"] or None,
+                "Baris/detik": round(stage["rows"] / stage["seconds"])
+                if stage["rows"] and stage["seconds"] else None,
+            }
+            for name, stage in latest["stages"].items()
+        ]), use_container_width=True, hide_index=True)
+
+        st.markdown("#### 📡 Format Prometheus")
+        text = timings.prometheus_text()
+        st.code(text, language="text")
+        st.download_button("📥 Download metrics.prom", text, "metrics.prom", "text/plain")
@@ -0,0 +1,166 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+from dashboard_pages.shared import artifact_version, load_predictor
+
+predictor = load_predictor()
+metrics = predictor.metrics
+
+
+@st.cache_resource(max_entries=1)
+def model_report(stamp, _predictor):
+    # Everything on this page depends only on the model artifact: build the
+    # figures, the table and the formula once per artifact version (stamp),
+    # so switching to this page does not rebuild them
+    model = _predictor.model
+    features = _predictor.feature_names
+    coef_df = pd.DataFrame({
+        "Feature": [f.replace("_", " ") for f in features],
+        "Coefficient": model.coef_,
+        "Abs_Coefficient": np.abs(model.coef_)
+    }).sort_values("Abs_Coefficient", ascending=False)
+    
+    fig = px.bar(
+        coef_df,
+        x="Feature",
+        y="Coefficient",
+        color="Coefficient",
+        color_continuous_scale=["#ff6b6b", "#ffe66d", "#4ecdc4", "#45b7d1"],
+        title="🎯 Pengaruh Setiap Fitur terhadap Nilai Akhir",
+        labels={"Coefficient": "Koefisien", "Feature": "Fitur"}
+    )
+    fig.update_layout(
+        height=500,
+        xaxis_tickangle=-45,
+        showlegend=False,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    fig2 = px.bar(
+        coef_df,
+        y="Feature",
+        x="Coefficient",
+        orientation="h",
+        color="Coefficient",
+        color_continuous_scale="viridis",
+        title="📊 Feature Importance (Sorted)",
+        labels={"Coefficient": "Koefisien", "Feature": "Fitur"}
+    )
+    fig2.update_layout(
+        height=600,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    display_df = coef_df.copy()
+    display_df["Impact"] = np.where(display_df["Coefficient"] > 0, "Positif ⬆️", "Negatif ⬇️")
+    display_df["Magnitude"] = np.select(
+        [display_df["Abs_Coefficient"] > 2, display_df["Abs_Coefficient"] > 1],
+        ["Tinggi 🔥", "Sedang 📊"],
+        "Rendah 📉"
+    )
+    
+    formula = f"**Final Score** = {model.intercept_:.2f}"
+    for f, c in zip(features, model.coef_):
+        sign = "+" if c >= 0 else "-"
+        formula += f" {sign} ({abs(c):.2f} × {f.replace('_', ' ')})"
+    
+    fig_dist = go.Figure()
+    fig_dist.add_trace(go.Histogram(
+        x=model.coef_,
+        nbinsx=20,
+        name="Distribusi",
+        marker_color='#667eea',
+        marker_line_color='#764ba2',
+        marker_line_width=1.5
+    ))
+    fig_dist.update_layout(
+        title="📈 Distribusi Nilai Koefisien",
+        xaxis_title="Nilai Koefisien",
+        yaxis_title="Frekuensi",
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    return {
+        "bar": fig,
+        "bar_horizontal": fig2,
+        "table": display_df[["Feature", "Coefficient", "Impact", "Magnitude"]],
+        "formula": formula,
+        "distribution": fig_dist,
+    }
+
+
+report = model_report(artifact_version(), predictor)
+
+# ======================================================
+# VISUALISASI DATA & MODEL
+# ======================================================
+st.markdown("""
+    <div class='main-header'>
+        <h1>📊 Visualisasi Data & Analisis Model</h1>
+        <p class='header-subtitle'>
+            🔍 Analisis mendalam tentang performa dan karakteristik model
+        </p>
+    </div>
+""", unsafe_allow_html=True)
+
+# Metrics overview with icons
+st.markdown("### 📈 Metrik Performa Model")
+col1, col2, col3 = st.columns(3)
+
+col1.metric("🎯 R² Score", f"{metrics['r2']:.3f}", 
+            help="Mengukur seberapa baik model menjelaskan variasi data (0-1, semakin tinggi semakin baik)")
+col2.metric("📊 MAE", f"{metrics['mae']:.2f}", 
+            help="Rata-rata kesalahan absolut prediksi")
+col3.metric("📈 RMSE", f"{metrics['rmse']:.2f}", 
+            help="Akar kuadrat rata-rata kesalahan kuadrat")
+
+st.markdown("---")
+
+# Feature Importance with enhanced visuals
+st.markdown("### 🔍 Feature Importance Analysis")
+
+tab1, tab2, tab3 = st.tabs(["📊 Bar Chart", "🎯 Horizontal Chart", "📋 Table"])
+
+with tab1:
+    st.plotly_chart(report["bar"], use_container_width=True)
+
+with tab2:
+    st.plotly_chart(report["bar_horizontal"], use_container_width=True)
+
+with tab3:
+    st.dataframe(report["table"], use_container_width=True, hide_index=True)
+
+st.markdown("---")
+
+# Model equation
+st.markdown("### 📐 Persamaan Model Linear Regression")
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    st.code(report["formula"], language="python")
+
+with col2:
+    st.markdown("""
+        <div class='info-box'>
+            <h4>💡 Interpretasi:</h4>
+            <ul>
+                <li>📊 Intercept: Nilai dasar</li>
+                <li>⬆️ Koefisien (+): Meningkatkan nilai</li>
+                <li>⬇️ Koefisien (-): Menurunkan nilai</li>
+            </ul>
+        </div>
+    """, unsafe_allow_html=True)
+
+# Distribution visualization
+st.markdown("---")
+st.markdown("### 📊 Distribusi Koefisien")
+
+st.plotly_chart(report["distribution"], use_container_width=True)
@@ -0,0 +1,123 @@
+"""Export the joblib model artifacts to the binary .apx format.
+
+Each artifact is written next to its pickle (``x.pkl`` -> ``x.apx``) and
+then read back with the NumPy-only loader and checked bit for bit against
+the original sklearn pipeline. The apps pick up an .apx file automatically
+as long as it was exported from the current pickle.
+
+Examples:
+    python export_artifacts.py                       # all shipped artifacts
+    python export_artifacts.py academic_predictor_pt6.pkl
+    python export_artifacts.py model.pkl --scaler scaler.pkl
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+from appredictor.artifact_format import binary_path_for, file_sha256, write_artifact
+from appredictor.artifacts import load_binary_artifact
+from appredictor.inference import verify_kernel
+
+# Pickled artifact dicts shipped with the apps
+SHIPPED_ARTIFACTS = [
+    "academic_predictor_pt6.pkl",
+    "academic_predictor_model_pt5.pkl",
+    "academic_predictor_model_pt3.pkl",
+    "academic_predictor_model_pt2.pkl",
+    "academic_predictor_model.pkl",
+]
+# Model + scaler saved as separate pickles (appcoba.py)
+SHIPPED_PAIRS = [
+    ("model_kelulusan.pkl", "scaler_kelulusan.pkl"),
+]
+
+
+def export(model_path, scaler_path=None):
+    """Export one artifact, verify the round trip, and return the .apx path."""
+    loaded = joblib.load(model_path)
+    sources = {os.path.basename(model_path): file_sha256(model_path)}
+    if isinstance(loaded, dict):
+        model = loaded["model"]
+        scaler = loaded.get("scaler")
+        feature_names = loaded.get("feature_names")
+        extra = {
+            "metrics": loaded.get("metrics"),
+            "target_name": loaded.get("target_name"),
+            "feature_labels": loaded.get("feature_labels"),
+        }
+    else:
+        model = loaded
+        scaler = joblib.load(scaler_path) if scaler_path else None
+        feature_names = list(getattr(scaler, "feature_names_in_", [])) or None
+        extra = {}
+        if scaler_path:
+            sources[os.path.basename(scaler_path)] = file_sha256(scaler_path)
+
+    binary_path = binary_path_for(model_path)
+    version = write_artifact(binary_path, model, scaler, feature_names,
+                             sources=sources, **extra)
+
+    # Round trip: the NumPy-only loader must reproduce sklearn exactly
+    data = load_binary_artifact(binary_path)
+    kernel = data["fast_model"]
+    if feature_names is None:
+        kernel.feature_names = None
+    X_check = np.random.default_rng(0).uniform(0, 100, (10000, kernel.n_features))
+    if not verify_kernel(kernel, model, scaler, X_check):
+        os.remove(binary_path)
+        raise ValueError("round-trip check against the pickle failed")
+    if not np.array_equal(data["model"].coef_, model.coef_):
+        os.remove(binary_path)
+        raise ValueError("coefficients differ after the round trip")
+    return binary_path, version
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("artifacts", nargs="*",
+                        help="File .pkl yang akan diekspor (default: semua artifact bawaan)")
+    parser.add_argument("--scaler", help="File scaler .pkl untuk model yang disimpan terpisah")
+    args = parser.parse_args(argv)
+
+    if args.artifacts:
+        jobs = [(path, args.scaler) for path in args.artifacts]
+    else:
+        jobs = [(path, None) for path in SHIPPED_ARTIFACTS] + SHIPPED_PAIRS
+
+    print("=" * 60)
+    print("EXPORT ARTIFACTS - .pkl -> .apx")
+    print("=" * 60)
+    failed = 0
+    for model_path, scaler_path in jobs:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                binary_path, version = export(model_path, scaler_path)
+        except Exception as e:
+            failed += 1
+            print(f"❌ {model_path}: {e}")
+            continue
+
+        # Load time comparison (the pickle timing here excludes the sklearn
+        # import, which is already paid in this process)
+        start = time.perf_counter()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            joblib.load(model_path)
+        pickle_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        load_binary_artifact(binary_path)
+        binary_ms = (time.perf_counter() - start) * 1000
+        print(f"✅ {model_path} -> {binary_path} (versi {version}, "
+              f"{os.path.getsize(binary_path)} bytes, load {pickle_ms:.2f} ms -> {binary_ms:.2f} ms)")
+    print("=" * 60)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
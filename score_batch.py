@@ -0,0 +1,230 @@
+"""Score CSV, Parquet and Arrow files from the command line, without the Streamlit UI.
+
+Uses the same scale -> predict -> academic rules -> grade pipeline as the
+batch pages, streaming each file chunk by chunk.
+
+Examples:
+    python score_batch.py data/kelas_a.csv data/kelas_b.csv -o hasil/
+    python score_batch.py cohort.csv --profile app --chunk-size 100000
+    python score_batch.py cohort.csv --workers 32 --format csv.gz
+    python score_batch.py cohort.csv --format parquet
+    python score_batch.py cohort.parquet export.csv.gz --keep-columns NIS Nama
+    python score_batch.py sekolah.csv --profile kelulusan --threshold 60
+
+With --profile kelulusan (appcoba.py) the result has the pass probability
+(%), a risk band and PASS/FAIL from --threshold instead of a final score.
+
+With --workers > 1 each uncompressed CSV is split into partitions that are
+scored across a process pool (see appredictor/parallel.py) and reassembled
+in the original row order.
+
+Parquet and Arrow IPC (Feather) results keep the dtypes: float32 scores and
+dictionary-encoded grades (see appredictor/export.py).
+
+Inputs may be CSV (also .gz/.bz2/.zip/.xz/.zst, with or without .csv before it), Parquet or Arrow IPC
+(Feather). Feature columns are parsed as float64. By default every input
+column is copied to the result; with --keep-columns only the model's
+columns and the listed ones are read (see appredictor/ingest.py).
+
+The columns of every input are checked before any file is scored; files
+without all model features are reported and skipped. Inputs that would
+write the same result file (a/kelas.csv and b/kelas.csv) are refused.
+"""
+import argparse
+import os
+import sys
+import time
+
+from appredictor.batch import DEFAULT_CHUNKSIZE
+from appredictor.core import (PROFILES, FeatureValidationError, Predictor,
+                              profile_artifact_path)
+from appredictor.grading import DEFAULT_PASS_THRESHOLD, pass_fail_status
+from appredictor.ingest import (ARROW_SUFFIXES, COMPRESSION_SUFFIXES, CSV_COMPRESSIONS,
+                                PARQUET_SUFFIXES, is_splittable, read_columns)
+
+OUTPUT_FORMATS = {
+    "csv": ".csv",
+    "csv.gz": ".csv.gz",
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+
+_predictor = None
+
+
+def _load_predictor(profile, artifact_path, threshold=None):
+    # Same artifact and post-processing as the corresponding Streamlit page
+    global _predictor
+    if _predictor is None:
+        _predictor = Predictor.from_profile(profile, artifact=artifact_path)
+        if threshold is not None and _predictor.status is not None:
+            _predictor = _predictor.with_options(status=pass_fail_status(threshold))
+    return _predictor
+
+
+def output_path_for(input_path, output_dir, output_format):
+    stem = os.path.basename(input_path)
+    for ext in (*CSV_COMPRESSIONS, ".csv", *COMPRESSION_SUFFIXES, *PARQUET_SUFFIXES,
+                *ARROW_SUFFIXES):
+        if stem.lower().endswith(ext):
+            stem = stem[: -len(ext)]
+            break
+    return os.path.join(output_dir, f"{stem}_scored{OUTPUT_FORMATS[output_format]}")
+
+
+def duplicate_outputs(jobs):
+    """``{output: [inputs]}`` for the outputs that more than one input would write."""
+    inputs_by_output = {}
+    for path, out in jobs.items():
+        inputs_by_output.setdefault(os.path.abspath(out), []).append(path)
+    return {out: paths for out, paths in inputs_by_output.items() if len(paths) > 1}
+
+
+def writer_format(output_format):
+    """Format name for appredictor.export; gzip is picked from the file name."""
+    return "csv" if output_format == "csv.gz" else output_format
+
+
+def input_columns(predictor, input_path, keep_columns):
+    """Columns to read: all of them, or the model's plus ``keep_columns``."""
+    if keep_columns is None:
+        return None
+    return predictor.projection(read_columns(input_path), keep_columns)
+
+
+def score_file(input_path, output_path, profile, artifact_path, chunksize, output_format="csv",
+               keep_columns=None, threshold=None):
+    """Score one file in this process."""
+    predictor = _load_predictor(profile, artifact_path, threshold)
+    summary = predictor.stream_score_file(input_path, output_path, chunksize=chunksize,
+                                          output_format=writer_format(output_format),
+                                          columns=input_columns(predictor, input_path,
+                                                                keep_columns))
+    # The preview DataFrame is not needed by the caller
+    summary.preview = None
+    return summary
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Prediksi nilai akhir untuk file CSV tanpa membuka dashboard."
+    )
+    parser.add_argument("inputs", nargs="+",
+                        help="File CSV, Parquet atau Arrow/Feather yang akan diprediksi")
+    parser.add_argument("-o", "--output-dir", default=".",
+                        help="Folder untuk file hasil (default: folder saat ini)")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="dashboard",
+                        help="Pipeline yang dipakai: 'dashboard' (cobadashboard.py), "
+                             "'app' (app.py) atau 'kelulusan' (appcoba.py)")
+    parser.add_argument("--artifact",
+                        help="File model .pkl (default: sesuai --profile)")
+    parser.add_argument("--threshold", type=float,
+                        help="Ambang probabilitas lulus dalam %% untuk --profile kelulusan "
+                             f"(default: {DEFAULT_PASS_THRESHOLD:g})")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNKSIZE,
+                        help=f"Jumlah baris per potongan (default: {DEFAULT_CHUNKSIZE})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Jumlah proses paralel per file (default: 1)")
+    parser.add_argument("--format", dest="output_format", choices=sorted(OUTPUT_FORMATS),
+                        default="csv", help="Format file hasil (default: csv)")
+    parser.add_argument("--keep-columns", nargs="*", metavar="KOLOM",
+                        help="Hanya baca kolom model plus kolom ini (mis. ID siswa); "
+                             "default: semua kolom ikut ke hasil")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.chunk_size < 1:
+        print("❌ --chunk-size harus lebih dari 0", file=sys.stderr)
+        return 2
+    if args.workers < 1:
+        print("❌ --workers harus lebih dari 0", file=sys.stderr)
+        return 2
+    if args.threshold is not None:
+        if "status" not in PROFILES[args.profile]:
+            print("❌ --threshold hanya untuk --profile kelulusan", file=sys.stderr)
+            return 2
+        if not 0 <= args.threshold <= 100:
+            print("❌ --threshold harus antara 0 dan 100", file=sys.stderr)
+            return 2
+
+    artifact_path = args.artifact or profile_artifact_path(args.profile)
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = {
+        path: output_path_for(path, args.output_dir, args.output_format)
+        for path in args.inputs
+    }
+    # e.g. a/kelas.csv and b/kelas.csv: the second would overwrite the first
+    clashes = duplicate_outputs(jobs)
+    if clashes:
+        for out, paths in clashes.items():
+            print(f"❌ {', '.join(paths)} akan ditulis ke file hasil yang sama: {out}",
+                  file=sys.stderr)
+        print("   Ganti nama file input atau jalankan per folder dengan -o yang berbeda.",
+              file=sys.stderr)
+        return 2
+
+    print("=" * 60)
+    print(f"BATCH SCORING - {artifact_path} ({args.profile})")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    failed = 0
+    total_rows = 0
+
+    # Check every file's columns before scoring any of them
+    predictor = _load_predictor(args.profile, artifact_path, args.threshold)
+    valid = {}
+    for path, out in jobs.items():
+        try:
+            predictor.validate(read_columns(path))
+        except FeatureValidationError as e:
+            failed += 1
+            print(f"❌ {path}: kolom fitur tidak ditemukan: {', '.join(e.missing)}",
+                  file=sys.stderr)
+            continue
+        except Exception as e:
+            failed += 1
+            print(f"❌ {path}: {e}", file=sys.stderr)
+            continue
+        valid[path] = out
+
+    for path, out in valid.items():
+        try:
+            if args.workers > 1 and is_splittable(path):
+                report = predictor.parallel_score_csv(
+                    path, out, workers=args.workers, chunksize=args.chunk_size,
+                    output_format=writer_format(args.output_format),
+                    columns=input_columns(predictor, path, args.keep_columns),
+                )
+                summary = report.summary
+            else:
+                report = None
+                summary = score_file(path, out, args.profile, artifact_path, args.chunk_size,
+                                     args.output_format, args.keep_columns, args.threshold)
+        except Exception as e:
+            failed += 1
+            print(f"❌ {path}: {e}", file=sys.stderr)
+            continue
+        total_rows += summary.rows
+        print(f"✅ {path} -> {out}: {summary.rows:,} baris, "
+              f"rata-rata {summary.mean:.2f}, {summary.rows_per_second:,.0f} baris/detik")
+        if summary.status_counts:
+            print("   " + ", ".join(f"{status}: {count:,}"
+                                    for status, count in sorted(summary.status_counts.items())))
+        if report is not None:
+            print(f"   {report.partitions} partisi di {len(report.workers)} worker:")
+            for worker in sorted(report.workers, key=lambda w: w.pid):
+                print(f"   - PID {worker.pid}: {worker.partitions} partisi, "
+                      f"{worker.rows:,} baris, {worker.rows_per_second:,.0f} baris/detik")
+
+    elapsed = time.perf_counter() - start
+    print("=" * 60)
+    print(f"Selesai: {len(jobs) - failed}/{len(jobs)} file, {total_rows:,} baris, "
+          f"{elapsed:.1f} detik")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""HTTP prediction service for other systems (e.g. the LMS).
+
+Serves the same pipeline as the Streamlit pages as JSON over HTTP; see
+appredictor/service.py for the routes. Needs an ASGI server (uvicorn).
+
+Examples:
+    python serve.py
+    python serve.py --profile app --port 8080 --max-batch 128 --max-wait-ms 5
+    python serve.py --profile kelulusan --threshold 60
+
+    curl -X POST localhost:8000/predict -H 'Content-Type: application/json' \\
+         -d '{"Persentase_Kehadiran": 90, "Nilai_Internal_1": 26, ...}'
+"""
+import argparse
+import sys
+
+from appredictor.core import PROFILES, Predictor
+from appredictor.grading import DEFAULT_PASS_THRESHOLD, pass_fail_status
+from appredictor.service import DEFAULT_MAX_BATCH, DEFAULT_MAX_WAIT, create_app
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Layanan HTTP untuk prediksi nilai akhir.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="dashboard",
+                        help="Pipeline yang dipakai: 'dashboard' (cobadashboard.py), "
+                             "'app' (app.py) atau 'kelulusan' (appcoba.py, dengan "
+                             "status PASS/FAIL)")
+    parser.add_argument("--artifact", help="File model .pkl (default: sesuai --profile)")
+    parser.add_argument("--threshold", type=float,
+                        help="Ambang probabilitas lulus dalam %% untuk --profile kelulusan "
+                             f"(default: {DEFAULT_PASS_THRESHOLD:g})")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                        help=f"Maksimum permintaan per batch (default: {DEFAULT_MAX_BATCH})")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help="Waktu tunggu maksimum untuk mengumpulkan batch "
+                             f"(default: {DEFAULT_MAX_WAIT * 1000:g} ms)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.max_batch < 1 or args.max_wait_ms < 0:
+        print("❌ --max-batch harus lebih dari 0 dan --max-wait-ms tidak boleh negatif",
+              file=sys.stderr)
+        return 2
+    if args.threshold is not None:
+        if "status" not in PROFILES[args.profile]:
+            print("❌ --threshold hanya untuk --profile kelulusan", file=sys.stderr)
+            return 2
+        if not 0 <= args.threshold <= 100:
+            print("❌ --threshold harus antara 0 dan 100", file=sys.stderr)
+            return 2
+    try:
+        import uvicorn
+    except ImportError:
+        print("❌ uvicorn belum terpasang: pip install uvicorn", file=sys.stderr)
+        return 2
+
+    predictor = Predictor.from_profile(args.profile, artifact=args.artifact)
+    if args.threshold is not None:
+        predictor = predictor.with_options(status=pass_fail_status(args.threshold))
+    app = create_app(predictor, max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000)
+
+    print("=" * 60)
+    print(f"PREDICTION SERVICE - {predictor.source} ({args.profile})")
+    print("=" * 60)
+    print(f"✅ http://{args.host}:{args.port}  "
+          f"(batch ≤ {args.max_batch}, tunggu ≤ {args.max_wait_ms:g} ms)")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())